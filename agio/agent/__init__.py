@@ -8,6 +8,7 @@ This module contains:
 """
 
 from .agent import Agent
+from .compact import ContextWindowManager, estimate_tokens
 from .context import (
     build_context_from_sequence_range,
     build_context_from_steps,
@@ -23,6 +24,8 @@ from .summarizer import (
 __all__ = [
     "Agent",
     "AgentExecutor",
+    "ContextWindowManager",
+    "estimate_tokens",
     "ToolCallAccumulator",
     "MetricsTracker",
     "build_context_from_steps",
@@ -13,6 +13,7 @@ Wire-based Architecture:
 import datetime
 import os
 
+from agio.agent.compact import ContextWindowManager
 from agio.agent.context import build_context_from_steps
 from agio.agent.executor import AgentExecutor
 from agio.config import ExecutionConfig
@@ -23,6 +24,7 @@ from agio.runtime.control import AbortSignal
 from agio.runtime.protocol import ExecutionContext, RunnableType, RunOutput
 from agio.runtime.step_factory import StepFactory
 from agio.storage.session.base import SessionStore
+from agio.storage.session.context_cache import SessionContextCache
 from agio.tools import BaseTool
 from agio.runtime.permission.manager import PermissionManager
 from agio.skills.manager import SkillManager
@@ -51,8 +53,13 @@ class Agent:
         user_id: str | None = None,
         system_prompt: str | None = None,
         max_steps: int = 10,
+        max_history_messages: int | None = None,
+        max_context_tokens: int | None = None,
         enable_termination_summary: bool = False,
         termination_summary_prompt: str | None = None,
+        speculative_tool_execution: bool = False,
+        delta_coalesce_ms: float = 0.0,
+        delta_coalesce_bytes: int = 4096,
     ):
         self._id = name
         self.model = model
@@ -63,9 +70,20 @@ class Agent:
         self.user_id: str | None = user_id
         self.system_prompt: str | None = system_prompt
         self.max_steps: int = max_steps
+        self.max_history_messages: int | None = max_history_messages
+        self.max_context_tokens: int | None = max_context_tokens
         self.enable_termination_summary: bool = enable_termination_summary
         self.termination_summary_prompt: str | None = termination_summary_prompt
+        self.speculative_tool_execution: bool = speculative_tool_execution
+        self.delta_coalesce_ms: float = delta_coalesce_ms
+        self.delta_coalesce_bytes: int = delta_coalesce_bytes
         self._sequence_manager: SequenceManager | None = None
+        # Lives across runs so each turn of a session compacts incrementally
+        self._context_window = ContextWindowManager.for_tools(
+            self.tools,
+            max_history_messages=max_history_messages,
+            max_tokens=max_context_tokens,
+        )
 
     @property
     def id(self) -> str:
@@ -83,7 +101,8 @@ class Agent:
             return None
 
         if self._sequence_manager is None:
-            self._sequence_manager = SequenceManager(self.session_store)
+            # Shared per store so nested agents in one session lease from one pool
+            self._sequence_manager = SequenceManager.for_store(self.session_store)
 
         return self._sequence_manager
 
@@ -118,8 +137,13 @@ class Agent:
         session = AgentSession(session_id=session_id, user_id=current_user_id)
         config = ExecutionConfig(
             max_steps=self.max_steps,
+            max_history_messages=self.max_history_messages,
+            max_context_tokens=self.max_context_tokens,
             enable_termination_summary=self.enable_termination_summary,
             termination_summary_prompt=self.termination_summary_prompt,
+            speculative_tool_execution=self.speculative_tool_execution,
+            delta_coalesce_ms=self.delta_coalesce_ms,
+            delta_coalesce_bytes=self.delta_coalesce_bytes,
         )
 
         # Get sequence manager (internal resource)
@@ -166,6 +190,7 @@ class Agent:
                 system_prompt=rendered_prompt,
                 # Remove run_id=context.run_id to get full session history
                 runnable_id=self.id,  # Keep runnable_id to isolate different agents
+                cache=SessionContextCache.for_store(self.session_store),
             )
         else:
             messages = []
@@ -180,13 +205,19 @@ class Agent:
             sequence_manager=seq_mgr,
             config=config,
             permission_manager=self.permission_manager,
+            context_window=self._context_window,
         )
 
-        return await executor.execute(
-            messages=messages,
-            context=context,
-            abort_signal=abort_signal,
-        )
+        try:
+            return await executor.execute(
+                messages=messages,
+                context=context,
+                abort_signal=abort_signal,
+            )
+        finally:
+            # Nested runs share the session's lease; the top-level run ends last
+            if seq_mgr and context.depth == 0:
+                seq_mgr.release(session.session_id)
 
 
 __all__ = ["Agent"]
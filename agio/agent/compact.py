@@ -1,3 +1,292 @@
 """
 Compact logic for agent execution when context is too large.
-"""
\ No newline at end of file
+
+ContextWindowManager trims the messages sent to the LLM:
+
+- Leading system messages and the current user turn (the last user message and
+  everything after it) are pinned.
+- Earlier turns are history: only the newest max_history_messages of them are
+  kept, dropped a whole turn at a time so tool_call/tool_result pairs and the
+  user-first turn structure stay consistent.
+- Above the token budget, old tool outputs are first elided into a short
+  preview plus a reference that get_tool_result can resolve; if that is not
+  enough, the oldest history turns are dropped.
+
+Compaction is append-only: once a turn is dropped or an output elided it stays
+that way, so the compacted prefix is stable across turns and cached per session.
+Each call only processes the messages appended since the previous call.
+Deleting steps, forking and resuming drop the cached state of the session in
+every manager (SessionStore listeners call invalidate_all).
+"""
+
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from agio.storage.session.base import SessionStore, SessionStoreListener
+from agio.utils.logging import get_logger
+from agio.utils.tokens import estimate_tokens
+
+if TYPE_CHECKING:
+    from agio.tools import BaseTool
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_CACHED_SESSIONS = 256
+
+
+@dataclass
+class _Turn:
+    """A user message and everything up to the next user message."""
+
+    messages: list[dict[str, Any]] = field(default_factory=list)
+    tokens: list[int] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return sum(self.tokens)
+
+
+@dataclass
+class _CompactState:
+    """Compacted context of one session."""
+
+    # Messages consumed so far (references to the caller's dicts)
+    source: list[dict[str, Any]] = field(default_factory=list)
+    head: list[dict[str, Any]] = field(default_factory=list)
+    head_tokens: int = 0
+    turns: list[_Turn] = field(default_factory=list)
+    tokens: int = 0
+    # Turns before this index have been dropped
+    dropped: int = 0
+    # Next (turn, message) position considered for elision
+    elide_turn: int = 0
+    elide_message: int = 0
+
+
+class ContextWindowManager:
+    """
+    Keep LLM context within a message and token budget.
+
+    One instance should live as long as the agent so consecutive turns of a
+    session reuse the compacted prefix.
+    """
+
+    _instances: "weakref.WeakSet[ContextWindowManager]" = weakref.WeakSet()
+
+    def __init__(
+        self,
+        max_history_messages: int | None = None,
+        max_tokens: int | None = None,
+        keep_recent_tool_outputs: int = 4,
+        elide_min_chars: int = 1000,
+        preview_chars: int = 200,
+        reference_tool: str | None = "get_tool_result",
+        token_estimator: Callable[[dict[str, Any]], int] = estimate_tokens,
+        max_cached_sessions: int = DEFAULT_MAX_CACHED_SESSIONS,
+    ) -> None:
+        """
+        Args:
+            max_history_messages: Messages kept from turns before the current one
+                (None = unlimited)
+            max_tokens: Token budget of the whole context (None = unlimited)
+            keep_recent_tool_outputs: Newest tool outputs that are never elided
+            elide_min_chars: Tool outputs shorter than this are never elided
+            preview_chars: Characters of an elided output kept as a preview
+            reference_tool: Tool named in elision notes (None = plain truncation)
+            token_estimator: Token count of a single message
+            max_cached_sessions: Sessions whose compacted context is cached
+        """
+        self.max_history_messages = max_history_messages
+        self.max_tokens = max_tokens
+        self.keep_recent_tool_outputs = keep_recent_tool_outputs
+        self.elide_min_chars = elide_min_chars
+        self.preview_chars = preview_chars
+        self.reference_tool = reference_tool
+        self._estimate = token_estimator
+        self._max_cached_sessions = max_cached_sessions
+        self._states: OrderedDict[str, _CompactState] = OrderedDict()
+        ContextWindowManager._instances.add(self)
+
+    @classmethod
+    def for_tools(
+        cls, tools: list["BaseTool"], **kwargs: Any
+    ) -> "ContextWindowManager":
+        """Create a manager that only references get_tool_result if it is available."""
+        names = {tool.name for tool in tools}
+        kwargs.setdefault(
+            "reference_tool", "get_tool_result" if "get_tool_result" in names else None
+        )
+        return cls(**kwargs)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_history_messages is not None or self.max_tokens is not None
+
+    def compact(self, session_id: str, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Get the messages to send to the LLM.
+
+        Args:
+            session_id: Session the messages belong to (cache key)
+            messages: Full context in OpenAI format; never modified
+
+        Returns:
+            Compacted messages (a new list)
+        """
+        if not self.enabled:
+            return list(messages)
+
+        state = self._states.get(session_id)
+        if state is None or not self._extends(state, messages):
+            state = _CompactState()
+            self._append(state, messages)
+        else:
+            self._append(state, messages[len(state.source) :])
+        self._states[session_id] = state
+        self._states.move_to_end(session_id)
+        while len(self._states) > self._max_cached_sessions:
+            self._states.popitem(last=False)
+
+        state.source.extend(messages[len(state.source) :])
+
+        self._enforce(session_id, state)
+
+        compacted = list(state.head)
+        for turn in state.turns[state.dropped :]:
+            compacted.extend(turn.messages)
+        return compacted
+
+    def invalidate(self, session_id: str) -> None:
+        """Forget the cached context of a session (e.g. after its steps changed)."""
+        self._states.pop(session_id, None)
+
+    @classmethod
+    def invalidate_all(cls, session_id: str) -> None:
+        """Forget the cached context of a session in every live manager."""
+        for manager in list(cls._instances):
+            manager.invalidate(session_id)
+
+    # ─────────────────────────────────────────────────────────────────
+
+    def _extends(self, state: _CompactState, messages: list[dict[str, Any]]) -> bool:
+        """Whether messages start with the messages consumed so far."""
+        if not state.source or len(messages) < len(state.source):
+            return False
+        # Identity is the fast path: unchanged messages are the same dicts
+        return all(a is b or a == b for a, b in zip(state.source, messages))
+
+    def _append(self, state: _CompactState, messages: list[dict[str, Any]]) -> None:
+        for message in messages:
+            tokens = self._estimate(message)
+            role = message.get("role")
+            if not state.turns and role == "system":
+                state.head.append(message)
+                state.head_tokens += tokens
+                continue
+            if role == "user" or not state.turns:
+                state.turns.append(_Turn())
+            state.turns[-1].messages.append(message)
+            state.turns[-1].tokens.append(tokens)
+            state.tokens += tokens
+
+    def _enforce(self, session_id: str, state: _CompactState) -> None:
+        # The last turn is the current one; it is never dropped
+        current = len(state.turns) - 1
+
+        if self.max_history_messages is not None:
+            history = sum(len(t.messages) for t in state.turns[state.dropped : current])
+            while state.dropped < current and history > self.max_history_messages:
+                history -= len(state.turns[state.dropped].messages)
+                self._drop_turn(state)
+
+        if self.max_tokens is None:
+            return
+
+        while state.head_tokens + state.tokens > self.max_tokens:
+            if self._elide_next(state):
+                continue
+            if state.dropped < current:
+                self._drop_turn(state)
+                continue
+            logger.warning(
+                "context_over_budget",
+                session_id=session_id,
+                tokens=state.head_tokens + state.tokens,
+                max_tokens=self.max_tokens,
+            )
+            return
+
+    def _drop_turn(self, state: _CompactState) -> None:
+        state.tokens -= state.turns[state.dropped].total
+        state.dropped += 1
+        if state.elide_turn < state.dropped:
+            state.elide_turn, state.elide_message = state.dropped, 0
+
+    def _elide_next(self, state: _CompactState) -> bool:
+        """Elide the oldest eligible tool output; False if there is none."""
+        protected = self._protected_tool_messages(state)
+        while state.elide_turn < len(state.turns):
+            turn = state.turns[state.elide_turn]
+            while state.elide_message < len(turn.messages):
+                position = (state.elide_turn, state.elide_message)
+                if position in protected:
+                    return False
+                message = turn.messages[state.elide_message]
+                state.elide_message += 1
+                content = message.get("content")
+                if (
+                    message.get("role") == "tool"
+                    and isinstance(content, str)
+                    and len(content) >= self.elide_min_chars
+                ):
+                    elided = {**message, "content": self._elision(message, content)}
+                    tokens = self._estimate(elided)
+                    state.tokens += tokens - turn.tokens[position[1]]
+                    turn.messages[position[1]] = elided
+                    turn.tokens[position[1]] = tokens
+                    return True
+            state.elide_turn += 1
+            state.elide_message = 0
+        return False
+
+    def _protected_tool_messages(self, state: _CompactState) -> set[tuple[int, int]]:
+        """Positions of the newest keep_recent_tool_outputs tool messages."""
+        protected: set[tuple[int, int]] = set()
+        if self.keep_recent_tool_outputs <= 0:
+            return protected
+        for t in range(len(state.turns) - 1, state.elide_turn - 1, -1):
+            messages = state.turns[t].messages
+            for m in range(len(messages) - 1, -1, -1):
+                if messages[m].get("role") == "tool":
+                    protected.add((t, m))
+                    if len(protected) >= self.keep_recent_tool_outputs:
+                        return protected
+        return protected
+
+    def _elision(self, message: dict[str, Any], content: str) -> str:
+        preview = content[: self.preview_chars]
+        note = f"[{len(content) - len(preview)} more characters elided"
+        tool_call_id = message.get("tool_call_id")
+        if self.reference_tool and tool_call_id:
+            note += (
+                f'; call {self.reference_tool}(tool_call_id="{tool_call_id}") '
+                "for the full output"
+            )
+        return f"{preview}\n{note}]"
+
+
+
+class _CompactedContextListener(SessionStoreListener):
+    """Drops compacted contexts of sessions whose stored steps changed."""
+
+    def on_session_changed(self, store: SessionStore, session_id: str) -> None:
+        ContextWindowManager.invalidate_all(session_id)
+
+
+SessionStore.add_listener(_CompactedContextListener())
+
+
+__all__ = ["ContextWindowManager", "estimate_tokens"]
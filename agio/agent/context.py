@@ -5,7 +5,7 @@ This module provides context building from Steps using the StepAdapter.
 """
 
 from agio.domain import StepAdapter
-from agio.storage.session import SessionStore
+from agio.storage.session import SessionContextCache, SessionStore
 from agio.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -17,6 +17,7 @@ async def build_context_from_steps(
     system_prompt: str | None = None,
     run_id: str | None = None,
     runnable_id: str | None = None,
+    cache: "SessionContextCache | None" = None,
 ) -> list[dict]:
     """
     Build LLM context from Steps using StepAdapter.
@@ -27,6 +28,8 @@ async def build_context_from_steps(
         system_prompt: Optional system prompt to prepend
         run_id: Filter by run_id (optional, for isolating agent context)
         runnable_id: Filter by runnable_id (optional, for isolating agent steps)
+        cache: Optional SessionContextCache; only steps added since the previous
+            call are fetched and converted (not used together with run_id)
 
     Returns:
         list[dict]: Messages in OpenAI format, ready to send to LLM
@@ -38,17 +41,21 @@ async def build_context_from_steps(
         runnable_id=runnable_id,
     )
 
-    # 1. Query steps from session_store with optional filters
-    steps = await session_store.get_steps(
-        session_id=session_id,
-        run_id=run_id,
-        runnable_id=runnable_id,
-    )
-
-    logger.debug("context_steps_loaded", session_id=session_id, count=len(steps))
-
-    # 2. Convert using StepAdapter
-    messages = StepAdapter.steps_to_messages(steps)
+    if cache is not None and run_id is None:
+        # 1-2. Cached messages plus the steps appended since
+        messages = await cache.get_messages(session_id, runnable_id=runnable_id)
+    else:
+        # 1. Query steps from session_store with optional filters
+        steps = await session_store.get_steps(
+            session_id=session_id,
+            run_id=run_id,
+            runnable_id=runnable_id,
+        )
+
+        logger.debug("context_steps_loaded", session_id=session_id, count=len(steps))
+
+        # 2. Convert using StepAdapter
+        messages = StepAdapter.steps_to_messages(steps)
 
     # 3. Optionally prepend system prompt
     if system_prompt:
@@ -3,28 +3,34 @@ Agent Executor - LLM agent execution loop with tool calling.
 
 This module implements the core agent execution loop:
 - Streams LLM responses and accumulates tool calls
-- Executes tools in parallel
+- Executes tools in parallel (optionally starting safe calls while the response streams)
 - Tracks metrics and state
 - Handles termination and summary generation
 """
 
 import asyncio
+import json
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Awaitable, Callable
 
+from agio.agent.compact import ContextWindowManager
 from agio.agent.summarizer import build_termination_messages
 from agio.config import ExecutionConfig
 from agio.domain import (
+    LLMContextEncoder,
     RunMetrics,
     Step,
     StepAdapter,
     StepDelta,
     StepMetrics,
+    ToolResult,
+    compute_tools_hash,
     normalize_usage_metrics,
 )
 from agio.llm import Model
+from agio.llm.rate_limit import llm_request_scope
 from agio.runtime.control import AbortSignal
 from agio.runtime.event_factory import EventFactory
 from agio.runtime.permission.manager import PermissionManager
@@ -44,40 +50,137 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+@dataclass
+class _PendingToolCall:
+    """Fragments of a streaming tool call."""
+
+    id: str | None = None
+    type: str = "function"
+    name_parts: list[str] = field(default_factory=list)
+    argument_parts: list[str] = field(default_factory=list)
+    # Joined OpenAI-format call; reset whenever a new fragment arrives
+    joined: dict | None = None
+
+    def join(self) -> dict:
+        if self.joined is None:
+            self.joined = {
+                "id": self.id,
+                "type": self.type,
+                "function": {
+                    "name": "".join(self.name_parts),
+                    "arguments": "".join(self.argument_parts),
+                },
+            }
+        return self.joined
+
+
 class ToolCallAccumulator:
-    """Accumulate streaming tool calls."""
+    """
+    Accumulate streaming tool calls.
+
+    Name and argument fragments are buffered in lists and joined only when a
+    call is read, so accumulation stays linear in the size of the stream.
+    """
 
     def __init__(self) -> None:
-        self._calls: dict[int, dict] = {}
+        self._calls: dict[int, _PendingToolCall] = {}
 
     def accumulate(self, delta_calls: list[dict]) -> None:
         for tc in delta_calls:
             idx = tc.get("index", 0)
 
-            if idx not in self._calls:
-                self._calls[idx] = {
-                    "id": None,
-                    "type": "function",
-                    "function": {"name": "", "arguments": ""},
-                }
-
-            acc = self._calls[idx]
+            acc = self._calls.get(idx)
+            if acc is None:
+                acc = self._calls[idx] = _PendingToolCall()
+            acc.joined = None
 
             if tc.get("id"):
-                acc["id"] = tc["id"]
+                acc.id = tc["id"]
 
             if tc.get("type"):
-                acc["type"] = tc["type"]
+                acc.type = tc["type"]
 
             if tc.get("function"):
                 fn = tc["function"]
                 if fn.get("name"):
-                    acc["function"]["name"] += fn["name"]
+                    acc.name_parts.append(fn["name"])
                 if fn.get("arguments"):
-                    acc["function"]["arguments"] += fn["arguments"]
+                    acc.argument_parts.append(fn["arguments"])
 
     def finalize(self) -> list[dict]:
-        return [call for call in self._calls.values() if call["id"] is not None]
+        return [call.join() for call in self._calls.values() if call.id is not None]
+
+    def completed(self) -> list[dict]:
+        """
+        Calls whose arguments can no longer change.
+
+        A call is complete once a later call has started streaming, or once its
+        arguments already form a JSON object (nothing but whitespace may follow).
+        """
+        last = max(self._calls, default=None)
+        complete = []
+        for idx, call in self._calls.items():
+            if call.id is None or not call.name_parts:
+                continue
+            if idx != last:
+                complete.append(call.join())
+            elif call.argument_parts and call.argument_parts[-1].rstrip().endswith("}"):
+                # Only a fragment closing a brace can complete the object
+                joined = call.join()
+                if _is_json_object(joined["function"]["arguments"]):
+                    complete.append(joined)
+        return complete
+
+
+def _is_json_object(raw: str) -> bool:
+    if not raw:
+        return False
+    try:
+        return isinstance(json.loads(raw), dict)
+    except json.JSONDecodeError:
+        return False
+
+
+class SpeculativeToolCalls:
+    """Tool calls started while the assistant response is still streaming."""
+
+    def __init__(
+        self,
+        tool_executor: "ToolExecutor",
+        context: "ExecutionContext",
+        abort_signal: "AbortSignal | None",
+        max_concurrency: int | None,
+    ) -> None:
+        self._tool_executor = tool_executor
+        self._context = context
+        self._abort_signal = abort_signal
+        self._max_concurrency = max_concurrency
+        self.tasks: dict[str, asyncio.Task[ToolResult]] = {}
+
+    def start_ready(self, calls: list[dict]) -> None:
+        for i, call in enumerate(calls):
+            call_id = call["id"]
+            if call_id in self.tasks:
+                continue
+            if not self._tool_executor.can_speculate(call, self._context, earlier=calls[:i]):
+                continue
+            self.tasks[call_id] = self._tool_executor.start_speculative(
+                call,
+                self._context,
+                abort_signal=self._abort_signal,
+                max_concurrency=self._max_concurrency,
+            )
+            logger.debug(
+                "speculative_tool_started",
+                run_id=self._context.run_id,
+                tool_name=call["function"]["name"],
+                tool_call_id=call_id,
+            )
+
+    def cancel(self) -> None:
+        """Cancel calls that were started but never collected."""
+        for task in self.tasks.values():
+            task.cancel()
 
 
 class MetricsTracker:
@@ -115,6 +218,144 @@ class MetricsTracker:
             self.pending_tool_calls = None
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Delta Coalescing
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class DeltaCoalescer:
+    """
+    Merge consecutive STEP_DELTA updates of one step into fewer events.
+
+    Fragments are buffered until the window since the first buffered fragment
+    has elapsed or the buffered text reaches max_bytes. A timer flushes at the
+    end of the window even if no further chunk arrives (e.g. while the model
+    pauses before a tool call). Pending fragments are flushed immediately
+    before a new tool call starts, when the stream switches between text and
+    tool calls, when another step starts emitting, and on flush() at step
+    completion; aclose() flushes and stops the timer. A window of 0 emits
+    every update as its own event.
+    """
+
+    def __init__(
+        self,
+        emit: "Callable[[str, StepDelta], Awaitable[None]]",
+        *,
+        window_ms: float = 0.0,
+        max_bytes: int = 4096,
+    ) -> None:
+        self._emit = emit
+        self._window = window_ms / 1000
+        self._max_bytes = max_bytes
+        self._step_id: str | None = None
+        self._content: list[str] = []
+        self._reasoning: list[str] = []
+        self._tool_calls: list[dict] = []
+        self._usage: dict[str, int] | None = None
+        self._size = 0
+        self._started_at = 0.0
+        self._timer: asyncio.Task | None = None
+        # Keeps deltas in order when the timer and the stream flush at once
+        self._lock = asyncio.Lock()
+
+    async def add(
+        self,
+        step_id: str,
+        *,
+        content: str | None = None,
+        reasoning_content: str | None = None,
+        tool_calls: list[dict] | None = None,
+        usage: dict[str, int] | None = None,
+    ) -> None:
+        if not self._window:
+            await self._emit(
+                step_id,
+                StepDelta(
+                    content=content,
+                    reasoning_content=reasoning_content,
+                    tool_calls=tool_calls,
+                    usage=usage,
+                ),
+            )
+            return
+
+        if self._step_id != step_id or self._is_boundary(content, reasoning_content, tool_calls):
+            await self.flush()
+
+        if self._step_id is None:
+            self._step_id = step_id
+            self._started_at = time.monotonic()
+            self._timer = asyncio.create_task(self._flush_at_deadline())
+        if content:
+            self._content.append(content)
+            self._size += len(content)
+        if reasoning_content:
+            self._reasoning.append(reasoning_content)
+            self._size += len(reasoning_content)
+        if tool_calls:
+            self._tool_calls.extend(tool_calls)
+            self._size += sum(
+                len((tc.get("function") or {}).get("arguments") or "") for tc in tool_calls
+            )
+        if usage:
+            self._usage = usage
+
+        if (
+            self._size >= self._max_bytes
+            or time.monotonic() - self._started_at >= self._window
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Emit everything buffered as a single delta."""
+        self._cancel_timer()
+        async with self._lock:
+            if self._step_id is None:
+                return
+            step_id = self._step_id
+            delta = StepDelta(
+                content="".join(self._content) or None,
+                reasoning_content="".join(self._reasoning) or None,
+                tool_calls=self._tool_calls or None,
+                usage=self._usage,
+            )
+            self._step_id = None
+            self._content, self._reasoning, self._tool_calls = [], [], []
+            self._usage = None
+            self._size = 0
+            await self._emit(step_id, delta)
+
+    async def aclose(self) -> None:
+        """Flush pending fragments and stop the deadline timer."""
+        await self.flush()
+
+    async def _flush_at_deadline(self) -> None:
+        await asyncio.sleep(max(self._started_at + self._window - time.monotonic(), 0.0))
+        self._timer = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning("delta_flush_failed", error=str(e))
+
+    def _cancel_timer(self) -> None:
+        timer, self._timer = self._timer, None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+
+    def _is_boundary(
+        self,
+        content: str | None,
+        reasoning_content: str | None,
+        tool_calls: list[dict] | None,
+    ) -> bool:
+        if tool_calls:
+            # A fragment carrying an id opens a new tool call
+            if not self._tool_calls and (self._content or self._reasoning):
+                return True
+            return any(tc.get("id") for tc in tool_calls)
+        return bool(self._tool_calls) and bool(content or reasoning_content)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Run State
 # ═══════════════════════════════════════════════════════════════════════════
@@ -134,6 +375,16 @@ class RunState:
     start_time: float = field(default_factory=time.time)
     current_step: int = 0
     termination_reason: str | None = None
+    llm_context: "LLMContextEncoder" = field(default_factory=LLMContextEncoder)
+    deltas: "DeltaCoalescer | None" = None
+
+    def __post_init__(self) -> None:
+        if self.deltas is None:
+            self.deltas = DeltaCoalescer(
+                self._write_delta,
+                window_ms=self.config.delta_coalesce_ms,
+                max_bytes=self.config.delta_coalesce_bytes,
+            )
 
     @classmethod
     def create(
@@ -179,13 +430,31 @@ class RunState:
 
     async def record_step(self, step: "Step", *, append_message: bool = True) -> None:
         """Queue for persistence, track metrics, emit event, optionally append to messages."""
+        await self.deltas.flush()
         await self.repo.queue(step)
         self.tracker.track(step)
         await self.context.wire.write(self.ef.step_completed(step.id, step))
         if append_message:
             self.messages.append(StepAdapter.to_llm_message(step))
 
-    async def emit_delta(self, step_id: str, delta: "StepDelta") -> None:
+    async def emit_delta(
+        self,
+        step_id: str,
+        *,
+        content: str | None = None,
+        reasoning_content: str | None = None,
+        tool_calls: list[dict] | None = None,
+        usage: dict[str, int] | None = None,
+    ) -> None:
+        await self.deltas.add(
+            step_id,
+            content=content,
+            reasoning_content=reasoning_content,
+            tool_calls=tool_calls,
+            usage=usage,
+        )
+
+    async def _write_delta(self, step_id: str, delta: "StepDelta") -> None:
         await self.context.wire.write(self.ef.step_delta(step_id, delta))
 
     def build_output(self) -> "RunOutput":
@@ -205,6 +474,7 @@ class RunState:
         )
 
     async def cleanup(self) -> None:
+        await self.deltas.aclose()
         await self.repo.flush()
 
 
@@ -215,17 +485,25 @@ class RunState:
 
 @dataclass
 class StepBuilder:
-    """Accumulates streaming chunks into a complete Step."""
+    """
+    Accumulates streaming chunks into a complete Step.
+
+    Text deltas are buffered in lists and joined into the Step at finalize()
+    (or on demand via snapshot()), keeping accumulation linear in the number
+    of chunks.
+    """
 
     step: "Step"
     state: "RunState"
     step_start_time: float = field(default_factory=time.time)
     tool_accumulator: "ToolCallAccumulator" = field(default_factory=ToolCallAccumulator)
     first_token_received: bool = False
+    speculation: "SpeculativeToolCalls | None" = None
+    content_parts: list[str] = field(default_factory=list)
+    reasoning_parts: list[str] = field(default_factory=list)
 
     async def process_chunk(self, chunk) -> None:
         """Process a single stream chunk."""
-        delta = StepDelta()
         has_content = chunk.content or chunk.reasoning_content or chunk.tool_calls
 
         # Track first token latency
@@ -236,35 +514,56 @@ class StepBuilder:
                     time.time() - self.step_start_time
                 ) * 1000
 
+        # Retries happened before the stream started; reported on its first chunk
+        if self.step.metrics:
+            if chunk.retry_count:
+                self.step.metrics.retry_count = chunk.retry_count
+            if chunk.fallback_model:
+                self.step.metrics.fallback_model = chunk.fallback_model
+            if chunk.hedge_count:
+                self.step.metrics.hedge_count = chunk.hedge_count
+                self.step.metrics.hedge_won = chunk.hedge_won
+
         # Accumulate content
         if chunk.content:
-            self.step.content = (self.step.content or "") + chunk.content
-            delta.content = chunk.content
+            self.content_parts.append(chunk.content)
 
         if chunk.reasoning_content:
-            self.step.reasoning_content = (
-                self.step.reasoning_content or ""
-            ) + chunk.reasoning_content
-            delta.reasoning_content = chunk.reasoning_content
+            self.reasoning_parts.append(chunk.reasoning_content)
 
         if chunk.tool_calls:
             self.tool_accumulator.accumulate(chunk.tool_calls)
-            delta.tool_calls = chunk.tool_calls
+            if self.speculation is not None:
+                self.speculation.start_ready(self.tool_accumulator.completed())
 
         # Usage (typically only in final chunk)
+        usage = None
         if chunk.usage and self.step.metrics:
-            normalized = normalize_usage_metrics(chunk.usage)
-            self.step.metrics.input_tokens = normalized["input_tokens"]
-            self.step.metrics.output_tokens = normalized["output_tokens"]
-            self.step.metrics.total_tokens = normalized["total_tokens"]
-            delta.usage = normalized
+            usage = normalize_usage_metrics(chunk.usage)
+            self.step.metrics.input_tokens = usage["input_tokens"]
+            self.step.metrics.output_tokens = usage["output_tokens"]
+            self.step.metrics.total_tokens = usage["total_tokens"]
+            self.step.metrics.cache_read_tokens = usage["cache_read_tokens"]
+            self.step.metrics.cache_creation_tokens = usage["cache_creation_tokens"]
 
         # Emit delta
-        if has_content or delta.usage:
-            await self.state.emit_delta(self.step.id, delta)
+        if has_content or usage:
+            await self.state.emit_delta(
+                self.step.id,
+                content=chunk.content or None,
+                reasoning_content=chunk.reasoning_content or None,
+                tool_calls=chunk.tool_calls or None,
+                usage=usage,
+            )
+
+    def snapshot(self) -> "Step":
+        """Write the text accumulated so far into the step (e.g. for a progress event)."""
+        self._join_parts()
+        return self.step
 
     def finalize(self) -> "Step":
         """Finalize step with accumulated data and metrics."""
+        self._join_parts()
         self.step.content = self.step.content or None
         self.step.reasoning_content = self.step.reasoning_content or None
         self.step.tool_calls = self.tool_accumulator.finalize() or None
@@ -275,6 +574,17 @@ class StepBuilder:
 
         return self.step
 
+    def _join_parts(self) -> None:
+        # Collapse the buffers to one part each so repeated snapshots stay cheap
+        if self.content_parts:
+            self.step.content = (self.step.content or "") + "".join(self.content_parts)
+            self.content_parts = []
+        if self.reasoning_parts:
+            self.step.reasoning_content = (self.step.reasoning_content or "") + "".join(
+                self.reasoning_parts
+            )
+            self.reasoning_parts = []
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Agent Executor
@@ -300,6 +610,7 @@ class AgentExecutor:
         sequence_manager: "SequenceManager | None" = None,
         config: "ExecutionConfig | None" = None,
         permission_manager: PermissionManager | None = None,
+        context_window: "ContextWindowManager | None" = None,
     ):
         self.model = model
         self.tools = tools
@@ -311,7 +622,13 @@ class AgentExecutor:
             permission_manager=permission_manager,
             default_timeout=self.config.tool_timeout,
         )
+        self.context_window = context_window or ContextWindowManager.for_tools(
+            tools,
+            max_history_messages=self.config.max_history_messages,
+            max_tokens=self.config.max_context_tokens,
+        )
         self._tool_schemas = [t.to_openai_schema() for t in tools] if tools else None
+        self._tool_schemas_hash = compute_tools_hash(self._tool_schemas)
 
     # ───────────────────────────────────────────────────────────────────
     # Public API
@@ -376,12 +693,24 @@ class AgentExecutor:
                 break
 
             state.current_step += 1
-            step = await self._stream_assistant_step(state, abort_signal)
-
-            if not step.tool_calls:
-                return  # Normal completion
-
-            await self._execute_tools(state, step.tool_calls, abort_signal)
+            speculation = self._create_speculation(state, abort_signal)
+            try:
+                step = await self._stream_assistant_step(
+                    state, abort_signal, speculation=speculation
+                )
+
+                if not step.tool_calls:
+                    return  # Normal completion
+
+                await self._execute_tools(
+                    state,
+                    step.tool_calls,
+                    abort_signal,
+                    prestarted=speculation.tasks if speculation else None,
+                )
+            finally:
+                if speculation is not None:
+                    speculation.cancel()
 
     # ───────────────────────────────────────────────────────────────────
     # LLM Streaming
@@ -395,16 +724,23 @@ class AgentExecutor:
         messages: list[dict] | None = None,
         tools: list[dict] | None = ...,  # sentinel: use default
         append_message: bool = True,
+        speculation: "SpeculativeToolCalls | None" = None,
     ) -> "Step":
         """Stream LLM response, build step, record it."""
-        messages = messages if messages is not None else state.messages
+        if messages is None:
+            messages = self.context_window.compact(state.context.session_id, state.messages)
         tools = self._tool_schemas if tools is ... else tools
 
         builder = await self._create_step_builder(state, messages, tools)
+        builder.speculation = speculation
 
-        async for chunk in self.model.arun_stream(messages, tools=tools):
-            self._check_abort(abort_signal)
-            await builder.process_chunk(chunk)
+        # Rate-limited requests of top-level runs go before nested runs
+        with llm_request_scope(
+            state.context.session_id, interactive=not state.context.is_nested
+        ):
+            async for chunk in self.model.arun_stream(messages, tools=tools):
+                self._check_abort(abort_signal)
+                await builder.process_chunk(chunk)
 
         step = builder.finalize()
         await state.record_step(step, append_message=append_message)
@@ -417,13 +753,22 @@ class AgentExecutor:
         tools: list[dict] | None,
     ) -> StepBuilder:
         seq = await self._allocate_sequence(state.context)
+        # Store only the messages appended since the previous LLM call of this run
+        llm_context = state.llm_context.encode(
+            messages,
+            tools,
+            tools_hash=self._tool_schemas_hash if tools is self._tool_schemas else None,
+        )
         step = state.sf.assistant_step(
             sequence=seq,
             content="",
             tool_calls=None,
-            llm_messages=messages.copy(),
-            llm_tools=tools.copy() if tools else None,
+            llm_messages=llm_context.messages,
+            llm_tools=llm_context.tools,
             llm_request_params=self._get_request_params(),
+            llm_snapshot_id=llm_context.snapshot_id,
+            llm_parent_snapshot_id=llm_context.parent_snapshot_id,
+            llm_tools_hash=llm_context.tools_hash,
             metrics=StepMetrics(
                 exec_start_at=datetime.now(timezone.utc),
                 model_name=getattr(self.model, "model_name", None),
@@ -441,33 +786,73 @@ class AgentExecutor:
         state: RunState,
         tool_calls: list[dict],
         abort_signal: "AbortSignal | None",
+        *,
+        prestarted: dict[str, "asyncio.Task[ToolResult]"] | None = None,
     ) -> None:
-        results = await self.tool_executor.execute_batch(
-            tool_calls, context=state.context, abort_signal=abort_signal
+        # Each tool step is persisted and emitted as soon as its result is ready.
+        # Sequences are reserved in tool_call order up front, so a history rebuilt
+        # from storage matches the in-run messages (appended in tool_call order)
+        # no matter which tool finishes first.
+        # The assistant step goes first, so a run that dies while tools are still
+        # running can be resumed from its pending tool_calls.
+        await state.repo.flush()
+        sequences = [await self._allocate_sequence(state.context) for _ in tool_calls]
+        tool_messages: dict[int, dict] = {}
+        try:
+            async for index, result in self.tool_executor.execute_stream(
+                tool_calls,
+                context=state.context,
+                abort_signal=abort_signal,
+                parallel=state.config.parallel_tool_calls,
+                max_concurrency=state.config.max_parallel_tools,
+                prestarted=prestarted,
+            ):
+                step = await self._record_tool_result(state, result, sequences[index])
+                # Tools are slow next to a store write: do not batch their results
+                await state.repo.flush()
+                tool_messages[index] = StepAdapter.to_llm_message(step)
+        finally:
+            state.messages.extend(tool_messages[i] for i in sorted(tool_messages))
+
+    def _create_speculation(
+        self, state: RunState, abort_signal: "AbortSignal | None"
+    ) -> SpeculativeToolCalls | None:
+        # Speculation would break the one-after-another order of sequential mode
+        if not state.config.speculative_tool_execution or not state.config.parallel_tool_calls:
+            return None
+        if not self.tools:
+            return None
+        return SpeculativeToolCalls(
+            self.tool_executor,
+            state.context,
+            abort_signal,
+            max_concurrency=state.config.max_parallel_tools,
         )
 
-        for result in results:
-            seq = await self._allocate_sequence(state.context)
-            step = state.sf.tool_step(
-                sequence=seq,
-                tool_call_id=result.tool_call_id,
-                name=result.tool_name,
-                content=result.content,
-                content_for_user=result.content_for_user,
-                metrics=StepMetrics(
-                    duration_ms=result.duration * 1000 if result.duration else None,
-                    tool_exec_time_ms=result.duration * 1000
-                    if result.duration
-                    else None,
-                    exec_start_at=datetime.fromtimestamp(
-                        result.start_time, tz=timezone.utc
-                    ),
-                    exec_end_at=datetime.fromtimestamp(
-                        result.end_time, tz=timezone.utc
-                    ),
+    async def _record_tool_result(
+        self, state: RunState, result: ToolResult, sequence: int
+    ) -> "Step":
+        step = state.sf.tool_step(
+            sequence=sequence,
+            tool_call_id=result.tool_call_id,
+            name=result.tool_name,
+            content=result.content,
+            content_for_user=result.content_for_user,
+            metrics=StepMetrics(
+                duration_ms=result.duration * 1000 if result.duration else None,
+                tool_exec_time_ms=result.duration * 1000
+                if result.duration
+                else None,
+                exec_start_at=datetime.fromtimestamp(
+                    result.start_time, tz=timezone.utc
                 ),
-            )
-            await state.record_step(step)
+                exec_end_at=datetime.fromtimestamp(
+                    result.end_time, tz=timezone.utc
+                ),
+            ),
+        )
+        await state.record_step(step, append_message=False)
+        return step
 
     # ───────────────────────────────────────────────────────────────────
     # Summary Generation
@@ -484,7 +869,7 @@ class AgentExecutor:
             return
 
         summary_messages = build_termination_messages(
-            messages=state.messages,
+            messages=self.context_window.compact(state.context.session_id, state.messages),
             termination_reason=state.termination_reason,
             pending_tool_calls=state.tracker.pending_tool_calls,
             custom_prompt=self.config.termination_summary_prompt,
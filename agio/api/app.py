@@ -38,8 +38,20 @@ async def lifespan(app: FastAPI):
         logger.error("agio_api_init_failed", error=str(e), exc_info=True)
         raise
 
+    # Periodically drop expired tool results
+    from agio.tools import get_tool_cache
+
+    tool_cache = get_tool_cache()
+    tool_cache.start_sweeper()
+
     yield
 
+    await tool_cache.stop_sweeper()
+
+    # Pooled LLM clients outlive config reloads; close them once, here
+    from agio.llm.client_pool import close_llm_clients
+
+    await close_llm_clients()
     logger.info("agio_api_shutdown")
 
 
@@ -32,6 +32,36 @@ class SystemMetrics(BaseModel):
     avg_response_time: float
 
 
+class ToolCacheMetrics(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    bytes: int
+    sessions: int
+    hit_rate: float
+
+
+class LLMRateLimitMetrics(BaseModel):
+    requests: int
+    throttled: int
+    waiting: int
+    wait_seconds: float
+    estimated_tokens: int
+    actual_tokens: int
+    available_requests: float | None
+    available_tokens: float | None
+
+
+class RunAdmissionMetrics(BaseModel):
+    active: int
+    queued: int
+    rejected: int
+    active_by_user: dict[str, int]
+    active_by_runnable: dict[str, int]
+
+
 @router.get("/agents/{agent_id}", response_model=AgentMetrics)
 async def get_agent_metrics(
     agent_id: str,
@@ -100,3 +130,53 @@ async def get_system_metrics() -> SystemMetrics:
         raise HTTPException(
             status_code=500, detail=f"Failed to get system metrics: {str(e)}"
         )
+
+
+@router.get("/tool-cache", response_model=ToolCacheMetrics)
+async def get_tool_cache_metrics() -> ToolCacheMetrics:
+    """
+    Get tool result cache counters for this process.
+
+    **Returns:** Hit/miss/eviction counters and current size
+    """
+    from dataclasses import asdict
+
+    from agio.tools import get_tool_cache
+
+    stats = get_tool_cache().stats()
+    lookups = stats.hits + stats.misses
+    return ToolCacheMetrics(
+        **asdict(stats),
+        hit_rate=stats.hits / lookups if lookups else 0.0,
+    )
+
+
+@router.get("/runs", response_model=RunAdmissionMetrics)
+async def get_run_metrics() -> RunAdmissionMetrics:
+    """
+    Get background run counters for this process.
+
+    **Returns:** Active and queued runs, rejections, and active runs per user/agent
+    """
+    from dataclasses import asdict
+
+    from agio.runtime import get_run_manager
+
+    return RunAdmissionMetrics(**asdict(get_run_manager().stats()))
+
+
+@router.get("/llm-rate-limits", response_model=dict[str, LLMRateLimitMetrics])
+async def get_llm_rate_limit_metrics() -> dict[str, LLMRateLimitMetrics]:
+    """
+    Get client-side LLM rate limiter counters for this process.
+
+    **Returns:** Counters and remaining budget per API account (base URL and key hash)
+    """
+    from dataclasses import asdict
+
+    from agio.llm.rate_limit import get_rate_limiter_stats
+
+    return {
+        account: LLMRateLimitMetrics(**asdict(stats))
+        for account, stats in get_rate_limiter_stats().items()
+    }
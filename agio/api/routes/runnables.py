@@ -7,16 +7,25 @@ through the same endpoint.
 
 import asyncio
 import json
+from dataclasses import asdict
 from typing import Any
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
 
 from agio.api.deps import get_session_store, get_trace_store
 from agio.config import ComponentType, ConfigSystem, get_config_system
-from agio.runtime import Runnable, RunnableExecutor
+from agio.domain import RunStatus
+from agio.runtime import (
+    ActiveRun,
+    RunAdmissionError,
+    Runnable,
+    RunnableExecutor,
+    WireSubscription,
+    get_run_manager,
+)
 from agio.runtime.protocol import RunnableType
 
 router = APIRouter(prefix="/runnables")
@@ -32,6 +41,10 @@ class RunRequest(BaseModel):
     session_id: str | None = None
     user_id: str | None = None
     stream: bool = True
+    # Return the run_id at once and run in the background (ignores stream)
+    detach: bool = False
+    # Include the LLM request fields in STEP_COMPLETED snapshots
+    full_snapshots: bool = False
 
 
 class RunnableInfo(BaseModel):
@@ -42,6 +55,66 @@ class RunnableInfo(BaseModel):
     description: str | None = None
 
 
+class RunStatusInfo(BaseModel):
+    """Status of a background run."""
+
+    run_id: str
+    runnable_id: str
+    session_id: str
+    user_id: str | None = None
+    status: str
+    response: str | None = None
+    termination_reason: str | None = None
+    error: str | None = None
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+
+
+def _run_status(active: ActiveRun) -> RunStatusInfo:
+    output = active.output
+    return RunStatusInfo(
+        run_id=active.run_id,
+        runnable_id=active.runnable_id,
+        session_id=active.session_id,
+        user_id=active.user_id,
+        status=active.status.value,
+        response=output.response if output else None,
+        termination_reason=output.termination_reason if output else None,
+        error=active.error,
+        created_at=active.created_at,
+        started_at=active.started_at,
+        finished_at=active.finished_at,
+    )
+
+
+def _get_active_run(run_id: str) -> ActiveRun:
+    active = get_run_manager().get(run_id)
+    if active is None:
+        raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
+    return active
+
+
+def _sse_events(subscription: WireSubscription, full_snapshots: bool = False):
+    """Stream a wire subscription as SSE messages carrying event ids."""
+
+    async def _stream():
+        try:
+            async for event in subscription:
+                yield {
+                    "id": str(event.event_id),
+                    "event": event.type.value,
+                    "data": event.to_client_json(full_snapshot=full_snapshots),
+                }
+        except Exception as e:
+            yield {"event": "error", "data": json.dumps({"error": str(e)})}
+        finally:
+            # The run keeps going; a reconnect resumes from the last event id
+            subscription.close()
+
+    return _stream()
+
+
 @router.get("")
 async def list_runnables(
     config_system: ConfigSystem = Depends(get_config_system),
@@ -62,6 +135,20 @@ async def list_runnables(
     return {"agents": agents}
 
 
+@router.get("/runs")
+async def list_runs() -> dict[str, Any]:
+    """
+    List queued, running and recently finished background runs.
+
+    Registered before /{runnable_id} so "runs" is not taken for a runnable id.
+    """
+    manager = get_run_manager()
+    return {
+        "stats": asdict(manager.stats()),
+        "runs": [_run_status(active) for active in manager.runs()],
+    }
+
+
 @router.get("/{runnable_id}")
 async def get_runnable_info(
     runnable_id: str,
@@ -110,23 +197,89 @@ async def run_runnable(
 
     executor = RunnableExecutor(store=session_store, trace_store=trace_store)
 
-    async def execute_and_stream():
+    # The run is not bound to the request: streaming clients that drop can
+    # reattach through /runs/{run_id}/events with Last-Event-ID
+    try:
+        active = get_run_manager().start(
+            executor,
+            instance,
+            input_text,
+            session_id=session_id,
+            user_id=request.user_id,
+        )
+    except RunAdmissionError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+    if request.stream and not request.detach:
+        return EventSourceResponse(
+            _sse_events(active.wire.subscribe(), request.full_snapshots),
+            headers={"X-Run-Id": active.run_id},
+        )
+
+    if request.detach:
+        # Nobody reads the live stream; events stay available in the replay buffer
+        active.wire.subscribe().close()
+        return _run_status(active)
+
+    # Non-streaming: collect every event of the run
+    events = []
+    async for event in active.wire.subscribe():
+        events.append(
+            {
+                "event": event.type.value,
+                "data": event.to_client_json(full_snapshot=request.full_snapshots),
+            }
+        )
+    await asyncio.shield(active.task)
+    if active.status == RunStatus.FAILED:
+        # Ensure the error message is JSON-encoded for frontend parsing
+        events.append({"event": "error", "data": json.dumps({"error": active.error})})
+    return {"events": events}
+
+
+@router.get("/runs/{run_id}")
+async def get_run_status(run_id: str) -> RunStatusInfo:
+    """Get the status (and, once finished, the result) of a background run."""
+    return _run_status(_get_active_run(run_id))
+
+
+@router.post("/runs/{run_id}/abort")
+async def abort_run(run_id: str, reason: str = "Aborted by user") -> RunStatusInfo:
+    """Abort a queued or running background run."""
+    active = _get_active_run(run_id)
+    if not get_run_manager().abort(run_id, reason):
+        raise HTTPException(status_code=409, detail=f"Run already finished: {run_id}")
+    return _run_status(active)
+
+
+@router.get("/runs/{run_id}/events")
+async def attach_run_events(
+    run_id: str,
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    after: int | None = None,
+    full_snapshots: bool = False,
+):
+    """
+    Attach to the event stream of an in-flight (or recently finished) run.
+
+    Events after the id in the Last-Event-ID header (or the `after` query
+    parameter) are replayed first; without either, every event still held in
+    the run's replay buffer is replayed.
+    """
+    active = _get_active_run(run_id)
+
+    after_event_id = after
+    if last_event_id is not None:
         try:
-            async for event in executor.execute_stream(
-                instance,
-                input_text,
-                session_id=session_id,
-                user_id=request.user_id,
-            ):
-                yield {"event": event.type.value, "data": event.model_dump_json()}
-        except Exception as e:
-            # Ensure the error message is JSON-encoded for frontend parsing
-            yield {"event": "error", "data": json.dumps({"error": str(e)})}
+            after_event_id = int(last_event_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid Last-Event-ID: {last_event_id}"
+            )
+    if after_event_id is None:
+        after_event_id = 0
 
-    if request.stream:
-        return EventSourceResponse(execute_and_stream())
-    else:
-        events = []
-        async for event in execute_and_stream():
-            events.append(event)
-        return {"events": events}
+    return EventSourceResponse(
+        _sse_events(active.wire.subscribe(after_event_id), full_snapshots),
+        headers={"X-Run-Id": active.run_id},
+    )
@@ -67,6 +67,15 @@ class StepResponse(BaseModel):
     metrics: dict | None = None
 
 
+class LLMRequestResponse(BaseModel):
+    """Full LLM request behind an assistant step."""
+
+    step_id: str
+    messages: list[dict] | None = None
+    tools: list[dict] | None = None
+    request_params: dict | None = None
+
+
 class SessionResponse(BaseModel):
     """Response model for a session with its runs and step count."""
 
@@ -343,6 +352,38 @@ async def get_session_steps(
     return PaginatedSteps(total=total, items=items, limit=limit, offset=offset)
 
 
+@router.get("/{session_id}/steps/{step_id}/llm_request")
+async def get_step_llm_request(
+    session_id: str,
+    step_id: str,
+    session_store: SessionStore = Depends(get_session_store),
+) -> LLMRequestResponse:
+    """
+    Get the LLM request (messages, tools, parameters) of an assistant step.
+
+    Streamed step snapshots leave these fields out; the UI loads them here
+    when a step is inspected.
+    """
+    step = await session_store.get_step_by_id(session_id, step_id)
+    if step is None:
+        raise HTTPException(
+            status_code=404, detail=f"Step '{step_id}' not found in session '{session_id}'"
+        )
+    if not step.is_assistant_step():
+        raise HTTPException(
+            status_code=400,
+            detail=f"Only assistant steps have an LLM request, got: {step.role.value}",
+        )
+
+    step = await session_store.resolve_llm_context(step)
+    return LLMRequestResponse(
+        step_id=step.id,
+        messages=step.llm_messages,
+        tools=step.llm_tools,
+        request_params=step.llm_request_params,
+    )
+
+
 # Request Models for Fork/Retry
 class ForkRequest(BaseModel):
     """Request to fork a session at a specific step."""
@@ -465,7 +506,7 @@ async def resume_session_endpoint(
 
     # Resume execution via SSE stream
     async def event_generator():
-        wire = Wire()
+        wire = Wire.from_settings()
 
         async def _run():
             try:
@@ -483,7 +524,7 @@ async def resume_session_endpoint(
             async for event in wire.read():
                 yield {
                     "event": event.type.value,
-                    "data": event.model_dump_json(),
+                    "data": event.to_client_json(),
                 }
         except Exception as e:
             yield {"event": "error", "data": json.dumps({"error": str(e)})}
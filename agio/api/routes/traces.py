@@ -32,6 +32,7 @@ class TraceSummary(BaseModel):
     total_tokens: int
     total_cache_read_tokens: int = 0
     total_cache_creation_tokens: int = 0
+    cache_hit_rate: float | None = None
     total_llm_calls: int
     total_tool_calls: int
     max_depth: int
@@ -76,6 +77,7 @@ class TraceDetail(BaseModel):
     total_tokens: int
     total_cache_read_tokens: int = 0
     total_cache_creation_tokens: int = 0
+    cache_hit_rate: float | None = None
     total_llm_calls: int
     total_tool_calls: int
     max_depth: int
@@ -312,6 +314,7 @@ def _to_summary(trace: Trace) -> TraceSummary:
         total_tokens=trace.total_tokens,
         total_cache_read_tokens=trace.total_cache_read_tokens,
         total_cache_creation_tokens=trace.total_cache_creation_tokens,
+        cache_hit_rate=trace.cache_hit_rate,
         total_llm_calls=trace.total_llm_calls,
         total_tool_calls=trace.total_tool_calls,
         max_depth=trace.max_depth,
@@ -335,6 +338,7 @@ def _to_detail(trace: Trace) -> TraceDetail:
         total_tokens=trace.total_tokens,
         total_cache_read_tokens=trace.total_cache_read_tokens,
         total_cache_creation_tokens=trace.total_cache_creation_tokens,
+        cache_hit_rate=trace.cache_hit_rate,
         total_llm_calls=trace.total_llm_calls,
         total_tool_calls=trace.total_tool_calls,
         max_depth=trace.max_depth,
@@ -38,6 +38,12 @@ class SQLiteBackend(BackendConfig):
 
     type: Literal["sqlite"] = "sqlite"
     db_path: str = Field(..., description="SQLite database file path")
+    journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"] | None = Field(
+        default="WAL", description="PRAGMA journal_mode applied on connect (session store)"
+    )
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] | None = Field(
+        default="NORMAL", description="PRAGMA synchronous applied on connect (session store)"
+    )
 
 
 class InMemoryBackend(BackendConfig):
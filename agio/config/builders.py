@@ -266,6 +266,8 @@ class SessionStoreBuilder(ComponentBuilder):
 
                 store = SQLiteSessionStore(
                     db_path=backend.db_path,
+                    journal_mode=backend.journal_mode,
+                    synchronous=backend.synchronous,
                 )
 
                 if hasattr(store, "connect"):
@@ -310,8 +312,13 @@ class AgentBuilder(ComponentBuilder):
                 "system_prompt": config.system_prompt,
                 "user_id": config.user_id,
                 "max_steps": config.max_steps,
+                "max_history_messages": config.max_history_messages,
+                "max_context_tokens": config.max_context_tokens,
                 "enable_termination_summary": config.enable_termination_summary,
                 "termination_summary_prompt": config.termination_summary_prompt,
+                "speculative_tool_execution": config.speculative_tool_execution,
+                "delta_coalesce_ms": config.delta_coalesce_ms,
+                "delta_coalesce_bytes": config.delta_coalesce_bytes,
             }
 
             if "session_store" in dependencies:
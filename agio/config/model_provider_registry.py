@@ -7,7 +7,14 @@ Manages model provider factories and creates model instances from configuration.
 from typing import Any, Callable, Protocol
 
 from agio.config.schema import ModelConfig
-from agio.llm import AnthropicModel, DeepseekModel, NvidiaModel, OpenAIModel
+from agio.llm import (
+    AnthropicModel,
+    DeepseekModel,
+    NvidiaModel,
+    OpenAIModel,
+    ReplayModel,
+    SyntheticModel,
+)
 from agio.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -25,6 +32,16 @@ class ModelProvider(Protocol):
         base_url: str | None,
         temperature: float,
         max_tokens: int | None,
+        max_retries: int,
+        fallback_model: str | None,
+        hedging: bool,
+        hedge_percentile: float,
+        hedge_delay: float,
+        hedge_model: str | None,
+        requests_per_minute: int | None,
+        tokens_per_minute: int | None,
+        prompt_caching: bool,
+        cache_message_breakpoints: int,
     ): ...
 
 
@@ -51,6 +68,9 @@ class ModelProviderRegistry:
         self.register("anthropic", AnthropicModel)
         self.register("deepseek", DeepseekModel)
         self.register("nvidia", NvidiaModel)
+        # Token-free providers for load testing
+        self.register("synthetic", SyntheticModel)
+        self.register("replay", ReplayModel)
 
         logger.debug("Registered default model providers")
 
@@ -127,6 +147,17 @@ class ModelProviderRegistry:
             base_url=config.base_url,
             temperature=config.temperature,
             max_tokens=config.max_tokens,
+            max_retries=config.max_retries,
+            fallback_model=config.fallback_model,
+            hedging=config.hedging,
+            hedge_percentile=config.hedge_percentile,
+            hedge_delay=config.hedge_delay,
+            hedge_model=config.hedge_model,
+            requests_per_minute=config.requests_per_minute,
+            tokens_per_minute=config.tokens_per_minute,
+            prompt_caching=config.prompt_caching,
+            cache_message_breakpoints=config.cache_message_breakpoints,
+            **config.options,
         )
 
 
@@ -8,7 +8,7 @@ This module contains all component configuration classes:
 """
 
 from enum import Enum
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -32,15 +32,31 @@ class ExecutionConfig(BaseModel):
         default=120.0, ge=1.0, description="Timeout per step (seconds)"
     )
     parallel_tool_calls: bool = Field(
-        default=True, description="Execute tools in parallel"
+        default=True,
+        description="Execute concurrency-safe tools in parallel (unsafe tools are "
+        "always serialized per resource)",
+    )
+    speculative_tool_execution: bool = Field(
+        default=False,
+        description="Start complete, concurrency-safe tool calls that need no consent "
+        "while the LLM response is still streaming",
     )
     max_total_tokens: int | None = Field(
         default=None, description="Maximum total tokens (input + output)"
     )
 
     # Context configuration
-    max_history_messages: int = Field(
-        default=10, description="Maximum history messages"
+    max_history_messages: int | None = Field(
+        default=None,
+        ge=0,
+        description="Maximum messages kept from turns before the current user turn "
+        "(None = unlimited)",
+    )
+    max_context_tokens: int | None = Field(
+        default=None,
+        ge=1,
+        description="Estimated token budget of the LLM context; old tool outputs are "
+        "elided and old turns dropped to stay within it (None = unlimited)",
     )
     max_rag_docs: int = Field(default=3, description="Maximum RAG documents")
     max_memories: int = Field(default=5, description="Maximum semantic memories")
@@ -60,7 +76,22 @@ class ExecutionConfig(BaseModel):
     )
 
     # Concurrency configuration
-    max_parallel_tools: int = Field(default=10, description="Maximum parallel tools")
+    max_parallel_tools: int = Field(
+        default=10, ge=1, description="Maximum concurrently executing tools per run"
+    )
+
+    # Streaming configuration
+    delta_coalesce_ms: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Merge consecutive STEP_DELTA updates of a step arriving within "
+        "this window (milliseconds, 0 = one event per chunk)",
+    )
+    delta_coalesce_bytes: int = Field(
+        default=4096,
+        ge=1,
+        description="Flush coalesced STEP_DELTA text once it reaches this size",
+    )
 
     # Debug configuration
     debug_mode: bool = Field(default=False, description="Debug mode")
@@ -130,6 +161,58 @@ class ModelConfig(ComponentConfig):
     timeout: float | None = Field(
         default=None, ge=1.0, description="Request timeout in seconds"
     )
+    max_retries: int = Field(
+        default=3,
+        ge=1,
+        description="Attempts per model for errors before the stream starts",
+    )
+    fallback_model: str | None = Field(
+        default=None,
+        description="Model name (same provider) to fail over to when retries run out",
+    )
+    hedging: bool = Field(
+        default=False,
+        description="Start a second request when the first chunk is slow to arrive",
+    )
+    hedge_percentile: float = Field(
+        default=95.0,
+        ge=50.0,
+        le=99.9,
+        description="Time-to-first-token percentile after which a request is hedged",
+    )
+    hedge_delay: float = Field(
+        default=2.0,
+        gt=0.0,
+        description="Hedge delay in seconds until enough latency samples exist",
+    )
+    hedge_model: str | None = Field(
+        default=None,
+        description="Model name (same provider) for hedge requests (default: same model)",
+    )
+    requests_per_minute: int | None = Field(
+        default=None,
+        ge=0,
+        description="Client-side request limit for this API account (0 = unlimited)",
+    )
+    tokens_per_minute: int | None = Field(
+        default=None,
+        ge=0,
+        description="Client-side token limit for this API account (0 = unlimited)",
+    )
+    prompt_caching: bool = Field(
+        default=False,
+        description="Place prompt cache breakpoints on the stable prefix (Anthropic)",
+    )
+    cache_message_breakpoints: int = Field(
+        default=2,
+        ge=0,
+        le=4,
+        description="Trailing messages that get a cache breakpoint (Anthropic)",
+    )
+    options: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Provider-specific model fields (e.g. ttft_ms for synthetic)",
+    )
 
 
 class ToolConfig(ComponentConfig):
@@ -242,6 +325,14 @@ class AgentConfig(ComponentConfig):
 
     system_prompt: str | None = None
     max_steps: int = 10
+    max_history_messages: int | None = Field(
+        default=None,
+        ge=0,
+        description="Maximum messages kept from earlier turns (None = unlimited)",
+    )
+    max_context_tokens: int | None = Field(
+        default=None, ge=1, description="Estimated token budget of the LLM context"
+    )
     max_tokens: int | None = None
     enable_memory_update: bool = False
     user_id: str | None = None
@@ -252,6 +343,20 @@ class AgentConfig(ComponentConfig):
         default=False, description="Enable permission checking for tool execution"
     )
 
+    # Tool execution configuration
+    speculative_tool_execution: bool = Field(
+        default=False,
+        description="Start safe tool calls while the LLM response is still streaming",
+    )
+
+    # Streaming configuration
+    delta_coalesce_ms: float = Field(
+        default=0.0, ge=0.0, description="Window for merging STEP_DELTA updates (ms)"
+    )
+    delta_coalesce_bytes: int = Field(
+        default=4096, ge=1, description="Flush merged STEP_DELTA text at this size"
+    )
+
     # Termination summary configuration
     enable_termination_summary: bool = Field(
         default=False,
@@ -64,6 +64,114 @@ class AgioSettings(BaseSettings):
         default=1.0, ge=0.0, le=1.0
     )  # 1.0 = 100% sampling
 
+    # Tool result cache
+    tool_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024, description="Global byte budget of the tool result cache"
+    )
+    tool_cache_ttl_seconds: int = Field(
+        default=3600, description="Default TTL of cached tool results"
+    )
+    tool_cache_sweep_interval: float = Field(
+        default=60.0, description="Seconds between expired-entry sweeps"
+    )
+    tool_cache_backend: Literal["memory", "sqlite"] = Field(
+        default="memory",
+        description="memory: per-process LRU; sqlite: LRU in front of a shared SQLite file",
+    )
+    tool_cache_path: str = Field(
+        default="~/.agio/tool_cache.db", description="SQLite file of the shared tool cache"
+    )
+    tool_cache_disk_max_bytes: int = Field(
+        default=1024 * 1024 * 1024, description="Compressed byte budget of the shared cache"
+    )
+
+    # Session context cache
+    session_context_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Byte budget of converted session messages kept between runs",
+    )
+
+    # Tool execution
+    tool_max_concurrency: int = Field(
+        default=64, ge=1, description="Process-wide cap on concurrently executing tools"
+    )
+
+    # Event streaming
+    wire_buffer_size: int = Field(
+        default=1024, ge=0, description="Events buffered per wire subscriber (0 = unlimited)"
+    )
+    wire_policy: Literal["block", "coalesce", "drop_deltas"] = Field(
+        default="coalesce", description="What a wire does when a subscriber falls behind"
+    )
+    wire_replay_size: int = Field(
+        default=512, ge=0, description="Recent events a wire keeps for resumed SSE streams"
+    )
+
+    # Run admission control (0 = unlimited)
+    run_max_concurrent: int = Field(
+        default=0, ge=0, description="Runs executing at once in this process"
+    )
+    run_max_per_user: int = Field(default=0, ge=0, description="Runs executing at once per user")
+    run_max_per_runnable: int = Field(
+        default=0, ge=0, description="Runs executing at once per agent"
+    )
+    run_max_queued: int = Field(
+        default=0, ge=0, description="Runs waiting for admission before new ones are rejected"
+    )
+    run_linger_seconds: float = Field(
+        default=300.0,
+        ge=0.0,
+        description="How long a finished run stays attachable for resumed streams",
+    )
+
+    # Client-side LLM rate limits per API account (0 = unlimited)
+    llm_requests_per_minute: int = Field(
+        default=0, ge=0, description="LLM requests per minute per base URL and API key"
+    )
+    llm_tokens_per_minute: int = Field(
+        default=0, ge=0, description="LLM tokens per minute per base URL and API key"
+    )
+
+    # LLM HTTP clients (pooled per endpoint and API key)
+    llm_http2: bool = Field(
+        default=True, description="Use HTTP/2 for LLM APIs (needs the h2 package)"
+    )
+    llm_http_max_connections: int = Field(
+        default=100, ge=1, description="Connections per pooled LLM client"
+    )
+    llm_http_max_keepalive_connections: int = Field(
+        default=20, ge=0, description="Idle connections kept open per pooled LLM client"
+    )
+    llm_http_keepalive_expiry: float = Field(
+        default=60.0, ge=0.0, description="Seconds an idle LLM connection is kept open"
+    )
+    llm_http_connect_timeout: float = Field(
+        default=10.0, gt=0.0, description="LLM connect timeout in seconds"
+    )
+    llm_http_read_timeout: float = Field(
+        default=600.0, gt=0.0, description="LLM request timeout in seconds"
+    )
+
+    # LLM request logging (INFO lines carry only a payload hash and size)
+    llm_log_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Share of requests whose payload is logged at DEBUG and to the payload log",
+    )
+    llm_log_max_field_chars: int = Field(
+        default=2000, ge=0, description="Strings in DEBUG request payloads are cut to this length"
+    )
+    llm_payload_log_path: str | None = Field(
+        default=None, description="File receiving full request payloads (JSON lines)"
+    )
+    llm_payload_log_max_bytes: int = Field(
+        default=50 * 1024 * 1024, ge=1, description="Payload log size before it is rotated"
+    )
+    llm_payload_log_backup_count: int = Field(
+        default=5, ge=0, description="Rotated (gzip-compressed) payload logs kept"
+    )
+
     # Skills configuration
     skills_dirs: list[str] = Field(
         default_factory=lambda: ["examples/skills", "~/.agio/skills"],
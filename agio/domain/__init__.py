@@ -9,6 +9,7 @@ from .adapters import StepAdapter
 
 # Events
 from .events import (
+    LLM_REQUEST_FIELDS,
     StepDelta,
     StepEvent,
     StepEventType,
@@ -37,6 +38,15 @@ from .models import (
     normalize_usage_metrics,
 )
 
+# Snapshots
+from .snapshots import (
+    LLMContextDelta,
+    LLMContextEncoder,
+    compute_snapshot_id,
+    compute_tools_hash,
+    resolve_llm_context,
+)
+
 __all__ = [
     # Models
     "Step",
@@ -56,6 +66,7 @@ __all__ = [
     "StepEventType",
     "StepDelta",
     "ToolResult",
+    "LLM_REQUEST_FIELDS",
     "create_run_started_event",
     "create_run_completed_event",
     "create_run_failed_event",
@@ -64,4 +75,10 @@ __all__ = [
     "create_error_event",
     # Adapters
     "StepAdapter",
+    # Snapshots
+    "LLMContextDelta",
+    "LLMContextEncoder",
+    "compute_snapshot_id",
+    "compute_tools_hash",
+    "resolve_llm_context",
 ]
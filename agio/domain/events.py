@@ -14,6 +14,19 @@ from pydantic import BaseModel, Field
 
 from .models import Step
 
+# Step fields that describe the LLM request behind an assistant step. They are
+# left out of client-facing snapshots and served on demand instead.
+LLM_REQUEST_FIELDS = frozenset(
+    {
+        "llm_messages",
+        "llm_tools",
+        "llm_request_params",
+        "llm_snapshot_id",
+        "llm_parent_snapshot_id",
+        "llm_tools_hash",
+    }
+)
+
 
 class StepEventType(str, Enum):
     """Event types for Step-based streaming"""
@@ -97,6 +110,21 @@ class StepEvent(BaseModel):
     # Observability fields (injected by TraceCollector)
     trace_id: str | None = None
 
+    # Position in the Wire stream (assigned on write, used for SSE resume)
+    event_id: int | None = None
+
+    def to_client_json(self, *, full_snapshot: bool = False) -> str:
+        """
+        Serialize for streaming to a client.
+
+        Args:
+            full_snapshot: Keep the LLM request fields of the step snapshot
+
+        Returns:
+            str: JSON payload of the event
+        """
+        return self.model_dump_json(exclude=_client_exclude(full_snapshot))
+
     def to_sse(self) -> str:
         """
         Convert to Server-Sent Events format.
@@ -104,10 +132,14 @@ class StepEvent(BaseModel):
         Returns:
             str: SSE-formatted string ready to send to client
         """
-        data = self.model_dump(mode="json", exclude_none=True)
+        data = self.model_dump(mode="json", exclude_none=True, exclude=_client_exclude(False))
         return f"data: {json.dumps(data)}\n\n"
 
 
+def _client_exclude(full_snapshot: bool) -> dict | None:
+    return None if full_snapshot else {"snapshot": LLM_REQUEST_FIELDS}
+
+
 class ToolResult(BaseModel):
     """Result of a tool execution"""
 
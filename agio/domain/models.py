@@ -101,8 +101,11 @@ def normalize_usage_metrics(usage_data: dict[str, Any] | None) -> dict[str, int
         # Anthropic style: sum them up to get Total Input
         if input_tokens is not None:
             input_tokens += (cache_read_tokens or 0) + (cache_creation_tokens or 0)
-    elif "cache_read_tokens" in usage_data or "cache_creation_tokens" in usage_data:
-        # Also Anthropic style if passed from my updated anthropic.py
+    elif (
+        "cache_read_tokens" in usage_data or "cache_creation_tokens" in usage_data
+    ) and usage_data.get("total_tokens") is None:
+        # Also Anthropic style if passed from my updated anthropic.py.
+        # With total_tokens present the usage is already normalized.
         if input_tokens is not None:
             input_tokens += (cache_read_tokens or 0) + (cache_creation_tokens or 0)
 
@@ -150,6 +153,12 @@ class StepMetrics(BaseModel):
     # Latency
     first_token_latency_ms: float | None = None
 
+    # Retries before the LLM stream started
+    retry_count: int | None = None
+    fallback_model: str | None = None  # Model that served after failover
+    hedge_count: int | None = None  # Hedge requests started before the stream
+    hedge_won: bool | None = None  # Whether a hedge request served the stream
+
     # Tool execution (for tool steps)
     tool_exec_time_ms: float | None = None
     tool_exec_start_at: float | None = None
@@ -288,13 +297,18 @@ class Step(BaseModel):
     depth: int = 0  # Nesting depth
 
     # --- LLM Call Context (for assistant steps) ---
+    # Delta-encoded: when llm_parent_snapshot_id is set, llm_messages only holds
+    # the messages appended after the parent snapshot (see domain.snapshots)
     llm_messages: list[dict[str, Any]] | None = (
-        None  # Complete message list sent to LLM
+        None  # Message list sent to LLM (full, or appended delta)
     )
     llm_tools: list[dict[str, Any]] | None = None  # Tool definitions sent to LLM
     llm_request_params: dict[str, Any] | None = (
         None  # Request parameters (temperature, max_tokens, etc.)
     )
+    llm_snapshot_id: str | None = None  # Content hash of the full message list
+    llm_parent_snapshot_id: str | None = None  # Snapshot that llm_messages extends
+    llm_tools_hash: str | None = None  # Hash of the tool schema set
 
     def is_user_step(self) -> bool:
         """Check if this is a user message"""
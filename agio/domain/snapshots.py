@@ -0,0 +1,177 @@
+"""
+LLM context snapshots - Delta encoding for the request context of assistant Steps.
+
+Every assistant Step records the messages and tools that were sent to the LLM.
+Within a run the message list only grows, so storing a full copy per step costs
+O(n²) bytes. Instead each Step stores:
+
+- llm_snapshot_id: content hash identifying the full message list
+- llm_parent_snapshot_id: snapshot the message list extends (None = full copy)
+- llm_messages: only the messages appended after the parent snapshot
+- llm_tools_hash: hash of the tool schema set; llm_tools is only stored
+  when it differs from the parent snapshot's tool set
+
+The full request is reconstructed on demand with resolve_llm_context().
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from .models import Step
+
+
+def _digest(payload: str) -> str:
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def compute_snapshot_id(
+    parent_snapshot_id: str | None, appended: list[dict[str, Any]]
+) -> str:
+    """
+    Compute the content-addressed id of a message list.
+
+    The id chains the parent id with the appended messages, so two identical
+    message lists built through the same chain share the same id.
+
+    Args:
+        parent_snapshot_id: Snapshot id the list extends (None for a full list)
+        appended: Messages appended after the parent snapshot
+
+    Returns:
+        Hex digest identifying the full message list
+    """
+    body = json.dumps(appended, sort_keys=True, ensure_ascii=False, default=str)
+    return _digest(f"{parent_snapshot_id or ''}\n{body}")
+
+
+def compute_tools_hash(tools: list[dict[str, Any]] | None) -> str | None:
+    """Compute a stable hash of a tool schema set (None if no tools)."""
+    if not tools:
+        return None
+    return _digest(json.dumps(tools, sort_keys=True, ensure_ascii=False, default=str))
+
+
+@dataclass
+class LLMContextDelta:
+    """Delta-encoded LLM request context for one assistant Step."""
+
+    snapshot_id: str
+    parent_snapshot_id: str | None
+    messages: list[dict[str, Any]]
+    tools: list[dict[str, Any]] | None
+    tools_hash: str | None
+
+
+class LLMContextEncoder:
+    """
+    Delta-encodes successive LLM request contexts within a run.
+
+    A new message list is encoded against the previous one when the previous
+    list is an identity prefix of it (the agent loop appends to the same list),
+    otherwise a full snapshot is emitted.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot_id: str | None = None
+        self._messages: list[dict[str, Any]] = []
+        self._tools_hash: str | None = None
+
+    def _extends_previous(self, messages: list[dict[str, Any]]) -> bool:
+        if self._snapshot_id is None or len(messages) < len(self._messages):
+            return False
+        return all(a is b for a, b in zip(self._messages, messages))
+
+    def encode(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        tools_hash: str | None = None,
+    ) -> LLMContextDelta:
+        """
+        Encode a request context relative to the previously encoded one.
+
+        Args:
+            messages: Full message list sent to the LLM
+            tools: Tool schemas sent to the LLM
+            tools_hash: Precomputed hash of tools (computed if omitted)
+
+        Returns:
+            LLMContextDelta to store on the assistant Step
+        """
+        if tools_hash is None:
+            tools_hash = compute_tools_hash(tools)
+
+        if self._extends_previous(messages):
+            parent_id = self._snapshot_id
+            appended = list(messages[len(self._messages) :])
+            same_tools = tools_hash == self._tools_hash
+        else:
+            parent_id = None
+            appended = list(messages)
+            same_tools = False
+
+        snapshot_id = compute_snapshot_id(parent_id, appended)
+
+        self._snapshot_id = snapshot_id
+        self._messages = list(messages)
+        self._tools_hash = tools_hash
+
+        return LLMContextDelta(
+            snapshot_id=snapshot_id,
+            parent_snapshot_id=parent_id,
+            messages=appended,
+            tools=None if same_tools else (list(tools) if tools else None),
+            tools_hash=tools_hash,
+        )
+
+
+def resolve_llm_context(
+    step: Step,
+    snapshots: dict[str, Step],
+) -> tuple[list[dict[str, Any]] | None, list[dict[str, Any]] | None]:
+    """
+    Reconstruct the full messages and tools sent to the LLM for a Step.
+
+    Args:
+        step: Assistant Step to resolve
+        snapshots: Candidate ancestor Steps keyed by llm_snapshot_id
+
+    Returns:
+        (messages, tools). messages is None if the snapshot chain is broken.
+    """
+    chain = [step]
+    seen = {step.llm_snapshot_id}
+    current = step
+    while current.llm_parent_snapshot_id:
+        parent = snapshots.get(current.llm_parent_snapshot_id)
+        if parent is None or parent.llm_snapshot_id in seen:
+            return None, _resolve_tools(step, chain)
+        chain.append(parent)
+        seen.add(parent.llm_snapshot_id)
+        current = parent
+
+    messages: list[dict[str, Any]] = []
+    for snapshot in reversed(chain):
+        messages.extend(snapshot.llm_messages or [])
+
+    return messages, _resolve_tools(step, chain)
+
+
+def _resolve_tools(step: Step, chain: list[Step]) -> list[dict[str, Any]] | None:
+    if step.llm_tools is not None or step.llm_tools_hash is None:
+        return step.llm_tools
+    for snapshot in chain:
+        if snapshot.llm_tools is not None and snapshot.llm_tools_hash == step.llm_tools_hash:
+            return snapshot.llm_tools
+    return None
+
+
+__all__ = [
+    "LLMContextDelta",
+    "LLMContextEncoder",
+    "compute_snapshot_id",
+    "compute_tools_hash",
+    "resolve_llm_context",
+]
@@ -6,13 +6,18 @@ This module contains LLM model implementations:
 - OpenAIModel: OpenAI GPT models
 - AnthropicModel: Anthropic Claude models
 - DeepseekModel: Deepseek models (OpenAI-compatible)
+- SyntheticModel, ReplayModel: Token-free mock models for load testing
+- ProviderRateLimiter: Client-side RPM/TPM limits shared per API account
 """
 
 from .anthropic import AnthropicModel
 from .base import Model, StreamChunk
+from .client_pool import close_llm_clients, get_llm_client
 from .deepseek import DeepseekModel
+from .mock import ReplayModel, SyntheticModel
 from .nvidia import NvidiaModel
 from .openai import OpenAIModel
+from .rate_limit import ProviderRateLimiter, get_rate_limiter, llm_request_scope
 
 __all__ = [
     "Model",
@@ -21,4 +26,11 @@ __all__ = [
     "AnthropicModel",
     "DeepseekModel",
     "NvidiaModel",
+    "SyntheticModel",
+    "ReplayModel",
+    "close_llm_clients",
+    "get_llm_client",
+    "ProviderRateLimiter",
+    "get_rate_limiter",
+    "llm_request_scope",
 ]
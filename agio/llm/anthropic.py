@@ -6,21 +6,25 @@ import json
 import os
 from typing import Any, AsyncIterator
 
-from pydantic import ConfigDict, Field, SecretStr
+from pydantic import ConfigDict, Field, PrivateAttr, SecretStr
 
 try:
     from anthropic import (
         APIConnectionError,
         APITimeoutError,
         AsyncAnthropic,
+        InternalServerError,
         RateLimitError,
     )
 except ImportError:
     raise ImportError("Please install anthropic package: uv add anthropic")
 
 from agio.llm.base import Model, StreamChunk
+from agio.llm.client_pool import get_llm_client
+from agio.llm.message_cache import ConversionCache
+from agio.llm.rate_limit import estimate_request_tokens
+from agio.llm.request_log import log_llm_request
 from agio.utils.logging import get_logger
-from agio.utils.retry import retry_async
 
 logger = get_logger(__name__)
 
@@ -28,15 +32,25 @@ logger = get_logger(__name__)
 ANTHROPIC_RETRYABLE = (
     APIConnectionError,
     RateLimitError,
+    InternalServerError,
     APITimeoutError,
 )
 
+# Anthropic accepts at most this many cache_control breakpoints per request
+MAX_CACHE_BREAKPOINTS = 4
+CACHE_CONTROL = {"type": "ephemeral"}
+
 
 class AnthropicModel(Model):
     """
     Anthropic Claude Model implementation.
 
     Supports Claude 3 series models (Opus, Sonnet, Haiku).
+
+    With prompt_caching enabled, cache breakpoints are placed on the tool
+    list, the system prompt and the last cache_message_breakpoints messages,
+    so the stable prefix of an agent loop (tools, system prompt, history) is
+    read from the prompt cache on every following step.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True, protected_namespaces=())
@@ -51,6 +65,18 @@ class AnthropicModel(Model):
 
     max_tokens_to_sample: int = Field(default=4096, ge=1)
 
+    prompt_caching: bool = Field(
+        default=False, description="Place cache_control breakpoints on the stable prefix"
+    )
+    cache_message_breakpoints: int = Field(
+        default=2,
+        ge=0,
+        le=MAX_CACHE_BREAKPOINTS,
+        description="Trailing messages that get a cache breakpoint",
+    )
+
+    _conversion_cache: ConversionCache = PrivateAttr(default_factory=ConversionCache)
+
     def model_post_init(self, __context) -> None:
         """Initialize AsyncAnthropic client after model creation."""
         from agio.config import settings
@@ -64,11 +90,12 @@ class AnthropicModel(Model):
         else:
             resolved_api_key = os.getenv("ANTHROPIC_API_KEY")
 
+        # Share the pooled client unless one is provided
         if self.client is None:
-            client_kwargs = {"api_key": resolved_api_key}
-            if self.base_url:
-                client_kwargs["base_url"] = self.base_url
-            self.client = AsyncAnthropic(**client_kwargs)
+            self.client = get_llm_client(
+                AsyncAnthropic, base_url=self.base_url, api_key=resolved_api_key
+            )
+        self._use_rate_limiter(self.base_url, resolved_api_key)
 
         logger.info(
             "AnthropicModel initialized",
@@ -80,95 +107,105 @@ class AnthropicModel(Model):
         super().model_post_init(__context)
 
     def _convert_messages(self, messages: list[dict]) -> tuple[str | None, list[dict]]:
-        """Convert OpenAI format messages to Anthropic format."""
+        """
+        Convert OpenAI format messages to Anthropic format.
+
+        Converted messages are memoized, so on each step of an agent loop only
+        the newly appended messages are converted.
+        """
         system_prompt = None
         anthropic_messages = []
 
         for msg in messages:
-            role = msg.get("role")
-            content = msg.get("content")
-
-            if role == "system":
-                system_prompt = content
-            elif role == "user":
-                anthropic_messages.append({"role": "user", "content": content})
-            elif role == "assistant":
-                reasoning = msg.get("reasoning_content")
-                if "tool_calls" in msg or reasoning:
-                    content_blocks = []
-
-                    if reasoning:
-                        content_blocks.append(
-                            {"type": "thinking", "thinking": reasoning}
-                        )
+            if msg.get("role") == "system":
+                system_prompt = msg.get("content")
+                continue
+            converted = self._conversion_cache.message(msg, self._convert_message)
+            if converted is not None:
+                anthropic_messages.append(converted)
+
+        return system_prompt, anthropic_messages
 
-                    if content:
-                        content_blocks.append({"type": "text", "text": content})
-
-                    if "tool_calls" in msg:
-                        for tool_call in msg["tool_calls"]:
-                            func = tool_call["function"]
-                            args = func["arguments"]
-                            if isinstance(args, str):
-                                try:
-                                    args = json.loads(args)
-                                except json.JSONDecodeError:
-                                    logger.error(
-                                        "failed_to_decode_tool_arguments",
-                                        arguments=args,
-                                    )
-                                    # Fallback to empty dict to avoid API 400 error
-                                    # Anthropic requires 'input' to be a dictionary
-                                    args = {"__raw_arguments__": args}
-
-                            if not isinstance(args, dict):
-                                logger.error(
-                                    "invalid_tool_arguments_type",
-                                    arguments=args,
-                                    type=type(args).__name__,
-                                )
-                                args = {"__raw_arguments__": args}
-
-                            content_blocks.append(
-                                {
-                                    "type": "tool_use",
-                                    "id": tool_call["id"],
-                                    "name": func["name"],
-                                    "input": args,
-                                }
-                            )
-
-                    anthropic_messages.append(
-                        {"role": "assistant", "content": content_blocks}
+    @staticmethod
+    def _convert_message(msg: dict) -> dict | None:
+        """Convert one non-system message (None for unknown roles)."""
+        role = msg.get("role")
+        content = msg.get("content")
+
+        if role == "user":
+            return {"role": "user", "content": content}
+        if role == "assistant":
+            reasoning = msg.get("reasoning_content")
+            if "tool_calls" not in msg and not reasoning:
+                return {"role": "assistant", "content": content}
+
+            content_blocks = []
+
+            if reasoning:
+                content_blocks.append({"type": "thinking", "thinking": reasoning})
+
+            if content:
+                content_blocks.append({"type": "text", "text": content})
+
+            for tool_call in msg.get("tool_calls") or []:
+                func = tool_call["function"]
+                args = func["arguments"]
+                if isinstance(args, str):
+                    try:
+                        args = json.loads(args)
+                    except json.JSONDecodeError:
+                        logger.error(
+                            "failed_to_decode_tool_arguments",
+                            arguments=args,
+                        )
+                        # Fallback to empty dict to avoid API 400 error
+                        # Anthropic requires 'input' to be a dictionary
+                        args = {"__raw_arguments__": args}
+
+                if not isinstance(args, dict):
+                    logger.error(
+                        "invalid_tool_arguments_type",
+                        arguments=args,
+                        type=type(args).__name__,
                     )
-                else:
-                    anthropic_messages.append({"role": "assistant", "content": content})
-            elif role == "tool":
-                # Ensure tool result content is a string
-                tool_result_content = content
-                if not isinstance(tool_result_content, str):
-                    tool_result_content = json.dumps(tool_result_content)
-
-                anthropic_messages.append(
+                    args = {"__raw_arguments__": args}
+
+                content_blocks.append(
                     {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": msg.get("tool_call_id"),
-                                "content": tool_result_content,
-                            }
-                        ],
+                        "type": "tool_use",
+                        "id": tool_call["id"],
+                        "name": func["name"],
+                        "input": args,
                     }
                 )
 
-        return system_prompt, anthropic_messages
+            return {"role": "assistant", "content": content_blocks}
+        if role == "tool":
+            # Ensure tool result content is a string
+            tool_result_content = content
+            if not isinstance(tool_result_content, str):
+                tool_result_content = json.dumps(tool_result_content)
+
+            return {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": msg.get("tool_call_id"),
+                        "content": tool_result_content,
+                    }
+                ],
+            }
+        return None
 
     def _convert_tools(self, tools: list[dict] | None) -> list[dict] | None:
-        """Convert OpenAI format tools to Anthropic format."""
+        """Convert OpenAI format tools to Anthropic format (memoized per tool set)."""
         if not tools:
             return None
+        return self._conversion_cache.tools(tools, self._convert_tool_set)
 
+    @staticmethod
+    def _convert_tool_set(tools: list[dict]) -> list[dict] | None:
         anthropic_tools = []
         for tool in tools:
             if tool.get("type") == "function":
@@ -183,7 +220,61 @@ class AnthropicModel(Model):
 
         return anthropic_tools if anthropic_tools else None
 
-    @retry_async(exceptions=ANTHROPIC_RETRYABLE)
+    def _apply_cache_breakpoints(
+        self,
+        system_prompt: str | None,
+        messages: list[dict],
+        tools: list[dict] | None,
+    ) -> tuple[str | list[dict] | None, list[dict], list[dict] | None]:
+        """
+        Mark the tool list, system prompt and trailing messages as cache breakpoints.
+
+        Returns copies; the given messages and tools are not modified.
+        """
+        budget = MAX_CACHE_BREAKPOINTS
+
+        if tools:
+            tools = [*tools[:-1], {**tools[-1], "cache_control": CACHE_CONTROL}]
+            budget -= 1
+
+        system: str | list[dict] | None = system_prompt
+        if system_prompt:
+            system = [{"type": "text", "text": system_prompt, "cache_control": CACHE_CONTROL}]
+            budget -= 1
+
+        remaining = min(self.cache_message_breakpoints, budget)
+        if remaining:
+            messages = list(messages)
+            for i in range(len(messages) - 1, -1, -1):
+                if not remaining:
+                    break
+                marked = self._mark_message(messages[i])
+                if marked is not None:
+                    messages[i] = marked
+                    remaining -= 1
+
+        return system, messages, tools
+
+    @staticmethod
+    def _mark_message(message: dict) -> dict | None:
+        """Copy of message with a breakpoint on its last cacheable block (None if none)."""
+        content = message.get("content")
+        if isinstance(content, str):
+            if not content:
+                return None
+            blocks = [{"type": "text", "text": content}]
+        elif isinstance(content, list):
+            blocks = list(content)
+        else:
+            return None
+
+        # Thinking blocks cannot carry cache_control
+        for i in range(len(blocks) - 1, -1, -1):
+            if blocks[i].get("type") not in ("thinking", "redacted_thinking"):
+                blocks[i] = {**blocks[i], "cache_control": CACHE_CONTROL}
+                return {**message, "content": blocks}
+        return None
+
     async def arun_stream(
         self,
         messages: list[dict],
@@ -192,6 +283,10 @@ class AnthropicModel(Model):
         """
         Call Anthropic API and return standardized streaming output.
 
+        Connection errors, rate limits and 5xx (including overloaded) responses
+        are retried until the first chunk arrives (then failed over to
+        fallback_model, if set).
+
         Args:
             messages: OpenAI format message list
             tools: OpenAI format tool definitions
@@ -201,6 +296,11 @@ class AnthropicModel(Model):
         """
         system_prompt, anthropic_messages = self._convert_messages(messages)
         anthropic_tools = self._convert_tools(tools)
+        system: str | list[dict] | None = system_prompt
+        if self.prompt_caching:
+            system, anthropic_messages, anthropic_tools = self._apply_cache_breakpoints(
+                system_prompt, anthropic_messages, anthropic_tools
+            )
 
         actual_model = self.model_name or self.name
         params = {
@@ -211,8 +311,8 @@ class AnthropicModel(Model):
             "stream": True,
         }
 
-        if system_prompt:
-            params["system"] = system_prompt
+        if system:
+            params["system"] = system
 
         if self.top_p is not None:
             params["top_p"] = self.top_p
@@ -220,30 +320,43 @@ class AnthropicModel(Model):
         if anthropic_tools:
             params["tools"] = anthropic_tools
 
-        logger.info(
-            "llm_request",
+        log_llm_request(
+            logger,
+            params,
             model=actual_model,
             messages_count=len(anthropic_messages),
             tools_count=len(anthropic_tools) if anthropic_tools else 0,
             temperature=self.temperature,
             max_tokens=params["max_tokens"],
-            detail=json.dumps(params, indent=2, ensure_ascii=False),
         )
 
-        try:
-            stream = await self.client.messages.create(**params)
-        except Exception as e:
-            logger.error(
-                "llm_request_failed",
-                model=actual_model,
-                error=str(e),
-                error_type=type(e).__name__,
-                messages_count=len(anthropic_messages),
-                tools_count=len(anthropic_tools) if anthropic_tools else 0,
-                exc_info=True,
-            )
-            raise
-
+        async def open_stream(model: str) -> AsyncIterator[StreamChunk]:
+            try:
+                stream = await self.client.messages.create(**{**params, "model": model})
+            except Exception as e:
+                logger.error(
+                    "llm_request_failed",
+                    model=model,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    messages_count=len(anthropic_messages),
+                    tools_count=len(anthropic_tools) if anthropic_tools else 0,
+                    exc_info=True,
+                )
+                raise
+            async for chunk in self._convert_stream(stream):
+                yield chunk
+
+        async for chunk in self._stream_with_retry(
+            open_stream,
+            actual_model,
+            ANTHROPIC_RETRYABLE,
+            estimated_tokens=estimate_request_tokens(messages, tools, params["max_tokens"]),
+        ):
+            yield chunk
+
+    async def _convert_stream(self, stream) -> AsyncIterator[StreamChunk]:
+        """Standardize Anthropic stream events."""
         # Track tool calls being built during streaming
         tool_calls_buffer = {}
         # Track usage
@@ -13,9 +13,27 @@ Does NOT handle:
 """
 
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, Any
+from typing import AsyncIterator, Any, Callable
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from agio.llm.hedging import (
+    HedgeStats,
+    LatencyTracker,
+    get_ttft_tracker,
+    hedged_stream,
+    time_first_chunk,
+)
+from agio.llm.rate_limit import (
+    ProviderRateLimiter,
+    RateLimitLease,
+    get_rate_limiter,
+    llm_request_scope_var,
+)
+from agio.utils.logging import get_logger
+from agio.utils.retry import StreamAttempts, retry_stream
+
+logger = get_logger(__name__)
 
 
 class StreamChunk(BaseModel):
@@ -43,6 +61,21 @@ class StreamChunk(BaseModel):
     finish_reason: str | None = Field(
         default=None, description="Finish reason: stop, tool_calls, length, etc."
     )
+    retry_count: int | None = Field(
+        default=None,
+        description="Failed attempts before the stream started (first chunk only)",
+    )
+    fallback_model: str | None = Field(
+        default=None,
+        description="Model that served the stream after failover (first chunk only)",
+    )
+    hedge_count: int | None = Field(
+        default=None,
+        description="Hedge requests started before the stream started (first chunk only)",
+    )
+    hedge_won: bool | None = Field(
+        default=None, description="Whether a hedge request served the stream (first chunk only)"
+    )
 
 
 class Model(BaseModel, ABC):
@@ -60,6 +93,33 @@ class Model(BaseModel, ABC):
     max_tokens: int | None = Field(default=None, ge=1)
     top_p: float | None = Field(default=None, ge=0.0, le=1.0)
 
+    max_retries: int = Field(
+        default=3, ge=1, description="Attempts per model before the stream starts"
+    )
+    fallback_model: str | None = Field(
+        default=None, description="Model name to fail over to when retries run out"
+    )
+
+    # Hedging: a second request when the first chunk is slow (opt-in)
+    hedging: bool = Field(default=False, description="Hedge requests slow to start")
+    hedge_percentile: float = Field(
+        default=95.0, ge=50.0, le=99.9, description="Time-to-first-token percentile to hedge at"
+    )
+    hedge_delay: float = Field(
+        default=2.0, gt=0.0, description="Hedge delay (seconds) until enough samples exist"
+    )
+    hedge_min_delay: float = Field(
+        default=0.1, ge=0.0, description="Lower bound of the hedge delay (seconds)"
+    )
+    hedge_model: str | None = Field(
+        default=None, description="Model name for hedge requests (default: same model)"
+    )
+
+    # Client-side limits shared per account (None = AGIO_LLM_* settings)
+    requests_per_minute: int | None = Field(default=None, ge=0)
+    tokens_per_minute: int | None = Field(default=None, ge=0)
+    _rate_limiter: ProviderRateLimiter | None = PrivateAttr(default=None)
+
     model_config = ConfigDict(arbitrary_types_allowed=True, extra="allow")
 
     def model_post_init(self, __context) -> None:
@@ -84,5 +144,131 @@ class Model(BaseModel, ABC):
         """
         pass
 
+    def _use_rate_limiter(self, base_url: str | None, api_key: str | None) -> None:
+        """Share the rate limiter of the account behind base_url and api_key."""
+        self._rate_limiter = get_rate_limiter(
+            base_url,
+            api_key,
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute,
+        )
+
+    async def _stream_with_retry(
+        self,
+        open_stream: Callable[[str], AsyncIterator[StreamChunk]],
+        model: str,
+        exceptions: tuple[type[Exception], ...],
+        estimated_tokens: int = 0,
+    ) -> AsyncIterator[StreamChunk]:
+        """
+        Run open_stream(model) with retry before the first chunk and failover.
+
+        Every attempt first waits for the account's rate limiter. With hedging,
+        an attempt slow to produce its first chunk is hedged (see
+        agio.llm.hedging). The first chunk carries retry_count, fallback_model
+        and hedge_count / hedge_won when the stream needed them.
+        """
+        limiter = self._rate_limiter
+        if limiter is not None and not limiter.enabled:
+            limiter = None
+
+        hedges = HedgeStats()
+        if self.hedging:
+            tracker = get_ttft_tracker(f"{self.id}:{model}")
+            timed = time_first_chunk(open_stream, tracker)
+            open_stream = self._hedged(timed, limiter, estimated_tokens, tracker, hedges)
+        elif limiter is not None:
+            open_stream = self._rate_limited(open_stream, limiter, estimated_tokens)
+
+        attempts = StreamAttempts(model=model)
+        first = True
+        async for chunk in retry_stream(
+            open_stream,
+            model=model,
+            fallback_model=self.fallback_model,
+            max_attempts=self.max_retries,
+            exceptions=exceptions,
+            attempts=attempts,
+        ):
+            if first:
+                first = False
+                chunk.retry_count = attempts.retries or None
+                if attempts.failed_over:
+                    chunk.fallback_model = attempts.model
+                if hedges.hedges:
+                    chunk.hedge_count = hedges.hedges
+                    chunk.hedge_won = hedges.hedge_won
+            yield chunk
+
+    def _hedged(
+        self,
+        open_stream: Callable[[str], AsyncIterator[StreamChunk]],
+        limiter: ProviderRateLimiter | None,
+        estimated_tokens: int,
+        tracker: LatencyTracker,
+        hedges: HedgeStats,
+    ) -> Callable[[str], AsyncIterator[StreamChunk]]:
+        primary = (
+            self._rate_limited(open_stream, limiter, estimated_tokens)
+            if limiter is not None
+            else open_stream
+        )
+
+        def open_hedge(model: str) -> AsyncIterator[StreamChunk] | None:
+            # Only with budget to spare: hedges must not cause 429s or delay others
+            if limiter is None:
+                return open_stream(model)
+            lease = limiter.try_acquire(estimated_tokens)
+            if lease is None:
+                logger.debug("llm_hedge_skipped", model=model, reason="rate_limit")
+                return None
+            return self._settled(open_stream(model), lease)
+
+        async def hedged(model: str) -> AsyncIterator[StreamChunk]:
+            delay = tracker.percentile(self.hedge_percentile) or self.hedge_delay
+            async for chunk in hedged_stream(
+                primary,
+                model=model,
+                delay=max(delay, self.hedge_min_delay),
+                open_hedge=open_hedge,
+                hedge_model=self.hedge_model,
+                stats=hedges,
+            ):
+                yield chunk
+
+        return hedged
+
+    @staticmethod
+    def _rate_limited(
+        open_stream: Callable[[str], AsyncIterator[StreamChunk]],
+        limiter: ProviderRateLimiter,
+        estimated_tokens: int,
+    ) -> Callable[[str], AsyncIterator[StreamChunk]]:
+        async def limited(model: str) -> AsyncIterator[StreamChunk]:
+            scope = llm_request_scope_var.get()
+            lease = await limiter.acquire(
+                estimated_tokens,
+                session_id=scope.session_id if scope else None,
+                interactive=scope.interactive if scope else True,
+            )
+            async for chunk in Model._settled(open_stream(model), lease):
+                yield chunk
+
+        return limited
+
+    @staticmethod
+    async def _settled(
+        stream: AsyncIterator[StreamChunk], lease: RateLimitLease
+    ) -> AsyncIterator[StreamChunk]:
+        """Iterate stream, then settle lease with its actual usage."""
+        total_tokens = None
+        try:
+            async for chunk in stream:
+                if chunk.usage and chunk.usage.get("total_tokens"):
+                    total_tokens = chunk.usage["total_tokens"]
+                yield chunk
+        finally:
+            lease.settle(total_tokens)
+
 
 __all__ = ["Model", "StreamChunk"]
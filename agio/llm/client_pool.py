@@ -0,0 +1,153 @@
+"""
+LLM client pool - SDK clients shared across model instances.
+
+Models calling the same endpoint with the same credentials share one SDK
+client, and with it one HTTP connection pool (HTTP/2 when the h2 package is
+installed, keep-alive either way). The pool is process-wide, so models
+rebuilt on a config reload reuse warm connections instead of opening new
+ones with fresh TLS handshakes.
+
+Connection limits and timeouts come from the AGIO_LLM_HTTP_* settings.
+SDK clients are built with max_retries=0: Model._stream_with_retry is the only
+retry layer, so a failing request is not retried by the SDK as well.
+close_llm_clients() closes every pooled client; the API calls it on shutdown.
+
+Usage:
+    client = get_llm_client(AsyncOpenAI, base_url=base_url, api_key=api_key)
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any, TypeVar
+
+import httpx
+
+from agio.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+C = TypeVar("C")
+
+# (client class, base_url, api key hash, extra kwargs) -> client
+_clients: dict[tuple[Any, str, str, str], Any] = {}
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _sdk_module(client_cls: Any) -> ModuleType | None:
+    """Package of an OpenAI/Anthropic SDK client class (None for other classes)."""
+    package = str(getattr(client_cls, "__module__", "")).partition(".")[0]
+    module = sys.modules.get(package)
+    return module if hasattr(module, "DefaultAsyncHttpxClient") else None
+
+
+def _timeout(sdk: ModuleType | None = None) -> Any:
+    from agio.config import settings
+
+    timeout_cls = sdk.Timeout if sdk is not None else httpx.Timeout
+    return timeout_cls(
+        settings.llm_http_read_timeout, connect=settings.llm_http_connect_timeout
+    )
+
+
+def create_http_client(client_cls: Any = None) -> Any:
+    """
+    Create an HTTP client configured by the AGIO_LLM_HTTP_* settings.
+
+    For an SDK client class, the HTTP client comes from that SDK's own httpx
+    package (newer SDK releases reject clients from a different one).
+    """
+    from agio.config import settings
+
+    http2 = settings.llm_http2 and _http2_available()
+    if settings.llm_http2 and not http2:
+        logger.debug("llm_http2_unavailable", hint="pip install 'httpx[http2]'")
+
+    sdk = _sdk_module(client_cls)
+    if sdk is not None:
+        client_factory = sdk.DefaultAsyncHttpxClient
+        limits_cls = type(sdk.DEFAULT_CONNECTION_LIMITS)
+    else:
+        client_factory = httpx.AsyncClient
+        limits_cls = httpx.Limits
+
+    return client_factory(
+        http2=http2,
+        limits=limits_cls(
+            max_connections=settings.llm_http_max_connections,
+            max_keepalive_connections=settings.llm_http_max_keepalive_connections,
+            keepalive_expiry=settings.llm_http_keepalive_expiry,
+        ),
+        timeout=_timeout(sdk),
+        follow_redirects=True,
+    )
+
+
+def get_llm_client(
+    client_cls: type[C],
+    *,
+    base_url: str | None = None,
+    api_key: str | None = None,
+    **kwargs: Any,
+) -> C:
+    """
+    Get the shared SDK client for an endpoint and API key, creating it once.
+
+    Args:
+        client_cls: SDK client class (e.g. AsyncOpenAI, AsyncAnthropic)
+        base_url: API base URL (None = SDK default)
+        api_key: API key
+        **kwargs: Extra client arguments; callers passing different ones get
+            different clients
+
+    Returns:
+        Client instance shared by every caller with the same arguments
+    """
+    key_hash = hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+    extra = repr(sorted(kwargs.items()))
+    key = (client_cls, base_url or "", key_hash, extra)
+    client = _clients.get(key)
+    if client is None:
+        sdk = _sdk_module(client_cls)
+        if base_url:
+            kwargs["base_url"] = base_url
+        # The SDKs pass their own default timeout with every request
+        kwargs.setdefault("timeout", _timeout(sdk))
+        if sdk is not None:
+            # Retries happen in Model._stream_with_retry, not in the SDK
+            kwargs.setdefault("max_retries", 0)
+        client = client_cls(
+            api_key=api_key, http_client=create_http_client(client_cls), **kwargs
+        )
+        _clients[key] = client
+        logger.debug(
+            "llm_client_created",
+            client=getattr(client_cls, "__name__", str(client_cls)),
+            base_url=base_url,
+            pooled=len(_clients),
+        )
+    return client
+
+
+async def close_llm_clients() -> None:
+    """Close every pooled client and its connections."""
+    clients = list(_clients.values())
+    _clients.clear()
+    await asyncio.gather(*(_close(client) for client in clients))
+    if clients:
+        logger.info("llm_clients_closed", count=len(clients))
+
+
+async def _close(client: Any) -> None:
+    try:
+        await client.close()
+    except Exception as e:
+        logger.warning("llm_client_close_failed", error=str(e))
+
+
+__all__ = ["close_llm_clients", "create_http_client", "get_llm_client"]
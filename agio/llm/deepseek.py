@@ -5,11 +5,14 @@ DeepSeek API is compatible with OpenAI format.
 """
 
 import os
+from functools import partial
 from typing import AsyncIterator
 
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, PrivateAttr
 
 from agio.llm.base import StreamChunk
+from agio.llm.client_pool import get_llm_client
+from agio.llm.message_cache import ConversionCache
 from agio.llm.openai import OpenAIModel
 
 
@@ -27,6 +30,8 @@ class DeepseekModel(OpenAIModel):
     name: str = Field(default="deepseek-chat")
     base_url: str | None = Field(default=None)
 
+    _conversion_cache: ConversionCache = PrivateAttr(default_factory=ConversionCache)
+
     def model_post_init(self, __context) -> None:
         """Override to use DeepSeek-specific API key and base URL."""
         from agio.config import settings
@@ -48,14 +53,14 @@ class DeepseekModel(OpenAIModel):
             or "https://api.deepseek.com"
         )
 
-        # Create client
+        # Share the pooled client unless one is provided
         if self.client is None:
             from openai import AsyncOpenAI
 
-            self.client = AsyncOpenAI(
-                api_key=resolved_api_key,
-                base_url=resolved_base_url,
+            self.client = get_llm_client(
+                AsyncOpenAI, base_url=resolved_base_url, api_key=resolved_api_key
             )
+        self._use_rate_limiter(resolved_base_url, resolved_api_key)
 
         # Call grandparent's model_post_init (skip OpenAIModel to avoid double client init)
         from agio.llm.base import Model
@@ -92,29 +97,33 @@ class DeepseekModel(OpenAIModel):
         last_message = messages[-1]
         is_new_turn = last_message.get("role") == "user"
 
-        # Create a copy to avoid modifying the original
+        # Only assistant messages change; their rewrites are memoized, and all
+        # other messages are passed through unchanged
+        variant = (is_new_turn, is_thinking_mode)
+        rewrite = partial(self._rewrite_assistant_message, variant=variant)
         processed_messages = []
-
-        for i, msg in enumerate(messages):
-            msg_copy = msg.copy()
-
-            # Only process assistant messages
-            if msg_copy.get("role") == "assistant":
-                if is_new_turn:
-                    # New turn: remove reasoning_content from history messages
-                    # (per DeepSeek docs: only include content, not reasoning_content in history)
-                    if "reasoning_content" in msg_copy:
-                        del msg_copy["reasoning_content"]
-                else:
-                    # Same turn: preserve reasoning_content if present
-                    # If thinking mode and reasoning_content not present, set to None
-                    if is_thinking_mode and "reasoning_content" not in msg_copy:
-                        msg_copy["reasoning_content"] = None
-
-            processed_messages.append(msg_copy)
+        for msg in messages:
+            if msg.get("role") == "assistant":
+                msg = self._conversion_cache.message(msg, rewrite, variant)
+            processed_messages.append(msg)
 
         return processed_messages
 
+    @staticmethod
+    def _rewrite_assistant_message(msg: dict, variant: tuple[bool, bool]) -> dict:
+        """Copy of an assistant message with reasoning_content set as the mode requires."""
+        is_new_turn, is_thinking_mode = variant
+        if is_new_turn:
+            # New turn: remove reasoning_content from history messages
+            # (per DeepSeek docs: only include content, not reasoning_content in history)
+            if "reasoning_content" in msg:
+                msg = {k: v for k, v in msg.items() if k != "reasoning_content"}
+        elif is_thinking_mode and "reasoning_content" not in msg:
+            # Same turn: preserve reasoning_content if present
+            # If thinking mode and reasoning_content not present, set to None
+            msg = {**msg, "reasoning_content": None}
+        return msg
+
     async def arun_stream(
         self,
         messages: list[dict],
@@ -0,0 +1,234 @@
+"""
+Request hedging - a second request when the first is slow to start streaming.
+
+Time to first token has a long tail: most requests start streaming quickly,
+a few take several times the median. With hedging enabled on a model, a
+request that has not produced its first chunk after the hedge delay gets a
+second, identical request (optionally to another model). The first of the
+two streams to produce a chunk is used; the other is cancelled.
+
+The hedge delay is a percentile (hedge_percentile) of the time to first
+token recently observed for the model, so only the slow tail is hedged.
+Until enough samples are collected, a fixed delay is used.
+
+A hedge is only started when the account's rate limiter has budget for it
+right away; it never queues behind, or takes budget from, other requests.
+
+Usage:
+    tracker = get_ttft_tracker("openai/gpt-4o")
+    async for chunk in hedged_stream(
+        open_stream,
+        model="gpt-4o",
+        delay=tracker.percentile(95) or 2.0,
+        open_hedge=open_hedge,
+    ):
+        ...
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from agio.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_WINDOW = 200
+DEFAULT_MIN_SAMPLES = 20
+
+
+class LatencyTracker:
+    """Rolling window of latencies (seconds) with percentile lookup."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW, min_samples: int = DEFAULT_MIN_SAMPLES) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, p: float) -> float | None:
+        """p-th percentile (nearest rank), None until min_samples are recorded."""
+        if len(self._samples) < max(self.min_samples, 1):
+            return None
+        ordered = sorted(self._samples)
+        rank = math.ceil(p / 100 * len(ordered))
+        return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+# Time to first token per model, shared by all instances of a model
+_ttft_trackers: dict[str, LatencyTracker] = {}
+
+
+def get_ttft_tracker(key: str) -> LatencyTracker:
+    """Get the time-to-first-token tracker for a model key (e.g. "openai/gpt-4o")."""
+    tracker = _ttft_trackers.get(key)
+    if tracker is None:
+        tracker = _ttft_trackers[key] = LatencyTracker()
+    return tracker
+
+
+@dataclass
+class HedgeStats:
+    """Filled in by hedged_stream: hedges started and whether one served."""
+
+    hedges: int = 0
+    hedge_won: bool = False
+
+
+async def _first(stream: AsyncIterator[T]) -> tuple[bool, T | None]:
+    try:
+        return True, await anext(stream)
+    except StopAsyncIteration:
+        return False, None
+
+
+async def _aclose(stream: AsyncIterator[Any]) -> None:
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+async def _discard(task: "asyncio.Task[Any]", stream: AsyncIterator[Any]) -> None:
+    """Cancel a losing stream and release its connection."""
+    task.cancel()
+    try:
+        await task
+    except BaseException:
+        pass
+    try:
+        await _aclose(stream)
+    except Exception as e:
+        logger.debug("hedge_close_failed", error=str(e))
+
+
+async def hedged_stream(
+    open_stream: Callable[[str], AsyncIterator[T]],
+    *,
+    model: str,
+    delay: float,
+    open_hedge: Callable[[str], AsyncIterator[T] | None],
+    hedge_model: str | None = None,
+    stats: HedgeStats | None = None,
+) -> AsyncIterator[T]:
+    """
+    Iterate open_stream(model), hedged with a second stream after delay.
+
+    Args:
+        open_stream: Starts the primary stream for a model name
+        model: Model name of the primary stream
+        delay: Seconds to wait for the first item before hedging
+        open_hedge: Starts the hedge stream for a model name; returns None
+            when no hedge may be started (e.g. no rate limit budget)
+        hedge_model: Model name for the hedge (default: model)
+        stats: Filled in with the hedge count and outcome (optional)
+
+    Yields:
+        Items of the stream that produced the first item
+
+    Raises:
+        The primary stream's error if every started stream fails before
+        its first item
+    """
+    stats = stats or HedgeStats()
+    primary = open_stream(model)
+    pending = {asyncio.ensure_future(_first(primary)): primary}
+    winner: AsyncIterator[T] | None = None
+    primary_error: BaseException | None = None
+    last_error: BaseException | None = None
+    hedge_started = False
+
+    try:
+        while pending:
+            done, _ = await asyncio.wait(
+                pending,
+                timeout=None if hedge_started else delay,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                # Slow first chunk: hedge once, if allowed
+                hedge_started = True
+                hedge = open_hedge(hedge_model or model)
+                if hedge is not None:
+                    stats.hedges += 1
+                    pending[asyncio.ensure_future(_first(hedge))] = hedge
+                    logger.info(
+                        "llm_request_hedged",
+                        model=model,
+                        hedge_model=hedge_model or model,
+                        delay=round(delay, 3),
+                    )
+                continue
+
+            for task in done:
+                stream = pending.pop(task)
+                try:
+                    produced, item = task.result()
+                except Exception as e:
+                    last_error = e
+                    if stream is primary:
+                        primary_error = e
+                    continue
+                winner = stream
+                stats.hedge_won = stream is not primary
+                break
+            if winner is not None:
+                break
+            # The primary failed before the hedge delay: let the caller retry
+            if not hedge_started and primary_error is not None:
+                break
+    finally:
+        for task, stream in pending.items():
+            await _discard(task, stream)
+
+    if winner is None:
+        raise primary_error or last_error  # type: ignore[misc]
+    if stats.hedge_won:
+        logger.info("llm_hedge_won", model=model, hedge_model=hedge_model or model)
+
+    try:
+        if produced:
+            yield item  # type: ignore[misc]
+            async for item in winner:
+                yield item
+    finally:
+        await _aclose(winner)
+
+
+def time_first_chunk(
+    open_stream: Callable[[str], AsyncIterator[T]], tracker: LatencyTracker
+) -> Callable[[str], AsyncIterator[T]]:
+    """Wrap open_stream to record each stream's time to first item in tracker."""
+
+    async def timed(model: str) -> AsyncIterator[T]:
+        started = time.monotonic()
+        stream = open_stream(model)
+        first = True
+        try:
+            async for item in stream:
+                if first:
+                    first = False
+                    tracker.record(time.monotonic() - started)
+                yield item
+        finally:
+            await _aclose(stream)
+
+    return timed
+
+
+__all__ = [
+    "HedgeStats",
+    "LatencyTracker",
+    "get_ttft_tracker",
+    "hedged_stream",
+    "time_first_chunk",
+]
@@ -0,0 +1,118 @@
+"""
+Message conversion cache - translate each message once per model.
+
+The agent loop sends the same growing message list on every step: the list is
+appended to, and the message dicts already in it are reused as-is. Providers
+that translate the OpenAI format into their own (Anthropic) or rewrite it
+(DeepSeek thinking mode) therefore only need to convert the appended messages.
+
+ConversionCache memoizes per-message results by identity. An entry holds a
+reference to its source message, so the id cannot be reused by another object
+while the entry lives. Like the snapshot encoder, it relies on messages not
+being modified in place once sent.
+
+Tool schemas are memoized by a hash of the schema set, with an identity fast
+path for the executor's schema list, which is the same object on every step.
+
+Usage:
+    converted = cache.message(msg, convert_message)
+    tools = cache.tools(tools, convert_tools)
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_MESSAGES = 4096
+DEFAULT_MAX_TOOL_SETS = 16
+
+
+def hash_tools(tools: list[dict[str, Any]]) -> str:
+    """Stable hash of a tool schema set."""
+    body = json.dumps(tools, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()[:32]
+
+
+class ConversionCache:
+    """Bounded LRU memo of per-message and per-tool-set conversions."""
+
+    def __init__(
+        self,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+        max_tool_sets: int = DEFAULT_MAX_TOOL_SETS,
+    ) -> None:
+        self._max_messages = max_messages
+        self._max_tool_sets = max_tool_sets
+        # (id(message), variant) -> (message, converted)
+        self._messages: OrderedDict[tuple[int, Hashable], tuple[dict, Any]] = OrderedDict()
+        # tools hash -> converted
+        self._tool_sets: OrderedDict[str, Any] = OrderedDict()
+        self._last_tools: tuple[list[dict], Any] | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def message(
+        self,
+        message: dict[str, Any],
+        convert: Callable[[dict[str, Any]], T],
+        variant: Hashable = None,
+    ) -> T:
+        """
+        Convert a message, or return its earlier conversion.
+
+        Args:
+            message: Source message (OpenAI format)
+            convert: Conversion, called only on a cache miss
+            variant: Distinguishes conversions of the same message that
+                depend on more than the message itself
+
+        Returns:
+            Converted message (shared between calls; do not modify)
+        """
+        key = (id(message), variant)
+        entry = self._messages.get(key)
+        if entry is not None and entry[0] is message:
+            self._messages.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        converted = convert(message)
+        self._messages[key] = (message, converted)
+        self._messages.move_to_end(key)
+        while len(self._messages) > self._max_messages:
+            self._messages.popitem(last=False)
+        return converted
+
+    def tools(
+        self,
+        tools: list[dict[str, Any]],
+        convert: Callable[[list[dict[str, Any]]], T],
+    ) -> T:
+        """Convert a tool schema set, or return the conversion of an equal set."""
+        if self._last_tools is not None and self._last_tools[0] is tools:
+            return self._last_tools[1]
+
+        key = hash_tools(tools)
+        if key in self._tool_sets:
+            self._tool_sets.move_to_end(key)
+            converted = self._tool_sets[key]
+        else:
+            converted = convert(tools)
+            self._tool_sets[key] = converted
+            while len(self._tool_sets) > self._max_tool_sets:
+                self._tool_sets.popitem(last=False)
+        self._last_tools = (tools, converted)
+        return converted
+
+    def clear(self) -> None:
+        self._messages.clear()
+        self._tool_sets.clear()
+        self._last_tools = None
+
+
+__all__ = ["ConversionCache", "hash_tools"]
@@ -0,0 +1,338 @@
+"""
+Mock LLM providers - deterministic, token-free streams for load testing.
+
+Two models stand in for a real provider, so the agent loop, storage, tracing
+and SSE can be benchmarked offline under realistic streaming shapes:
+
+- SyntheticModel (provider: synthetic) generates text, reasoning and tool
+  calls with configurable time-to-first-token, inter-token latency, chunk
+  size and tool-call rate
+- ReplayModel (provider: replay) replays the assistant responses recorded in
+  a session, exported with GET /agio/sessions/{id}/steps
+
+Both are deterministic: the same request produces the same stream. For the
+third mode, an OpenAI-compatible HTTP stub that exercises the real client
+path, see agio.llm.mock_server.
+
+Provider-specific fields are set through the model config's options:
+
+    type: model
+    name: load-test
+    provider: synthetic
+    model_name: synthetic
+    options:
+      ttft_ms: 400
+      inter_token_ms: 15
+      tool_call_rate: 0.5
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+from pydantic import Field, PrivateAttr
+
+from agio.llm.base import Model, StreamChunk
+from agio.llm.rate_limit import estimate_request_tokens
+from agio.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_WORDS = (
+    "the agent reads the file and checks each result before it writes a short "
+    "summary of what changed in the code so the next step can run the tests "
+    "against the new version and report any error it finds in the output"
+).split()
+
+
+class MockModel(Model):
+    """
+    Base of the mock models: paces a response like a streaming provider.
+
+    A response is split into chunks of chunk_tokens tokens (a token is about
+    one word, or four characters of tool arguments). The first chunk arrives
+    after ttft_ms, every further chunk inter_token_ms per token later; jitter
+    varies each delay by up to that fraction.
+    """
+
+    ttft_ms: float = Field(default=300.0, ge=0.0, description="Time to first token")
+    inter_token_ms: float = Field(default=20.0, ge=0.0, description="Delay per token")
+    chunk_tokens: int = Field(default=1, ge=1, description="Tokens per chunk")
+    jitter: float = Field(default=0.0, ge=0.0, le=1.0, description="Random delay variation")
+    seed: int = Field(default=0, description="Seed of the deterministic generator")
+
+    def _rng(self, messages: list[dict]) -> random.Random:
+        """Generator seeded by the request, so equal requests stream alike."""
+        last = messages[-1] if messages else {}
+        key = f"{self.seed}:{len(messages)}:{last.get('role')}:{last.get('content')}"
+        return random.Random(hashlib.sha256(key.encode("utf-8")).digest())
+
+    async def _pause(self, rng: random.Random, ms: float) -> None:
+        if self.jitter:
+            ms *= 1 + self.jitter * (2 * rng.random() - 1)
+        # Always yield to the event loop, like a network read would
+        await asyncio.sleep(max(ms, 0.0) / 1000)
+
+    async def _stream_response(
+        self,
+        rng: random.Random,
+        *,
+        messages: list[dict],
+        tools: list[dict] | None,
+        content: str | None = None,
+        reasoning_content: str | None = None,
+        tool_calls: list[dict] | None = None,
+        usage: dict[str, Any] | None = None,
+        ttft_ms: float | None = None,
+        inter_token_ms: float | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a complete response in paced chunks, ending with usage."""
+        from agio.domain.models import normalize_usage_metrics
+
+        ttft_ms = self.ttft_ms if ttft_ms is None else ttft_ms
+        inter_token_ms = self.inter_token_ms if inter_token_ms is None else inter_token_ms
+
+        pieces: list[StreamChunk] = []
+        pieces += [StreamChunk(reasoning_content=p) for p in self._split_words(reasoning_content)]
+        pieces += [StreamChunk(content=p) for p in self._split_words(content)]
+        for index, call in enumerate(tool_calls or []):
+            function = call["function"]
+            pieces.append(
+                StreamChunk(
+                    tool_calls=[
+                        {
+                            "index": index,
+                            "id": call["id"],
+                            "type": "function",
+                            "function": {"name": function["name"], "arguments": ""},
+                        }
+                    ]
+                )
+            )
+            for part in self._split_chars(function.get("arguments") or ""):
+                pieces.append(
+                    StreamChunk(tool_calls=[{"index": index, "function": {"arguments": part}}])
+                )
+
+        for i, chunk in enumerate(pieces):
+            await self._pause(rng, ttft_ms if i == 0 else inter_token_ms * self.chunk_tokens)
+            yield chunk
+
+        if usage is None:
+            output = sum(len((c.content or c.reasoning_content or "").split()) for c in pieces)
+            output += sum(
+                len(json.dumps(c.tool_calls)) // 4 for c in pieces if c.tool_calls
+            )
+            usage = {
+                "prompt_tokens": estimate_request_tokens(messages, tools),
+                "completion_tokens": output,
+            }
+            usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        yield StreamChunk(
+            usage=normalize_usage_metrics(usage),
+            finish_reason="tool_calls" if tool_calls else "stop",
+        )
+
+    def _split_words(self, text: str | None) -> list[str]:
+        if not text:
+            return []
+        words = text.split(" ")
+        size = self.chunk_tokens
+        pieces = [" ".join(words[i : i + size]) for i in range(0, len(words), size)]
+        return [p if i == len(pieces) - 1 else p + " " for i, p in enumerate(pieces)]
+
+    def _split_chars(self, text: str) -> list[str]:
+        size = 4 * self.chunk_tokens
+        return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class SyntheticModel(MockModel):
+    """
+    Generates synthetic responses for load testing.
+
+    With tools available, a response is a round of tool calls with probability
+    tool_call_rate, at most max_tool_rounds rounds in a row since the last
+    user message; otherwise it is text of about output_tokens tokens.
+    """
+
+    output_tokens: int = Field(default=200, ge=1, description="Tokens of a text response")
+    reasoning_tokens: int = Field(default=0, ge=0, description="Reasoning tokens per response")
+    tool_call_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    parallel_tool_calls: int = Field(default=1, ge=1, description="Tool calls per round")
+    max_tool_rounds: int = Field(default=3, ge=0, description="Tool rounds per user turn")
+
+    async def arun_stream(
+        self,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        rng = self._rng(messages)
+
+        tool_calls = None
+        if (
+            tools
+            and self._tool_rounds(messages) < self.max_tool_rounds
+            and rng.random() < self.tool_call_rate
+        ):
+            tool_calls = [
+                self._tool_call(rng, rng.choice(tools), len(messages), i)
+                for i in range(self.parallel_tool_calls)
+            ]
+
+        async for chunk in self._stream_response(
+            rng,
+            messages=messages,
+            tools=tools,
+            content=None if tool_calls else self._text(rng, self.output_tokens),
+            reasoning_content=self._text(rng, self.reasoning_tokens),
+            tool_calls=tool_calls,
+        ):
+            yield chunk
+
+    @staticmethod
+    def _tool_rounds(messages: list[dict]) -> int:
+        rounds = 0
+        for message in reversed(messages):
+            if message.get("role") == "user":
+                break
+            if message.get("role") == "assistant" and message.get("tool_calls"):
+                rounds += 1
+        return rounds
+
+    @staticmethod
+    def _text(rng: random.Random, tokens: int) -> str | None:
+        if not tokens:
+            return None
+        return " ".join(rng.choice(_WORDS) for _ in range(tokens))
+
+    @classmethod
+    def _tool_call(cls, rng: random.Random, tool: dict, turn: int, index: int) -> dict:
+        function = tool.get("function", {})
+        schema = function.get("parameters") or {}
+        arguments = {
+            name: cls._sample(rng, prop)
+            for name, prop in (schema.get("properties") or {}).items()
+            if name in (schema.get("required") or [])
+        }
+        return {
+            "id": f"call_mock_{turn}_{index}",
+            "type": "function",
+            "function": {
+                "name": function.get("name", "unknown"),
+                "arguments": json.dumps(arguments, ensure_ascii=False),
+            },
+        }
+
+    @classmethod
+    def _sample(cls, rng: random.Random, prop: dict) -> Any:
+        """Plausible value for a JSON schema property."""
+        if prop.get("enum"):
+            return rng.choice(prop["enum"])
+        kind = prop.get("type")
+        if isinstance(kind, list):
+            kind = next((k for k in kind if k != "null"), "string")
+        if kind == "integer":
+            return rng.randint(prop.get("minimum", 1), prop.get("maximum", 10))
+        if kind == "number":
+            return round(rng.uniform(prop.get("minimum", 0), prop.get("maximum", 1)), 3)
+        if kind == "boolean":
+            return rng.random() < 0.5
+        if kind == "array":
+            return [cls._sample(rng, prop.get("items") or {})]
+        if kind == "object":
+            return {}
+        return " ".join(rng.choice(_WORDS) for _ in range(3))
+
+
+class ReplayModel(MockModel):
+    """
+    Replays the assistant responses recorded in a session.
+
+    replay_path is a session's steps as returned by GET /agio/sessions/{id}/steps
+    (or a JSON list / JSON Lines file of steps). The n-th request of a
+    conversation (n = assistant messages already in it) gets the n-th recorded
+    assistant step, wrapping around. With replay_timing, the recorded
+    time-to-first-token and duration set the pace.
+    """
+
+    replay_path: str = Field(description="File of recorded session steps")
+    replay_runnable_id: str | None = Field(
+        default=None, description="Only replay steps of this agent"
+    )
+    replay_timing: bool = Field(default=True, description="Use the recorded latencies")
+
+    _responses: list[dict] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, __context) -> None:
+        """Load the recorded responses (fails early on a missing or empty file)."""
+        steps = self._load_steps(Path(self.replay_path))
+        self._responses = [
+            step
+            for step in steps
+            if step.get("role") == "assistant"
+            and (self.replay_runnable_id is None or step.get("runnable_id") == self.replay_runnable_id)
+        ]
+        if not self._responses:
+            raise ValueError(f"No assistant steps to replay in {self.replay_path}")
+        logger.info("replay_model_loaded", path=self.replay_path, responses=len(self._responses))
+        super().model_post_init(__context)
+
+    @staticmethod
+    def _load_steps(path: Path) -> list[dict]:
+        text = path.read_text(encoding="utf-8")
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            return [json.loads(line) for line in text.splitlines() if line.strip()]
+        if isinstance(data, dict):
+            data = data.get("items") or data.get("steps") or []
+        return sorted(data, key=lambda step: step.get("sequence", 0))
+
+    async def arun_stream(
+        self,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        turn = sum(1 for message in messages if message.get("role") == "assistant")
+        step = self._responses[turn % len(self._responses)]
+        metrics = step.get("metrics") or {}
+
+        ttft_ms = inter_token_ms = None
+        if self.replay_timing and metrics.get("first_token_latency_ms") is not None:
+            ttft_ms = metrics["first_token_latency_ms"]
+            output = metrics.get("output_tokens")
+            duration = metrics.get("duration_ms")
+            if output and duration and duration > ttft_ms:
+                inter_token_ms = (duration - ttft_ms) / output
+
+        usage = None
+        if metrics.get("input_tokens") is not None:
+            # Recorded usage is already normalized (input includes cache reads)
+            output = metrics.get("output_tokens") or 0
+            usage = {
+                "input_tokens": metrics["input_tokens"],
+                "output_tokens": output,
+                "total_tokens": metrics.get("total_tokens") or metrics["input_tokens"] + output,
+                "cache_read_tokens": metrics.get("cache_read_tokens"),
+                "cache_creation_tokens": metrics.get("cache_creation_tokens"),
+            }
+
+        async for chunk in self._stream_response(
+            self._rng(messages),
+            messages=messages,
+            tools=tools,
+            content=step.get("content"),
+            reasoning_content=step.get("reasoning_content"),
+            tool_calls=step.get("tool_calls"),
+            usage=usage,
+            ttft_ms=ttft_ms,
+            inter_token_ms=inter_token_ms,
+        ):
+            yield chunk
+
+
+__all__ = ["MockModel", "ReplayModel", "SyntheticModel"]
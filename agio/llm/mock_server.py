@@ -0,0 +1,178 @@
+"""
+Mock LLM server - a local OpenAI-compatible HTTP stub for load testing.
+
+Serves POST /v1/chat/completions (streaming and non-streaming) from a
+SyntheticModel or ReplayModel, so a load test exercises the real provider
+path (OpenAIModel, HTTP client pool, retries) without calling a real API.
+Point a model at it with provider: openai and base_url: http://host:port/v1.
+
+Usage:
+    python -m agio.llm.mock_server --port 8901 --ttft-ms 300 --tool-call-rate 0.3
+    python -m agio.llm.mock_server --replay session_steps.json
+"""
+
+import argparse
+import json
+import time
+import uuid
+from typing import Any, AsyncIterator
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from agio.llm.base import Model, StreamChunk
+from agio.llm.mock import ReplayModel, SyntheticModel
+
+
+def _openai_usage(usage: dict[str, Any]) -> dict[str, Any]:
+    result = {
+        "prompt_tokens": usage.get("input_tokens") or 0,
+        "completion_tokens": usage.get("output_tokens") or 0,
+        "total_tokens": usage.get("total_tokens") or 0,
+    }
+    if usage.get("cache_read_tokens"):
+        result["prompt_tokens_details"] = {"cached_tokens": usage["cache_read_tokens"]}
+    return result
+
+
+def _delta(chunk: StreamChunk) -> dict[str, Any]:
+    delta: dict[str, Any] = {}
+    if chunk.content is not None:
+        delta["content"] = chunk.content
+    if chunk.reasoning_content is not None:
+        delta["reasoning_content"] = chunk.reasoning_content
+    if chunk.tool_calls is not None:
+        delta["tool_calls"] = chunk.tool_calls
+    return delta
+
+
+def create_mock_app(model: Model) -> FastAPI:
+    """
+    Create the OpenAI-compatible stub app.
+
+    Args:
+        model: Mock model producing the responses
+
+    Returns:
+        FastAPI app
+    """
+    app = FastAPI(title="Agio mock LLM")
+
+    @app.get("/v1/models")
+    async def list_models() -> dict:
+        return {"object": "list", "data": [{"id": model.name, "object": "model"}]}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        messages = body.get("messages") or []
+        tools = body.get("tools")
+        name = body.get("model") or model.name
+        completion_id = f"chatcmpl-mock-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+
+        if body.get("stream"):
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+
+            async def events() -> AsyncIterator[str]:
+                async for chunk in model.arun_stream(messages, tools=tools):
+                    base = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": created,
+                        "model": name,
+                    }
+                    delta = _delta(chunk)
+                    if delta or chunk.finish_reason:
+                        choice = {
+                            "index": 0,
+                            "delta": delta,
+                            "finish_reason": chunk.finish_reason,
+                        }
+                        yield f"data: {json.dumps({**base, 'choices': [choice]})}\n\n"
+                    if chunk.usage and include_usage:
+                        payload = {**base, "choices": [], "usage": _openai_usage(chunk.usage)}
+                        yield f"data: {json.dumps(payload)}\n\n"
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        content: list[str] = []
+        reasoning: list[str] = []
+        tool_calls: dict[int, dict] = {}
+        usage: dict[str, Any] = {}
+        finish_reason = "stop"
+        async for chunk in model.arun_stream(messages, tools=tools):
+            content.append(chunk.content or "")
+            reasoning.append(chunk.reasoning_content or "")
+            for delta in chunk.tool_calls or []:
+                call = tool_calls.setdefault(
+                    delta["index"],
+                    {"id": delta.get("id"), "type": "function", "function": {"name": "", "arguments": ""}},
+                )
+                function = delta.get("function") or {}
+                call["function"]["name"] += function.get("name") or ""
+                call["function"]["arguments"] += function.get("arguments") or ""
+            usage = chunk.usage or usage
+            finish_reason = chunk.finish_reason or finish_reason
+
+        message: dict[str, Any] = {"role": "assistant", "content": "".join(content) or None}
+        if any(reasoning):
+            message["reasoning_content"] = "".join(reasoning)
+        if tool_calls:
+            message["tool_calls"] = [tool_calls[i] for i in sorted(tool_calls)]
+        return JSONResponse(
+            {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": name,
+                "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+                "usage": _openai_usage(usage),
+            }
+        )
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OpenAI-compatible mock LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8901)
+    parser.add_argument("--replay", help="Session steps file to replay (default: synthetic)")
+    parser.add_argument("--ttft-ms", type=float, default=300.0)
+    parser.add_argument("--inter-token-ms", type=float, default=20.0)
+    parser.add_argument("--chunk-tokens", type=int, default=1)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--output-tokens", type=int, default=200)
+    parser.add_argument("--reasoning-tokens", type=int, default=0)
+    parser.add_argument("--tool-call-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pacing = {
+        "ttft_ms": args.ttft_ms,
+        "inter_token_ms": args.inter_token_ms,
+        "chunk_tokens": args.chunk_tokens,
+        "jitter": args.jitter,
+        "seed": args.seed,
+    }
+    if args.replay:
+        model: Model = ReplayModel(id="replay/mock", name="mock", replay_path=args.replay, **pacing)
+    else:
+        model = SyntheticModel(
+            id="synthetic/mock",
+            name="mock",
+            output_tokens=args.output_tokens,
+            reasoning_tokens=args.reasoning_tokens,
+            tool_call_rate=args.tool_call_rate,
+            **pacing,
+        )
+
+    import uvicorn
+
+    uvicorn.run(create_mock_app(model), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
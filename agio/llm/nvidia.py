@@ -10,6 +10,7 @@ from typing import AsyncIterator
 from pydantic import ConfigDict, Field
 
 from agio.llm.base import StreamChunk
+from agio.llm.client_pool import get_llm_client
 from agio.llm.openai import OpenAIModel
 
 
@@ -48,14 +49,14 @@ class NvidiaModel(OpenAIModel):
             or "https://integrate.api.nvidia.com/v1"
         )
 
-        # Create client
+        # Share the pooled client unless one is provided
         if self.client is None:
             from openai import AsyncOpenAI
 
-            self.client = AsyncOpenAI(
-                api_key=resolved_api_key,
-                base_url=resolved_base_url,
+            self.client = get_llm_client(
+                AsyncOpenAI, base_url=resolved_base_url, api_key=resolved_api_key
             )
+        self._use_rate_limiter(resolved_base_url, resolved_api_key)
 
         # Call grandparent's model_post_init (skip OpenAIModel to avoid double client init)
         from agio.llm.base import Model
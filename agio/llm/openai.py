@@ -2,7 +2,6 @@
 OpenAI Model implementation - Pure LLM Interface
 """
 
-import json
 import os
 from typing import AsyncIterator
 
@@ -20,8 +19,10 @@ except ImportError:
     raise ImportError("Please install openai package: pip install openai")
 
 from agio.llm.base import Model, StreamChunk
+from agio.llm.client_pool import get_llm_client
+from agio.llm.rate_limit import estimate_request_tokens
+from agio.llm.request_log import log_llm_request
 from agio.utils.logging import get_logger
-from agio.utils.retry import retry_async
 
 logger = get_logger(__name__)
 
@@ -72,16 +73,15 @@ class OpenAIModel(Model):
             self.base_url or settings.openai_base_url or os.getenv("OPENAI_BASE_URL")
         )
 
-        # Create client if not provided
+        # Share the pooled client unless one is provided
         if self.client is None:
-            self.client = AsyncOpenAI(
-                api_key=resolved_api_key,
-                base_url=resolved_base_url,
+            self.client = get_llm_client(
+                AsyncOpenAI, base_url=resolved_base_url, api_key=resolved_api_key
             )
+        self._use_rate_limiter(resolved_base_url, resolved_api_key)
 
         super().model_post_init(__context)
 
-    @retry_async(exceptions=OPENAI_RETRYABLE)
     async def arun_stream(
         self,
         messages: list[dict],
@@ -90,6 +90,9 @@ class OpenAIModel(Model):
         """
         Call OpenAI API and return standardized streaming output.
 
+        Connection errors, rate limits and 5xx responses are retried until the
+        first chunk arrives (then failed over to fallback_model, if set).
+
         Args:
             messages: OpenAI format message list
             tools: OpenAI format tool definitions
@@ -115,30 +118,45 @@ class OpenAIModel(Model):
         if tools:
             params["tools"] = tools
 
-        logger.info(
-            "llm_request",
+        log_llm_request(
+            logger,
+            params,
             model=actual_model,
             messages_count=len(messages),
             tools_count=len(tools) if tools else 0,
             temperature=self.temperature,
             max_tokens=self.max_tokens,
-            detail=json.dumps(params, indent=2, ensure_ascii=False),
         )
 
-        try:
-            stream = await self.client.chat.completions.create(**params)
-        except Exception as e:
-            logger.error(
-                "llm_request_failed",
-                model=actual_model,
-                error=str(e),
-                error_type=type(e).__name__,
-                messages_count=len(messages),
-                tools_count=len(tools) if tools else 0,
-                exc_info=True,
-            )
-            raise
-
+        async def open_stream(model: str) -> AsyncIterator[StreamChunk]:
+            try:
+                stream = await self.client.chat.completions.create(
+                    **{**params, "model": model}
+                )
+            except Exception as e:
+                logger.error(
+                    "llm_request_failed",
+                    model=model,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    messages_count=len(messages),
+                    tools_count=len(tools) if tools else 0,
+                    exc_info=True,
+                )
+                raise
+            async for chunk in self._convert_stream(stream):
+                yield chunk
+
+        async for chunk in self._stream_with_retry(
+            open_stream,
+            actual_model,
+            OPENAI_RETRYABLE,
+            estimated_tokens=estimate_request_tokens(messages, tools, self.max_tokens),
+        ):
+            yield chunk
+
+    async def _convert_stream(self, stream) -> AsyncIterator[StreamChunk]:
+        """Standardize OpenAI stream chunks."""
         async for chunk in stream:
             stream_chunk = StreamChunk()
 
@@ -0,0 +1,406 @@
+"""
+Provider rate limiting - client-side request and token budgets.
+
+Model instances that share an API account (same base_url and API key) share
+one ProviderRateLimiter, so concurrent sessions stay under the provider's
+requests-per-minute and tokens-per-minute limits instead of running into 429s.
+
+- Each request takes one request from the RPM bucket and its estimated tokens
+  (input estimate + max_tokens) from the TPM bucket
+- When the stream ends, the estimate is corrected with the actual usage
+- Waiting requests are served interactive first (top-level runs before nested
+  sub-agent runs), then round-robin across sessions, then in arrival order
+
+The session and priority of a request come from llm_request_scope(), which the
+agent executor sets around each LLM call.
+
+Usage:
+    limiter = get_rate_limiter(base_url, api_key, requests_per_minute=500)
+    lease = await limiter.acquire(estimated_tokens=1200, session_id="sess_123")
+    ...
+    lease.settle(actual_tokens=1100)
+"""
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import json
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from agio.utils.logging import get_logger
+from agio.utils.tokens import estimate_tokens
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class LLMRequestScope:
+    """Who an LLM request is made for."""
+
+    session_id: str | None = None
+    interactive: bool = True  # False for nested sub-agent runs
+
+
+llm_request_scope_var: ContextVar[LLMRequestScope | None] = ContextVar(
+    "llm_request_scope", default=None
+)
+
+
+@contextmanager
+def llm_request_scope(
+    session_id: str | None = None, *, interactive: bool = True
+) -> Iterator[LLMRequestScope]:
+    """Attribute LLM requests made inside the block to a session and priority."""
+    scope = LLMRequestScope(session_id=session_id, interactive=interactive)
+    token = llm_request_scope_var.set(scope)
+    try:
+        yield scope
+    finally:
+        llm_request_scope_var.reset(token)
+
+
+def estimate_request_tokens(
+    messages: list[dict], tools: list[dict] | None = None, max_tokens: int | None = None
+) -> int:
+    """Rough token cost of a request (estimate_tokens per message, plus max_tokens)."""
+    tokens = sum(estimate_tokens(message) for message in messages)
+    if tools:
+        tokens += len(json.dumps(tools, ensure_ascii=False, default=str)) // 4
+    return tokens + (max_tokens or 0)
+
+
+class TokenBucket:
+    """Continuously refilled bucket holding up to per_minute units."""
+
+    def __init__(self, per_minute: int, tokens: float | None = None) -> None:
+        self.capacity = float(per_minute)
+        self._rate = per_minute / 60.0
+        self._tokens = self.capacity if tokens is None else min(tokens, self.capacity)
+        self._updated = time.monotonic()
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def delay(self, amount: float) -> float:
+        """Seconds until amount (capped at capacity) can be taken."""
+        self._refill()
+        missing = min(amount, self.capacity) - self._tokens
+        return missing / self._rate if missing > 0 else 0.0
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self._tokens -= amount
+
+    def adjust(self, amount: float) -> None:
+        """Return (positive) or charge (negative) units after the fact."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + amount)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+@dataclass
+class RateLimiterStats:
+    """Rate limiter counters."""
+
+    requests: int = 0
+    throttled: int = 0  # Requests that had to wait
+    waiting: int = 0
+    wait_seconds: float = 0.0
+    estimated_tokens: int = 0
+    actual_tokens: int = 0
+    available_requests: float | None = None
+    available_tokens: float | None = None
+
+
+@dataclass
+class RateLimitLease:
+    """A granted request; settle() corrects the token estimate with real usage."""
+
+    limiter: "ProviderRateLimiter | None"
+    estimated_tokens: int
+    settled: bool = False
+
+    def settle(self, actual_tokens: int | None = None) -> None:
+        """Account actual usage (None keeps the estimate). Idempotent."""
+        if self.settled:
+            return
+        self.settled = True
+        if self.limiter is not None and actual_tokens is not None:
+            self.limiter._settle(self.estimated_tokens, actual_tokens)
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    round: int
+    seq: int
+    session_id: str | None = field(compare=False)
+    tokens: int = field(compare=False)
+
+
+class ProviderRateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute budgets for one API account.
+
+    Limits of 0 mean unlimited; with both at 0 acquire() returns at once.
+    """
+
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._waiters: list[_Waiter] = []
+        self._queued_by_session: Counter[tuple[int, str | None]] = Counter()
+        self._seq = itertools.count()
+        self._changed = asyncio.Condition()
+        self._stats = RateLimiterStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self._requests is not None or self._tokens is not None
+
+    def set_limits(
+        self, requests_per_minute: int | None = None, tokens_per_minute: int | None = None
+    ) -> None:
+        """
+        Change the limits (None keeps a limit as is).
+
+        Budget already used stays used: a bucket keeps its current level,
+        capped at the new capacity.
+        """
+        changed = False
+        if requests_per_minute is not None and requests_per_minute != self.requests_per_minute:
+            self.requests_per_minute = requests_per_minute
+            self._requests = self._resized(self._requests, requests_per_minute)
+            changed = True
+        if tokens_per_minute is not None and tokens_per_minute != self.tokens_per_minute:
+            self.tokens_per_minute = tokens_per_minute
+            self._tokens = self._resized(self._tokens, tokens_per_minute)
+            changed = True
+        if changed:
+            logger.info(
+                "llm_rate_limits_changed",
+                requests_per_minute=self.requests_per_minute,
+                tokens_per_minute=self.tokens_per_minute,
+            )
+            if self._waiters:
+                # Waiters sleep until the old refill time; let them recheck now
+                asyncio.ensure_future(self._notify())
+
+    async def acquire(
+        self,
+        estimated_tokens: int,
+        *,
+        session_id: str | None = None,
+        interactive: bool = True,
+    ) -> RateLimitLease:
+        """
+        Wait until the request fits both budgets and take it from them.
+
+        Args:
+            estimated_tokens: Expected tokens of the request (input + output)
+            session_id: Session the request belongs to (for fair queuing)
+            interactive: Whether a user is waiting on the request directly
+
+        Returns:
+            RateLimitLease to settle with the actual usage
+        """
+        self._stats.requests += 1
+        self._stats.estimated_tokens += estimated_tokens
+        if not self.enabled:
+            return RateLimitLease(limiter=None, estimated_tokens=estimated_tokens)
+
+        started = time.monotonic()
+        throttled = False
+
+        async with self._changed:
+            # Within a priority, a session's n-th queued request goes behind
+            # every session's (n-1)-th
+            priority = 0 if interactive else 1
+            queue_key = (priority, session_id)
+            waiter = _Waiter(
+                priority=priority,
+                round=self._queued_by_session[queue_key],
+                seq=next(self._seq),
+                session_id=session_id,
+                tokens=estimated_tokens,
+            )
+            self._queued_by_session[queue_key] += 1
+            heapq.heappush(self._waiters, waiter)
+            try:
+                while True:
+                    delay = None
+                    if self._waiters[0] is waiter:
+                        delay = self._delay(waiter.tokens)
+                        if delay <= 0:
+                            heapq.heappop(self._waiters)
+                            self._take(waiter.tokens)
+                            break
+                    # The head waits for refill; the others for the head
+                    throttled = True
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                # Cancelled while queued: let the next waiter move up
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                raise
+            finally:
+                self._queued_by_session[queue_key] -= 1
+                if not self._queued_by_session[queue_key]:
+                    del self._queued_by_session[queue_key]
+                self._changed.notify_all()
+
+        if throttled:
+            waited = time.monotonic() - started
+            self._stats.throttled += 1
+            self._stats.wait_seconds += waited
+            logger.debug(
+                "llm_rate_limited",
+                session_id=session_id,
+                interactive=interactive,
+                waited=round(waited, 3),
+                estimated_tokens=estimated_tokens,
+            )
+        return RateLimitLease(limiter=self, estimated_tokens=estimated_tokens)
+
+    def try_acquire(self, estimated_tokens: int) -> RateLimitLease | None:
+        """
+        Take a request only if it fits both budgets now and nobody is waiting.
+
+        For optional requests (hedges): they never wait and never go ahead
+        of queued requests.
+
+        Returns:
+            RateLimitLease, or None if the request would have to wait
+        """
+        if self.enabled and (self._waiters or self._delay(estimated_tokens) > 0):
+            return None
+        self._stats.requests += 1
+        self._stats.estimated_tokens += estimated_tokens
+        if not self.enabled:
+            return RateLimitLease(limiter=None, estimated_tokens=estimated_tokens)
+        self._take(estimated_tokens)
+        return RateLimitLease(limiter=self, estimated_tokens=estimated_tokens)
+
+    def stats(self) -> RateLimiterStats:
+        """Counters and currently available budget."""
+        return RateLimiterStats(
+            requests=self._stats.requests,
+            throttled=self._stats.throttled,
+            waiting=len(self._waiters),
+            wait_seconds=self._stats.wait_seconds,
+            estimated_tokens=self._stats.estimated_tokens,
+            actual_tokens=self._stats.actual_tokens,
+            available_requests=self._requests.available if self._requests else None,
+            available_tokens=self._tokens.available if self._tokens else None,
+        )
+
+    def _delay(self, tokens: int) -> float:
+        delay = 0.0
+        if self._requests is not None:
+            delay = max(delay, self._requests.delay(1))
+        if self._tokens is not None:
+            delay = max(delay, self._tokens.delay(tokens))
+        return delay
+
+    def _take(self, tokens: int) -> None:
+        if self._requests is not None:
+            self._requests.take(1)
+        if self._tokens is not None:
+            self._tokens.take(tokens)
+
+    def _settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        self._stats.actual_tokens += actual_tokens
+        if self._tokens is not None:
+            self._tokens.adjust(estimated_tokens - actual_tokens)
+
+    @staticmethod
+    def _resized(bucket: TokenBucket | None, per_minute: int) -> TokenBucket | None:
+        if not per_minute:
+            return None
+        return TokenBucket(per_minute, tokens=bucket.available if bucket else None)
+
+    async def _notify(self) -> None:
+        async with self._changed:
+            self._changed.notify_all()
+
+
+# Limiters shared by all models using the same account
+_rate_limiters: dict[tuple[str, str], ProviderRateLimiter] = {}
+
+
+def get_rate_limiter(
+    base_url: str | None,
+    api_key: str | None,
+    *,
+    requests_per_minute: int | None = None,
+    tokens_per_minute: int | None = None,
+) -> ProviderRateLimiter:
+    """
+    Get the limiter shared by models calling base_url with api_key.
+
+    Limits default to AGIO_LLM_REQUESTS_PER_MINUTE / AGIO_LLM_TOKENS_PER_MINUTE
+    when the limiter is created. Limits given explicitly are applied to an
+    existing limiter too, so the latest configuration of an account wins.
+    """
+    from agio.config import settings
+
+    key_hash = hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+    key = (base_url or "", key_hash)
+    limiter = _rate_limiters.get(key)
+    if limiter is None:
+        limiter = ProviderRateLimiter(
+            requests_per_minute=(
+                settings.llm_requests_per_minute
+                if requests_per_minute is None
+                else requests_per_minute
+            ),
+            tokens_per_minute=(
+                settings.llm_tokens_per_minute
+                if tokens_per_minute is None
+                else tokens_per_minute
+            ),
+        )
+        _rate_limiters[key] = limiter
+    else:
+        limiter.set_limits(requests_per_minute, tokens_per_minute)
+    return limiter
+
+
+def get_rate_limiter_stats() -> dict[str, Any]:
+    """Stats of every enabled limiter, keyed by base URL and API key hash."""
+    return {
+        f"{base_url or 'default'}#{key_hash}": limiter.stats()
+        for (base_url, key_hash), limiter in _rate_limiters.items()
+        if limiter.enabled
+    }
+
+
+__all__ = [
+    "LLMRequestScope",
+    "ProviderRateLimiter",
+    "RateLimitLease",
+    "RateLimiterStats",
+    "TokenBucket",
+    "estimate_request_tokens",
+    "get_rate_limiter",
+    "get_rate_limiter_stats",
+    "llm_request_scope",
+    "llm_request_scope_var",
+]
@@ -0,0 +1,161 @@
+"""
+LLM request logging - cheap by default, full payloads on demand.
+
+Every LLM call logs one INFO line with the request metadata plus a hash and
+size of the request payload, so identical requests can be correlated without
+putting message histories into the log. Beyond that, for a sampled share of
+requests (AGIO_LLM_LOG_SAMPLE_RATE):
+
+- at DEBUG, the payload with long strings truncated (AGIO_LLM_LOG_MAX_FIELD_CHARS)
+- the full payload, one JSON line per request, to a rotating gzip-compressed
+  file (AGIO_LLM_PAYLOAD_LOG_PATH); written from a background thread
+
+Nothing is serialized unless one of these outputs is enabled, and
+serialization uses the compact (C-accelerated) JSON encoder.
+
+Usage:
+    log_llm_request(logger, params, model="gpt-4o", messages_count=12)
+"""
+
+import atexit
+import gzip
+import hashlib
+import json
+import logging
+import os
+import queue
+import random
+import shutil
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any
+
+
+def _is_enabled(log: Any, level: int) -> bool:
+    check = getattr(log, "isEnabledFor", None) or getattr(log, "is_enabled_for", None)
+    return True if check is None else bool(check(level))
+
+
+def truncate_payload(value: Any, max_chars: int) -> Any:
+    """Copy of value with strings longer than max_chars cut (and their length noted)."""
+    if isinstance(value, str):
+        if len(value) <= max_chars:
+            return value
+        return f"{value[:max_chars]}... [{len(value)} chars]"
+    if isinstance(value, dict):
+        return {key: truncate_payload(item, max_chars) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [truncate_payload(item, max_chars) for item in value]
+    return value
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+class PayloadSink:
+    """
+    Rotating, gzip-compressed file of full LLM request payloads.
+
+    Records go through a queue to a background thread, so writing never
+    blocks the event loop.
+    """
+
+    def __init__(self, path: str, max_bytes: int, backup_count: int) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        handler = RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+        handler.namer = lambda name: f"{name}.gz"
+        handler.rotator = _gzip_rotator
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._listener = QueueListener(self._queue, handler)
+        self._logger = logging.Logger("agio.llm.payloads")
+        self._logger.addHandler(QueueHandler(self._queue))
+        self._listener.start()
+
+    def write(self, payload_hash: str, fields: dict[str, Any], payload: str) -> None:
+        """Queue one payload record (payload is already-serialized JSON)."""
+        meta = json.dumps(
+            {"ts": time.time(), "payload_hash": payload_hash, **fields},
+            ensure_ascii=False,
+            default=str,
+        )
+        self._logger.info('%s, "payload": %s}', meta[:-1], payload)
+
+    def close(self) -> None:
+        """Flush queued records and stop the writer thread."""
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+
+
+# Global payload sink (None when AGIO_LLM_PAYLOAD_LOG_PATH is not set)
+_payload_sink: PayloadSink | None = None
+_payload_sink_resolved = False
+
+
+def get_payload_sink() -> PayloadSink | None:
+    """Get the global payload sink configured by AGIO_LLM_PAYLOAD_LOG_*."""
+    global _payload_sink, _payload_sink_resolved
+    if not _payload_sink_resolved:
+        from agio.config import settings
+
+        _payload_sink_resolved = True
+        if settings.llm_payload_log_path:
+            _payload_sink = PayloadSink(
+                settings.llm_payload_log_path,
+                max_bytes=settings.llm_payload_log_max_bytes,
+                backup_count=settings.llm_payload_log_backup_count,
+            )
+            atexit.register(_payload_sink.close)
+    return _payload_sink
+
+
+def log_llm_request(log: Any, params: dict[str, Any], **fields: Any) -> None:
+    """
+    Log an LLM request as configured by the AGIO_LLM_LOG_* settings.
+
+    Args:
+        log: Logger of the calling model module
+        params: Request payload as sent to the provider
+        **fields: Request metadata for the log line (model, counts, ...)
+    """
+    from agio.config import settings
+
+    info = _is_enabled(log, logging.INFO)
+    sampled = (
+        settings.llm_log_sample_rate > 0
+        and random.random() < settings.llm_log_sample_rate
+    )
+    debug = sampled and _is_enabled(log, logging.DEBUG)
+    sink = get_payload_sink() if sampled else None
+    if not (info or debug or sink):
+        return
+
+    payload = json.dumps(params, ensure_ascii=False, default=str)
+    encoded = payload.encode("utf-8")
+    payload_hash = hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+    if info:
+        log.info("llm_request", **fields, payload_hash=payload_hash, payload_bytes=len(encoded))
+    if debug:
+        log.debug(
+            "llm_request_payload",
+            payload_hash=payload_hash,
+            detail=truncate_payload(params, settings.llm_log_max_field_chars),
+        )
+    if sink is not None:
+        sink.write(payload_hash, fields, payload)
+
+
+__all__ = [
+    "PayloadSink",
+    "get_payload_sink",
+    "log_llm_request",
+    "truncate_payload",
+]
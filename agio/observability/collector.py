@@ -9,7 +9,8 @@ from typing import TYPE_CHECKING, Any, AsyncIterator
 from uuid import uuid4
 
 from agio.domain.events import StepEvent, StepEventType
-from agio.domain.models import Step
+from agio.domain.models import Step, StepMetrics
+from agio.domain.snapshots import resolve_llm_context
 from agio.observability.trace import Span, SpanKind, SpanStatus, Trace
 from agio.utils.logging import get_logger
 
@@ -19,6 +20,13 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def _cache_hit_rate(metrics: StepMetrics) -> float | None:
+    """Share of the input tokens of an LLM call read from the prompt cache."""
+    if not metrics.input_tokens:
+        return None
+    return (metrics.cache_read_tokens or 0) / metrics.input_tokens
+
+
 class TraceCollector:
     """
     Trace collector - constructs Trace from StepEvent stream.
@@ -80,11 +88,19 @@ class TraceCollector:
         # Assistant Step cache: map tool_call_id -> Assistant Step (for extracting tool input args)
         assistant_step_cache: dict[str, "Step"] = {}  # tool_call_id -> Assistant Step
 
+        # LLM context snapshots: llm_snapshot_id -> Assistant Step (for delta resolution)
+        llm_snapshots: dict[str, "Step"] = {}
+
         try:
             async for event in event_stream:
                 # Process event and update trace (including nested events)
                 current_span, updated_cache = self._process_event(
-                    event, trace, span_stack, current_span, assistant_step_cache
+                    event,
+                    trace,
+                    span_stack,
+                    current_span,
+                    assistant_step_cache,
+                    llm_snapshots,
                 )
                 if updated_cache:
                     assistant_step_cache.update(updated_cache)
@@ -143,6 +159,7 @@ class TraceCollector:
         span_stack: dict[str, Span],
         current_span: Span | None,
         assistant_step_cache: dict[str, "Step"],
+        llm_snapshots: dict[str, "Step"] | None = None,
     ) -> tuple[Span | None, dict[str, "Step"]]:
         """
         Process single event, return currently active span and updated assistant_step_cache.
@@ -332,6 +349,9 @@ class TraceCollector:
                 # LLM 调用 Span - 使用 Step 的时间戳和上下文
                 from datetime import timezone
 
+                if llm_snapshots is not None and step.llm_snapshot_id:
+                    llm_snapshots[step.llm_snapshot_id] = step
+
                 start_time = (
                     step.metrics.exec_start_at
                     if step.metrics and step.metrics.exec_start_at
@@ -406,7 +426,7 @@ class TraceCollector:
                     output_preview=step.content[: self.PREVIEW_LENGTH]
                     if step.content
                     else None,
-                    llm_details=self._build_llm_details(step),
+                    llm_details=self._build_llm_details(step, llm_snapshots),
                 )
 
                 if step.metrics:
@@ -416,10 +436,15 @@ class TraceCollector:
                         "tokens.total": step.metrics.total_tokens,
                         "tokens.cache_read": step.metrics.cache_read_tokens,
                         "tokens.cache_creation": step.metrics.cache_creation_tokens,
+                        "tokens.cache_hit_rate": _cache_hit_rate(step.metrics),
                         "first_token_ms": step.metrics.first_token_latency_ms,
                         "duration_ms": duration_ms,
                         "model": step.metrics.model_name,
                         "provider": step.metrics.provider,
+                        "retries": step.metrics.retry_count,
+                        "fallback_model": step.metrics.fallback_model,
+                        "hedges": step.metrics.hedge_count,
+                        "hedge_won": step.metrics.hedge_won,
                     }
 
                 if span.end_time:
@@ -517,15 +542,23 @@ class TraceCollector:
 
         return details
 
-    def _build_llm_details(self, step) -> dict[str, Any]:
+    def _build_llm_details(
+        self, step, llm_snapshots: dict[str, "Step"] | None = None
+    ) -> dict[str, Any]:
         """Build complete LLM call details from Step."""
-        if not step.llm_messages:
+        if not step.llm_messages and not step.llm_parent_snapshot_id:
             return {}
 
+        # Assistant Steps carry delta-encoded messages; rebuild the full request
+        messages, tools = step.llm_messages, step.llm_tools
+        if step.llm_parent_snapshot_id or (tools is None and step.llm_tools_hash):
+            resolved_messages, tools = resolve_llm_context(step, llm_snapshots or {})
+            messages = resolved_messages if resolved_messages is not None else messages
+
         details: dict[str, Any] = {
             "request": step.llm_request_params or {},
-            "messages": step.llm_messages,
-            "tools": step.llm_tools,
+            "messages": messages,
+            "tools": tools,
             "response_content": step.content,
             "response_tool_calls": step.tool_calls,
             "finish_reason": getattr(step, "finish_reason", None),
@@ -542,6 +575,7 @@ class TraceCollector:
                 "total_tokens": step.metrics.total_tokens,
                 "cache_read_tokens": step.metrics.cache_read_tokens,
                 "cache_creation_tokens": step.metrics.cache_creation_tokens,
+                "cache_hit_rate": _cache_hit_rate(step.metrics),
             }
 
         return details
@@ -195,6 +195,7 @@ class Trace(BaseModel):
     total_tool_calls: int = 0
     total_cache_read_tokens: int = 0
     total_cache_creation_tokens: int = 0
+    total_input_tokens: int = 0
     max_depth: int = 0
 
     # === Input/Output ===
@@ -213,9 +214,17 @@ class Trace(BaseModel):
                 self.total_tokens += span.metrics.get("tokens.total", 0) or span.metrics.get("total_tokens", 0)
                 self.total_cache_read_tokens += span.metrics.get("tokens.cache_read", 0) or span.metrics.get("cache_read_tokens", 0)
                 self.total_cache_creation_tokens += span.metrics.get("tokens.cache_creation", 0) or span.metrics.get("cache_creation_tokens", 0)
+                self.total_input_tokens += span.metrics.get("tokens.input", 0) or span.metrics.get("input_tokens", 0)
         elif span.kind == SpanKind.TOOL_CALL:
             self.total_tool_calls += 1
 
+    @property
+    def cache_hit_rate(self) -> float | None:
+        """Share of LLM input tokens read from the prompt cache"""
+        if not self.total_input_tokens:
+            return None
+        return self.total_cache_read_tokens / self.total_input_tokens
+
     def complete(
         self,
         status: SpanStatus = SpanStatus.OK,
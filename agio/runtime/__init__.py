@@ -5,12 +5,20 @@ This module contains:
 - RunnableExecutor: Unified Run lifecycle management for all Runnable types
 - ResumeExecutor: Unified Session Resume mechanism for Agent
 - Wire: Event streaming channel
+- RunManager: Background runs with admission control, attachable by run_id
 - EventFactory: Context-bound event factory
 """
 
 from agio.runtime.control import AbortSignal, fork_session
 from agio.runtime.event_factory import EventFactory
 from agio.runtime.protocol import ExecutionContext, Runnable, RunnableType, RunOutput
+from agio.runtime.run_manager import (
+    ActiveRun,
+    RunAdmissionError,
+    RunManager,
+    RunManagerStats,
+    get_run_manager,
+)
 from agio.runtime.runnable_executor import RunnableExecutor
 from agio.runtime.runnable_tool import (
     CircularReferenceError,
@@ -18,7 +26,7 @@ from agio.runtime.runnable_tool import (
     RunnableTool,
     as_tool,
 )
-from agio.runtime.wire import Wire
+from agio.runtime.wire import Wire, WirePolicy, WireStats, WireSubscription
 
 __all__ = [
     "Runnable",
@@ -26,7 +34,15 @@ __all__ = [
     "RunOutput",
     "ExecutionContext",
     "RunnableExecutor",
+    "RunManager",
+    "RunManagerStats",
+    "RunAdmissionError",
+    "ActiveRun",
+    "get_run_manager",
     "Wire",
+    "WirePolicy",
+    "WireStats",
+    "WireSubscription",
     "RunnableTool",
     "as_tool",
     "CircularReferenceError",
@@ -171,7 +171,8 @@ async def fork_session(
         new_step = step.model_copy(update=update_fields)
         new_steps.append(new_step)
 
-    # 5. Batch save to new session
+    # 5. Batch save to new session (never served from a stale cached context)
+    session_store.notify_session_changed(new_session_id)
     if new_steps:
         await session_store.save_steps_batch(new_steps)
 
@@ -178,6 +178,26 @@ class PermissionManager:
             timeout=timeout,
         )
 
+    def requires_consent(self, tool_name: str, context: ExecutionContext) -> bool:
+        """
+        Whether a call of this tool may have to wait for user consent.
+
+        Conservative counterpart of check_and_wait_consent steps 1-2: calls
+        without a user_id, or of tools configured with requires_consent, may
+        block on the user.
+
+        Args:
+            tool_name: Tool name
+            context: Execution context
+
+        Returns:
+            True if check_and_wait_consent may wait for a user decision
+        """
+        if not context.user_id:
+            return True
+        tool_config = self._get_tool_config(tool_name)
+        return bool(tool_config and tool_config.get("requires_consent", False))
+
     async def _request_consent(
         self,
         tool_call_id: str,
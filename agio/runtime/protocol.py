@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Protocol, runtime_checkable
 
-from agio.domain.models import RunMetrics
+from agio.domain.models import RunMetrics, RunStatus
 from agio.runtime.wire import Wire
 
 
@@ -37,6 +37,7 @@ class RunOutput:
     # Additional context
     termination_reason: str | None = None  # "max_steps", "max_iterations", etc.
     error: str | None = None
+    status: RunStatus | None = None  # Final Run status, set by RunnableExecutor
 
 
 @runtime_checkable
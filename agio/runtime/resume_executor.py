@@ -97,6 +97,9 @@ class ResumeExecutor:
             "resume_session_started", session_id=session_id, runnable_id=runnable_id
         )
 
+        # Steps may have changed outside of Agent.run since the session was cached
+        self.store.notify_session_changed(session_id)
+
         # 1. Load Steps
         steps = await self.store.get_steps(session_id, limit=10000)
         if not steps:
@@ -0,0 +1,336 @@
+"""
+RunManager - Background runs with admission control.
+
+A run started through the manager executes in a background task and writes
+to its own Wire (with event ids and a replay buffer). Readers attach to the
+wire by run_id, so a client that reconnects resumes the stream from the last
+event id it saw instead of restarting the run. Finished runs stay attachable
+for a linger period.
+
+Admission control caps how many runs execute at once, globally, per user and
+per runnable. Runs over a cap wait in a FIFO queue (status STARTING); when
+the queue is full, start() raises RunAdmissionError.
+
+Usage:
+    manager = get_run_manager()
+    active = manager.start(executor, agent, query, session_id="sess_123")
+
+    # Later, possibly from another request
+    active = manager.get(run_id)
+    async for event in active.wire.read():
+        ...
+
+    manager.abort(run_id, "User cancelled")
+"""
+
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from uuid import uuid4
+
+from agio.domain import RunStatus
+from agio.runtime.control import AbortSignal
+from agio.runtime.protocol import Runnable, RunOutput
+from agio.runtime.runnable_executor import RunnableExecutor
+from agio.runtime.wire import Wire
+from agio.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class RunAdmissionError(Exception):
+    """Raised when a run cannot be queued because the queue is full."""
+
+
+@dataclass
+class ActiveRun:
+    """A run queued, executing or recently finished in the background."""
+
+    run_id: str
+    runnable_id: str
+    session_id: str
+    user_id: str | None
+    wire: Wire
+    abort_signal: AbortSignal = field(default_factory=AbortSignal)
+    status: RunStatus = RunStatus.STARTING  # STARTING = waiting for admission
+    task: "asyncio.Task | None" = None
+    output: RunOutput | None = None
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.finished_at is not None
+
+
+@dataclass
+class RunManagerStats:
+    """Run admission counters."""
+
+    active: int = 0
+    queued: int = 0
+    rejected: int = 0
+    active_by_user: dict[str, int] = field(default_factory=dict)
+    active_by_runnable: dict[str, int] = field(default_factory=dict)
+
+
+class RunManager:
+    """
+    Registry of background runs, keyed by run_id, with admission control.
+
+    Limits of 0 mean unlimited. Runs are removed linger_seconds after they
+    finish.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int = 0,
+        max_per_user: int = 0,
+        max_per_runnable: int = 0,
+        max_queued: int = 0,
+        linger_seconds: float = 300.0,
+    ) -> None:
+        self._max_concurrent = max_concurrent
+        self._max_per_user = max_per_user
+        self._max_per_runnable = max_per_runnable
+        self._max_queued = max_queued
+        self._linger = linger_seconds
+        self._runs: dict[str, ActiveRun] = {}
+        self._queue: list[ActiveRun] = []
+        self._active = 0
+        self._by_user: Counter[str] = Counter()
+        self._by_runnable: Counter[str] = Counter()
+        self._rejected = 0
+        self._admission = asyncio.Condition()
+
+    def start(
+        self,
+        executor: RunnableExecutor,
+        runnable: Runnable,
+        input: str,
+        *,
+        session_id: str | None = None,
+        user_id: str | None = None,
+        metadata: dict | None = None,
+    ) -> ActiveRun:
+        """
+        Queue a run for background execution and register it.
+
+        Args:
+            executor: RunnableExecutor that manages the run lifecycle
+            runnable: The Runnable to execute
+            input: Input string
+            session_id: Session ID (auto-generated if not provided)
+            user_id: User ID (optional)
+            metadata: Additional metadata (optional)
+
+        Returns:
+            ActiveRun whose wire carries the run's events
+
+        Raises:
+            RunAdmissionError: If the run has to wait and max_queued runs
+                are already waiting
+        """
+        self._prune()
+        active = ActiveRun(
+            run_id=str(uuid4()),
+            runnable_id=runnable.id,
+            session_id=session_id or str(uuid4()),
+            user_id=user_id,
+            wire=Wire.from_settings(),
+        )
+        admitted = not self._queue and self._can_admit(active)
+        if admitted:
+            self._take_slot(active)
+        elif self._max_queued and len(self._queue) >= self._max_queued:
+            self._rejected += 1
+            raise RunAdmissionError(f"Run queue is full ({len(self._queue)} waiting runs)")
+        else:
+            self._queue.append(active)
+
+        active.task = asyncio.create_task(
+            self._run(active, executor, runnable, input, metadata, admitted)
+        )
+        self._runs[active.run_id] = active
+        return active
+
+    def get(self, run_id: str) -> ActiveRun | None:
+        """Get a queued, running or recently finished run."""
+        self._prune()
+        return self._runs.get(run_id)
+
+    def runs(self) -> list[ActiveRun]:
+        """All registered runs, including those still lingering."""
+        self._prune()
+        return list(self._runs.values())
+
+    def abort(self, run_id: str, reason: str = "Run aborted") -> bool:
+        """
+        Abort a queued or running run.
+
+        A running run stops at its next abort check; a queued run leaves the
+        queue without starting.
+
+        Returns:
+            True if the run was found and had not finished yet
+        """
+        active = self._runs.get(run_id)
+        if active is None or active.done:
+            return False
+        active.abort_signal.abort(reason)
+        if active.status == RunStatus.STARTING and active.task is not None:
+            active.task.cancel()
+        return True
+
+    def stats(self) -> RunManagerStats:
+        """Active and queued run counts."""
+        return RunManagerStats(
+            active=self._active,
+            queued=len(self._queue),
+            rejected=self._rejected,
+            active_by_user=dict(+self._by_user),
+            active_by_runnable=dict(+self._by_runnable),
+        )
+
+    async def _run(
+        self,
+        active: ActiveRun,
+        executor: RunnableExecutor,
+        runnable: Runnable,
+        input: str,
+        metadata: dict | None,
+        admitted: bool,
+    ) -> RunOutput | None:
+        try:
+            if not admitted:
+                await self._admit(active)
+                admitted = True
+            active.status = RunStatus.RUNNING
+            active.started_at = time.time()
+            active.output = await executor.run_to_wire(
+                runnable,
+                input,
+                active.wire,
+                run_id=active.run_id,
+                session_id=active.session_id,
+                user_id=active.user_id,
+                metadata=metadata,
+                abort_signal=active.abort_signal,
+            )
+            # Mirror the status the executor recorded (CANCELLED for an aborted run)
+            active.status = active.output.status or RunStatus.COMPLETED
+            if active.status == RunStatus.CANCELLED:
+                active.error = active.abort_signal.reason
+                logger.info("background_run_cancelled", run_id=active.run_id, reason=active.error)
+            return active.output
+        except asyncio.CancelledError:
+            active.status = RunStatus.CANCELLED
+            active.error = active.abort_signal.reason
+            logger.info("background_run_cancelled", run_id=active.run_id, reason=active.error)
+            # Aborted runs end here; cancellation from outside keeps propagating
+            if not active.abort_signal.is_aborted():
+                raise
+            return None
+        except Exception as e:
+            # Already reported to readers as RUN_FAILED
+            active.status = RunStatus.FAILED
+            active.error = str(e)
+            logger.warning("background_run_failed", run_id=active.run_id, error=str(e))
+            return None
+        finally:
+            active.finished_at = time.time()
+            await self._release(active, admitted)
+            if not admitted:
+                await active.wire.close()
+
+    async def _admit(self, active: ActiveRun) -> None:
+        async with self._admission:
+            await self._admission.wait_for(lambda: self._next_admissible() is active)
+            self._queue.remove(active)
+            self._take_slot(active)
+            # Another queued run may fit as well
+            self._admission.notify_all()
+
+    def _take_slot(self, active: ActiveRun) -> None:
+        self._active += 1
+        if active.user_id:
+            self._by_user[active.user_id] += 1
+        self._by_runnable[active.runnable_id] += 1
+
+    async def _release(self, active: ActiveRun, admitted: bool) -> None:
+        async with self._admission:
+            if admitted:
+                self._active -= 1
+                if active.user_id:
+                    self._by_user[active.user_id] -= 1
+                self._by_runnable[active.runnable_id] -= 1
+            elif active in self._queue:
+                self._queue.remove(active)
+            self._admission.notify_all()
+
+    def _next_admissible(self) -> ActiveRun | None:
+        # FIFO among runs that fit; a run held back by its own user/runnable
+        # cap does not block runs of others
+        for queued in self._queue:
+            if self._can_admit(queued):
+                return queued
+        return None
+
+    def _can_admit(self, active: ActiveRun) -> bool:
+        if self._max_concurrent and self._active >= self._max_concurrent:
+            return False
+        if (
+            self._max_per_user
+            and active.user_id
+            and self._by_user[active.user_id] >= self._max_per_user
+        ):
+            return False
+        if (
+            self._max_per_runnable
+            and self._by_runnable[active.runnable_id] >= self._max_per_runnable
+        ):
+            return False
+        return True
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self._linger
+        expired = [
+            run_id
+            for run_id, active in self._runs.items()
+            if active.finished_at is not None and active.finished_at < cutoff
+        ]
+        for run_id in expired:
+            del self._runs[run_id]
+
+
+# Global run manager instance
+_run_manager: RunManager | None = None
+
+
+def get_run_manager() -> RunManager:
+    """Get the global RunManager instance (limits from AGIO_RUN_* settings)."""
+    global _run_manager
+    if _run_manager is None:
+        from agio.config import settings
+
+        _run_manager = RunManager(
+            max_concurrent=settings.run_max_concurrent,
+            max_per_user=settings.run_max_per_user,
+            max_per_runnable=settings.run_max_per_runnable,
+            max_queued=settings.run_max_queued,
+            linger_seconds=settings.run_linger_seconds,
+        )
+    return _run_manager
+
+
+__all__ = [
+    "ActiveRun",
+    "RunAdmissionError",
+    "RunManager",
+    "RunManagerStats",
+    "get_run_manager",
+]
@@ -17,6 +17,7 @@ from uuid import uuid4
 
 from agio.domain import Run, RunStatus, StepEvent
 from agio.observability import TraceCollector
+from agio.runtime.control import AbortSignal
 from agio.runtime.event_factory import EventFactory
 from agio.runtime.protocol import ExecutionContext, Runnable, RunOutput, RunnableType
 from agio.runtime.wire import Wire
@@ -33,7 +34,7 @@ class RunnableExecutor:
 
     Responsibilities:
     1. Create Run record
-    2. Manage Run status (RUNNING → COMPLETED/FAILED)
+    2. Manage Run status (RUNNING → COMPLETED/FAILED/CANCELLED)
     3. Emit Run-level events
     4. Save Run to SessionStore
 
@@ -62,6 +63,7 @@ class RunnableExecutor:
         runnable: Runnable,
         input: str,
         context: ExecutionContext,
+        abort_signal: AbortSignal | None = None,
     ) -> RunOutput:
         """
         Execute a Runnable with Run lifecycle management.
@@ -78,6 +80,7 @@ class RunnableExecutor:
             runnable: The Runnable to execute
             input: Input string
             context: Execution context with wire
+            abort_signal: Signal that stops the run gracefully (optional)
 
         Returns:
             RunOutput from the Runnable
@@ -119,10 +122,17 @@ class RunnableExecutor:
 
         try:
             # 3. Delegate to runnable.run()
-            result: RunOutput = await runnable.run(input, context=context)
+            if abort_signal is not None:
+                result: RunOutput = await runnable.run(
+                    input, context=context, abort_signal=abort_signal
+                )
+            else:
+                result = await runnable.run(input, context=context)
 
-            # 4. Update Run
-            run.status = RunStatus.COMPLETED
+            # 4. Update Run (an aborted runnable stops gracefully and returns)
+            aborted = abort_signal is not None and abort_signal.is_aborted()
+            run.status = RunStatus.CANCELLED if aborted else RunStatus.COMPLETED
+            result.status = run.status
             run.response_content = result.response
             run.metrics.end_time = time.time()
             run.metrics.duration = run.metrics.end_time - run.metrics.start_time
@@ -134,24 +144,32 @@ class RunnableExecutor:
                 run.metrics.output_tokens = result.metrics.output_tokens
                 run.metrics.tool_calls_count = result.metrics.tool_calls_count
 
-            logger.info(
-                "run_completed",
-                run_id=run.id,
-                duration=run.metrics.duration,
-                tokens=run.metrics.total_tokens,
-            )
+            if aborted:
+                logger.info("run_cancelled", run_id=run.id, reason=abort_signal.reason)
 
-            # 5. Emit RUN_COMPLETED event
-            await context.wire.write(
-                ef.run_completed(
-                    response=result.response or "",
-                    metrics={
-                        "duration": run.metrics.duration,
-                        "total_tokens": run.metrics.total_tokens,
-                    },
-                    termination_reason=result.termination_reason,
+                # 5. Emit the same event as a run cancelled mid-await
+                await context.wire.write(
+                    ef.run_failed(f"Run cancelled: {abort_signal.reason or 'cancelled'}")
+                )
+            else:
+                logger.info(
+                    "run_completed",
+                    run_id=run.id,
+                    duration=run.metrics.duration,
+                    tokens=run.metrics.total_tokens,
+                )
+
+                # 5. Emit RUN_COMPLETED event
+                await context.wire.write(
+                    ef.run_completed(
+                        response=result.response or "",
+                        metrics={
+                            "duration": run.metrics.duration,
+                            "total_tokens": run.metrics.total_tokens,
+                        },
+                        termination_reason=result.termination_reason,
+                    )
                 )
-            )
 
             # 6. Save Run
             if self.store:
@@ -182,6 +200,21 @@ class RunnableExecutor:
 
             raise
 
+        except asyncio.CancelledError:
+            run.status = RunStatus.CANCELLED
+            run.metrics.end_time = time.time()
+            run.metrics.duration = run.metrics.end_time - run.metrics.start_time
+            reason = abort_signal.reason if abort_signal and abort_signal.is_aborted() else None
+
+            logger.info("run_cancelled", run_id=run.id, reason=reason)
+
+            await context.wire.write(ef.run_failed(f"Run cancelled: {reason or 'cancelled'}"))
+
+            if self.store:
+                await self.store.save_run(run)
+
+            raise
+
     async def execute_with_wire(
         self,
         runnable: Runnable,
@@ -191,6 +224,8 @@ class RunnableExecutor:
         session_id: str | None = None,
         user_id: str | None = None,
         metadata: dict | None = None,
+        run_id: str | None = None,
+        abort_signal: AbortSignal | None = None,
         _parent_context: ExecutionContext | None = None,
         enable_trace: bool = True,
     ) -> RunOutput:
@@ -207,6 +242,8 @@ class RunnableExecutor:
             session_id: Session ID (auto-generated if not provided)
             user_id: User ID (optional)
             metadata: Additional metadata (optional)
+            run_id: Run ID (auto-generated if not provided)
+            abort_signal: Signal that stops the run gracefully (optional)
             _parent_context: Parent context for nested execution (internal use)
             enable_trace: Enable trace collection (default: True)
 
@@ -218,8 +255,7 @@ class RunnableExecutor:
             - For nested execution, use execute() with pre-constructed context
             - Trace collection is automatically enabled if trace_store is configured
         """
-        # Generate run_id internally
-        run_id = str(uuid4())
+        run_id = run_id or str(uuid4())
         final_session_id = session_id or str(uuid4())
 
         # Construct ExecutionContext
@@ -244,119 +280,154 @@ class RunnableExecutor:
             )
 
         # Delegate to execute()
-        return await self.execute(runnable, input, context)
+        return await self.execute(runnable, input, context, abort_signal=abort_signal)
 
-    async def execute_stream(
+    async def run_to_wire(
         self,
         runnable: Runnable,
         input: str,
+        wire: Wire,
         *,
+        run_id: str | None = None,
         session_id: str | None = None,
         user_id: str | None = None,
         metadata: dict | None = None,
-        cleanup_timeout: float = 5.0,
+        abort_signal: AbortSignal | None = None,
         enable_trace: bool = True,
-    ) -> AsyncIterator[StepEvent]:
+    ) -> RunOutput:
         """
-        Execute a Runnable in streaming mode, automatically managing Wire and Task lifecycle.
+        Execute a Runnable, writing all its events to wire, and close the wire.
 
-        This method creates Wire internally, starts execution in a background task,
-        and yields events from the wire. Wire cleanup is handled automatically.
-        Trace collection is automatically enabled if trace_store is configured.
+        When trace collection is enabled the run writes to an internal wire
+        whose events pass through the TraceCollector (which injects trace_id /
+        span_id) before they reach the given wire.
 
         Args:
             runnable: The Runnable to execute
             input: Input string
+            wire: Wire that receives the (traced) events; closed on return
+            run_id: Run ID (auto-generated if not provided)
             session_id: Session ID (auto-generated if not provided)
             user_id: User ID (optional)
             metadata: Additional metadata (optional)
-            cleanup_timeout: Timeout for cleanup operations (default: 5.0s)
+            abort_signal: Signal that stops the run gracefully (optional)
             enable_trace: Enable trace collection (default: True)
 
-        Yields:
-            StepEvent: Events from the execution (with trace_id injected if tracing enabled)
-
-        Example:
-            async for event in executor.execute_stream(agent, query, session_id="sess_123"):
-                print(event.type, event.data)
+        Returns:
+            RunOutput from the Runnable
         """
         final_session_id = session_id or str(uuid4())
-        
-        # Wrap with trace collection if enabled
-        if enable_trace and self.trace_store:
-            # Create internal wire for execution task
-            internal_wire = Wire()
+        try:
+            if not (enable_trace and self.trace_store):
+                return await self.execute_with_wire(
+                    runnable,
+                    input,
+                    wire,
+                    session_id=final_session_id,
+                    user_id=user_id,
+                    metadata=metadata,
+                    run_id=run_id,
+                    abort_signal=abort_signal,
+                    enable_trace=False,
+                )
+
+            # The public wire already bounds the stream; no replay needed here
+            internal_wire = Wire.from_settings(replay_size=0)
             collector = TraceCollector(store=self.trace_store)
 
-            async def _run():
+            async def _run() -> RunOutput:
                 try:
-                    await self.execute_with_wire(
+                    return await self.execute_with_wire(
                         runnable,
                         input,
                         internal_wire,
                         session_id=final_session_id,
                         user_id=user_id,
                         metadata=metadata,
+                        run_id=run_id,
+                        abort_signal=abort_signal,
                         enable_trace=False,  # Disable nested trace wrapping
                     )
                 finally:
                     await internal_wire.close()
 
-            try:
-                async with asyncio.TaskGroup() as tg:
-                    tg.create_task(_run())
-                    # Wrap event stream with trace collection
-                    async for event in collector.wrap_stream(
-                        internal_wire.read(),
-                        agent_id=runnable.id,
-                        session_id=final_session_id,
-                        user_id=user_id,
-                        input_query=input,
-                    ):
-                        yield event
-            finally:
-                try:
-                    async with asyncio.timeout(cleanup_timeout):
-                        await internal_wire.close()
-                except asyncio.TimeoutError:
-                    logger.warning(
-                        "execute_stream_cleanup_timeout",
-                        runnable_id=runnable.id,
-                        timeout=cleanup_timeout,
-                    )
-        else:
-            # No trace collection
-            wire = Wire()
+            async with asyncio.TaskGroup() as tg:
+                task = tg.create_task(_run())
+                async for event in collector.wrap_stream(
+                    internal_wire.read(),
+                    agent_id=runnable.id,
+                    session_id=final_session_id,
+                    user_id=user_id,
+                    input_query=input,
+                ):
+                    await wire.write(event)
+            return task.result()
+        finally:
+            await wire.close()
 
-            async def _run():
-                try:
-                    await self.execute_with_wire(
+    async def execute_stream(
+        self,
+        runnable: Runnable,
+        input: str,
+        *,
+        session_id: str | None = None,
+        user_id: str | None = None,
+        metadata: dict | None = None,
+        cleanup_timeout: float = 5.0,
+        enable_trace: bool = True,
+    ) -> AsyncIterator[StepEvent]:
+        """
+        Execute a Runnable in streaming mode, automatically managing Wire and Task lifecycle.
+
+        This method creates Wire internally, starts execution in a background task,
+        and yields events from the wire. Wire cleanup is handled automatically.
+        Trace collection is automatically enabled if trace_store is configured.
+        The run is cancelled when the consumer stops iterating; use RunManager
+        for runs that outlive their reader.
+
+        Args:
+            runnable: The Runnable to execute
+            input: Input string
+            session_id: Session ID (auto-generated if not provided)
+            user_id: User ID (optional)
+            metadata: Additional metadata (optional)
+            cleanup_timeout: Timeout for cleanup operations (default: 5.0s)
+            enable_trace: Enable trace collection (default: True)
+
+        Yields:
+            StepEvent: Events from the execution (with trace_id injected if tracing enabled)
+
+        Example:
+            async for event in executor.execute_stream(agent, query, session_id="sess_123"):
+                print(event.type, event.data)
+        """
+        wire = Wire.from_settings(replay_size=0)
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(
+                    self.run_to_wire(
                         runnable,
                         input,
                         wire,
-                        session_id=final_session_id,
+                        session_id=session_id,
                         user_id=user_id,
                         metadata=metadata,
-                        enable_trace=False,
+                        enable_trace=enable_trace,
                     )
-                finally:
-                    await wire.close()
-
+                )
+                async for event in wire.read():
+                    yield event
+        finally:
             try:
-                async with asyncio.TaskGroup() as tg:
-                    tg.create_task(_run())
-                    async for event in wire.read():
-                        yield event
-            finally:
-                try:
-                    async with asyncio.timeout(cleanup_timeout):
-                        await wire.close()
-                except asyncio.TimeoutError:
-                    logger.warning(
-                        "execute_stream_cleanup_timeout",
-                        runnable_id=runnable.id,
-                        timeout=cleanup_timeout,
-                    )
+                async with asyncio.timeout(cleanup_timeout):
+                    await wire.close()
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "execute_stream_cleanup_timeout",
+                    runnable_id=runnable.id,
+                    timeout=cleanup_timeout,
+                )
 
 
 __all__ = ["RunnableExecutor"]
@@ -61,6 +61,8 @@ class RunnableTool(BaseTool):
         orchestra = Agent(model=gpt4, tools=[research_tool])
     """
 
+    runs_nested_tools = True
+
     def __init__(
         self,
         runnable: Runnable,
@@ -4,27 +4,93 @@ Sequence Manager for Agent execution.
 Manages sequence allocation for all Steps within a Session.
 """
 
+import asyncio
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+
 from agio.storage.session.base import SessionStore
+from agio.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BLOCK_SIZE = 64
+DEFAULT_MAX_LEASES = 1024
+
+
+@dataclass
+class _Lease:
+    """Block of sequence numbers leased from the store: [next, end)."""
+
+    next: int
+    end: int
+
+    def take(self) -> int | None:
+        if self.next >= self.end:
+            return None
+        seq = self.next
+        self.next += 1
+        return seq
 
 
 class SequenceManager:
     """Session-level sequence allocation service.
 
     Manages sequence allocation for all Steps within a Session:
-    1. Normal allocation: atomic allocation via SessionStore.allocate_sequence
+    1. Normal allocation: sequences are handed out from an in-memory block
+       leased from SessionStore.allocate_sequence_block (one store round trip
+       per block_size steps instead of one per step)
     2. Pre-allocation handling: seq_start mechanism for parallel execution
 
+    Handing out a leased number never awaits, so concurrent coroutines in the
+    same process need no lock. When a lease runs out a single refill is shared
+    by all waiters. Unused numbers of a lease are simply skipped (gaps are
+    tolerated); the store reconciles its counter with the highest persisted
+    sequence on every lease, so restarts and other writers never collide.
+    Leases are released when a top-level run ends, and at most max_leases
+    (least recently used first out) are kept.
+
     This is a Session-level resource that should be shared across all
-    nested Agent executions within the same Session.
+    nested Agent executions within the same Session (see for_store).
     """
 
-    def __init__(self, session_store: SessionStore) -> None:
+    _shared: "weakref.WeakKeyDictionary[SessionStore, SequenceManager]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(
+        self,
+        session_store: SessionStore,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_leases: int = DEFAULT_MAX_LEASES,
+    ) -> None:
         """Initialize SequenceManager.
 
         Args:
             session_store: SessionStore instance for atomic sequence allocation
+            block_size: Number of sequences leased from the store at a time
+            max_leases: Sessions whose lease is kept in memory
         """
+        if block_size < 1:
+            raise ValueError("block_size must be >= 1")
         self.session_store = session_store
+        self.block_size = block_size
+        self._max_leases = max_leases
+        self._leases: OrderedDict[str, _Lease] = OrderedDict()
+        self._refills: dict[str, asyncio.Task] = {}
+
+    @classmethod
+    def for_store(cls, session_store: SessionStore) -> "SequenceManager":
+        """Get the process-wide SequenceManager shared by all users of a store.
+
+        Sharing one manager keeps sequences of nested executions in the same
+        session in allocation order, instead of interleaving separate leases.
+        """
+        manager = cls._shared.get(session_store)
+        if manager is None:
+            manager = cls(session_store)
+            cls._shared[session_store] = manager
+        return manager
 
     async def allocate(self, session_id: str, context=None) -> int:
         """Allocate next sequence number.
@@ -45,5 +111,39 @@ class SequenceManager:
             seq_start = context.metadata.pop("seq_start")
             return seq_start
 
-        # Use SessionStore's atomic allocation
-        return await self.session_store.allocate_sequence(session_id)
+        while True:
+            lease = self._leases.get(session_id)
+            if lease is not None:
+                seq = lease.take()
+                if seq is not None:
+                    self._leases.move_to_end(session_id)
+                    return seq
+
+            refill = self._refills.get(session_id)
+            if refill is None:
+                refill = asyncio.ensure_future(self._lease_block(session_id))
+                self._refills[session_id] = refill
+            # Shield so a cancelled waiter does not abort the shared refill
+            await asyncio.shield(refill)
+
+    def release(self, session_id: str) -> None:
+        """Drop the in-memory lease of a session (remaining numbers are skipped)."""
+        self._leases.pop(session_id, None)
+
+    async def _lease_block(self, session_id: str) -> None:
+        try:
+            block = await self.session_store.allocate_sequence_block(
+                session_id, self.block_size
+            )
+            self._leases[session_id] = _Lease(next=block.start, end=block.stop)
+            self._leases.move_to_end(session_id)
+            while len(self._leases) > self._max_leases:
+                self._leases.popitem(last=False)
+            logger.debug(
+                "sequence_block_leased",
+                session_id=session_id,
+                start=block.start,
+                end=block.stop,
+            )
+        finally:
+            self._refills.pop(session_id, None)
@@ -94,6 +94,9 @@ class StepFactory:
         llm_messages: list[dict] | None = None,
         llm_tools: list[dict] | None = None,
         llm_request_params: dict[str, Any] | None = None,
+        llm_snapshot_id: str | None = None,
+        llm_parent_snapshot_id: str | None = None,
+        llm_tools_hash: str | None = None,
         metrics: StepMetrics | None = None,
         **overrides,
     ) -> Step:
@@ -122,6 +125,9 @@ class StepFactory:
             llm_messages=llm_messages,
             llm_tools=llm_tools,
             llm_request_params=llm_request_params,
+            llm_snapshot_id=llm_snapshot_id,
+            llm_parent_snapshot_id=llm_parent_snapshot_id,
+            llm_tools_hash=llm_tools_hash,
             # Metadata
             metrics=metrics,
             # Observability
@@ -85,16 +85,20 @@ class StepRepository:
         if not self._batch:
             return
 
+        # Detach the batch first so steps queued while saving are not dropped
+        batch, self._batch = self._batch, []
         if self.session_store:
-            # Try batch save if available
-            if hasattr(self.session_store, "save_steps_batch"):
-                await self.session_store.save_steps_batch(self._batch)
-            else:
-                # Fallback to individual saves
-                for step in self._batch:
-                    await self.session_store.save_step(step)
-
-        self._batch.clear()
+            try:
+                # Try batch save if available
+                if hasattr(self.session_store, "save_steps_batch"):
+                    await self.session_store.save_steps_batch(batch)
+                else:
+                    # Fallback to individual saves
+                    for step in batch:
+                        await self.session_store.save_step(step)
+            except Exception:
+                self._batch[:0] = batch
+                raise
 
     async def __aenter__(self):
         """Enter context manager."""
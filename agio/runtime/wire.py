@@ -9,10 +9,21 @@ Design:
 - Passed explicitly via RunContext to all nested components
 - All components write events directly to Wire
 - API layer reads from Wire and streams to client
+- Several subscribers may read the same Wire; each gets every event
+- Every event gets a monotonic event_id; the last replay_size events are
+  kept so a reconnecting reader can resume after the last id it saw
+
+Buffers can be bounded (maxsize). What happens when a subscriber falls behind
+is decided by the overflow policy:
+- block: the producer waits until every subscriber has room
+- coalesce: a STEP_DELTA is merged into the buffered delta of the same step
+- drop_deltas: STEP_DELTA events are dropped
+Under coalesce and drop_deltas the producer never waits, and events other
+than STEP_DELTA (completions, run lifecycle, errors) are always kept.
 
 Usage:
     # At API entry point
-    wire = Wire()
+    wire = Wire(maxsize=1024, policy=WirePolicy.COALESCE)
     context = RunContext(wire=wire, ...)
 
     # Start execution (non-blocking)
@@ -24,100 +35,342 @@ Usage:
 """
 
 import asyncio
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
 from typing import AsyncIterator
 
-from agio.domain import StepEvent
+from agio.domain import StepDelta, StepEvent, StepEventType
+from agio.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class WirePolicy(str, Enum):
+    """What a Wire does when a subscriber buffer is full."""
+
+    BLOCK = "block"
+    COALESCE = "coalesce"
+    DROP_DELTAS = "drop_deltas"
+
+
+@dataclass
+class WireStats:
+    """Wire buffer counters."""
+
+    high_water_mark: int = 0  # Largest number of events buffered for one subscriber
+    blocked_writes: int = 0  # Writes that waited for a subscriber to catch up
+    coalesced: int = 0  # Deltas merged into a buffered delta
+    dropped: int = 0  # Deltas dropped
+    overflowed: int = 0  # Events buffered beyond maxsize
+
+
+def _merge_delta(a: StepDelta, b: StepDelta) -> StepDelta:
+    return StepDelta(
+        content=(a.content or "") + (b.content or "") or None,
+        reasoning_content=(a.reasoning_content or "") + (b.reasoning_content or "") or None,
+        tool_calls=(a.tool_calls or []) + (b.tool_calls or []) or None,
+        usage=b.usage or a.usage,
+    )
+
+
+class WireSubscription:
+    """
+    One reader of a Wire, with its own event buffer.
+
+    Iterate it to receive events until the wire is closed; call close() to
+    stop receiving (a closed subscription never holds back the producer).
+    """
+
+    def __init__(self, wire: "Wire") -> None:
+        self._wire = wire
+        self._buffer: deque[StepEvent] = deque()
+        self._ready = asyncio.Event()
+        self._closed = False
+        # Events a resumed subscription asked for that had left the replay buffer
+        self.missed = 0
+
+    def __aiter__(self) -> "WireSubscription":
+        return self
+
+    async def __anext__(self) -> StepEvent:
+        while not self._buffer:
+            if self._closed or self._wire.closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        event = self._buffer.popleft()
+        self._wire._space.set()
+        return event
+
+    def close(self) -> None:
+        """Stop receiving events and release the buffer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._buffer.clear()
+        self._ready.set()
+        self._wire._unsubscribe(self)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def _push(self, event: StepEvent) -> None:
+        self._buffer.append(event)
+        self._ready.set()
+
+    def _merge(self, event: StepEvent) -> bool:
+        """Merge a STEP_DELTA into the buffered tail delta of the same step."""
+        if not self._buffer:
+            return False
+        tail = self._buffer[-1]
+        if (
+            tail.type != StepEventType.STEP_DELTA
+            or tail.step_id != event.step_id
+            or tail.run_id != event.run_id
+            or tail.delta is None
+            or event.delta is None
+        ):
+            return False
+        # The merged event carries the newest id so a resume does not repeat it
+        self._buffer[-1] = tail.model_copy(
+            update={"delta": _merge_delta(tail.delta, event.delta), "event_id": event.event_id}
+        )
+        return True
 
 
 class Wire:
     """
     Event streaming channel for Runnable execution.
 
-    Wire is a simple wrapper around asyncio.Queue that provides:
-    - write(): Put an event into the channel
-    - read(): Async iterate over events until closed
+    - write(): Put an event into the channel (may wait under the block policy)
+    - write_nowait(): Put an event without waiting (never drops completions)
+    - subscribe() / read(): Receive every event until the wire is closed
     - close(): Signal that no more events will be written
 
-    Thread-safe and supports multiple concurrent writers.
+    Events written before anyone subscribes are kept for the first subscriber.
+    Supports multiple concurrent writers and readers.
     """
 
-    # Sentinel value to signal end of stream
-    _SENTINEL = object()
-
-    def __init__(self, maxsize: int = 0) -> None:
+    def __init__(
+        self,
+        maxsize: int = 0,
+        policy: WirePolicy | str = WirePolicy.BLOCK,
+        replay_size: int = 0,
+    ) -> None:
         """
         Initialize Wire.
 
         Args:
-            maxsize: Maximum queue size (0 = unlimited)
+            maxsize: Maximum events buffered per subscriber (0 = unlimited)
+            policy: Overflow policy applied when a subscriber buffer is full
+            replay_size: Recent events kept for resumed subscriptions (0 = none)
         """
-        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._maxsize = maxsize
+        self._policy = WirePolicy(policy)
+        self._replay: deque[StepEvent] | None = (
+            deque(maxlen=replay_size) if replay_size else None
+        )
+        self._last_event_id = 0
         self._closed = False
-        self._writer_count = 0
-        self._lock = asyncio.Lock()
+        self._space = asyncio.Event()
+        self._stats = WireStats()
+        # Holds events until the first subscriber claims it
+        self._unclaimed: WireSubscription | None = WireSubscription(self)
+        self._subscribers: list[WireSubscription] = [self._unclaimed]
+
+    @classmethod
+    def from_settings(cls, **overrides) -> "Wire":
+        """Create a Wire configured by AGIO_WIRE_BUFFER_SIZE / _POLICY / _REPLAY_SIZE."""
+        from agio.config import settings
+
+        options = {
+            "maxsize": settings.wire_buffer_size,
+            "policy": settings.wire_policy,
+            "replay_size": settings.wire_replay_size,
+        }
+        options.update(overrides)
+        return cls(**options)
 
     async def write(self, event: "StepEvent") -> None:
         """
         Write an event to the wire.
 
+        Under the block policy this waits while any subscriber buffer is full.
+        Writes after close are silently ignored.
+
         Args:
             event: StepEvent to write
-
-        Raises:
-            RuntimeError: If wire is already closed
         """
         if self._closed:
-            # Silently ignore writes after close (graceful degradation)
             return
-        await self._queue.put(event)
+        self._stamp(event)
+        pending = [sub for sub in self._subscribers if not self._offer(sub, event)]
+        if pending:
+            self._stats.blocked_writes += 1
+        while pending and not self._closed:
+            self._space.clear()
+            await self._space.wait()
+            pending = [
+                sub for sub in pending if not sub.closed and not self._offer(sub, event)
+            ]
 
     def write_nowait(self, event: "StepEvent") -> None:
         """
         Write an event without waiting (non-blocking).
 
-        Use this for synchronous contexts where await is not possible.
+        Use this for synchronous contexts where await is not possible. Where
+        write() would wait, the event is buffered beyond maxsize instead.
         """
         if self._closed:
             return
-        try:
-            self._queue.put_nowait(event)
-        except asyncio.QueueFull:
-            # Drop event if queue is full (shouldn't happen with unlimited queue)
-            pass
+        self._stamp(event)
+        for sub in self._subscribers:
+            self._offer(sub, event, force=True)
+
+    def subscribe(self, after_event_id: int | None = None) -> WireSubscription:
+        """
+        Add a reader that receives every event written from now on.
+
+        The first subscriber also receives the events written before it.
+
+        Args:
+            after_event_id: Resume after this event id, replaying the newer
+                events still held in the replay buffer
+        """
+        if after_event_id is None and self._unclaimed is not None:
+            sub, self._unclaimed = self._unclaimed, None
+            return sub
+        sub = WireSubscription(self)
+        if after_event_id is not None:
+            self._replay_into(sub, after_event_id)
+        if self._closed:
+            sub._closed = True
+        else:
+            self._subscribers.append(sub)
+        return sub
 
     async def close(self) -> None:
         """
         Close the wire, signaling no more events will be written.
 
-        This puts a sentinel value in the queue to stop readers.
+        Readers drain what is buffered and then stop; blocked writers return.
         """
         if self._closed:
             return
         self._closed = True
-        await self._queue.put(self._SENTINEL)
+        for sub in self._subscribers:
+            sub._ready.set()
+        self._space.set()
+        if self._stats.dropped or self._stats.coalesced or self._stats.blocked_writes:
+            logger.info(
+                "wire_backpressure",
+                policy=self._policy.value,
+                maxsize=self._maxsize,
+                high_water_mark=self._stats.high_water_mark,
+                blocked_writes=self._stats.blocked_writes,
+                coalesced=self._stats.coalesced,
+                dropped=self._stats.dropped,
+            )
 
     async def read(self) -> AsyncIterator["StepEvent"]:
         """
         Read events from the wire until closed.
 
+        Each call is a separate subscription (see subscribe()).
+
         Yields:
             StepEvent: Events written to the wire
         """
-        while True:
-            item = await self._queue.get()
-            if item is self._SENTINEL:
-                # Re-put sentinel for other readers (if any)
-                await self._queue.put(self._SENTINEL)
-                break
-            yield item
+        sub = self.subscribe()
+        try:
+            async for event in sub:
+                yield event
+        finally:
+            sub.close()
 
     @property
     def closed(self) -> bool:
         """Check if wire is closed."""
         return self._closed
 
+    @property
+    def policy(self) -> WirePolicy:
+        return self._policy
+
+    @property
+    def last_event_id(self) -> int:
+        """Id of the most recently written event (0 = none yet)."""
+        return self._last_event_id
+
+    @property
+    def stats(self) -> WireStats:
+        """Buffer counters, including the high-water mark."""
+        return self._stats
+
+    def _stamp(self, event: StepEvent) -> None:
+        self._last_event_id += 1
+        event.event_id = self._last_event_id
+        if self._replay is not None:
+            self._replay.append(event)
+
+    def _replay_into(self, sub: WireSubscription, after_event_id: int) -> None:
+        replay = self._replay or ()
+        oldest = replay[0].event_id if replay else self._last_event_id + 1
+        sub.missed = max(0, min(oldest, self._last_event_id + 1) - after_event_id - 1)
+        if sub.missed:
+            logger.warning(
+                "wire_replay_gap", after_event_id=after_event_id, missed=sub.missed
+            )
+        for event in replay:
+            if event.event_id > after_event_id:
+                sub._buffer.append(event)
+        if sub._buffer:
+            sub._ready.set()
+
+    def _offer(self, sub: WireSubscription, event: StepEvent, force: bool = False) -> bool:
+        """Deliver an event to one subscriber; False if the producer must wait."""
+        if not self._maxsize or len(sub) < self._maxsize:
+            self._push(sub, event)
+            return True
+
+        is_delta = event.type == StepEventType.STEP_DELTA
+        if is_delta and self._policy == WirePolicy.COALESCE and sub._merge(event):
+            self._stats.coalesced += 1
+            return True
+        if is_delta and self._policy == WirePolicy.DROP_DELTAS:
+            self._stats.dropped += 1
+            return True
+        if self._policy == WirePolicy.BLOCK and not force:
+            return False
+
+        self._stats.overflowed += 1
+        self._push(sub, event)
+        return True
+
+    def _push(self, sub: WireSubscription, event: StepEvent) -> None:
+        sub._push(event)
+        if len(sub) > self._stats.high_water_mark:
+            self._stats.high_water_mark = len(sub)
+
+    def _unsubscribe(self, sub: WireSubscription) -> None:
+        if sub in self._subscribers:
+            self._subscribers.remove(sub)
+        if sub is self._unclaimed:
+            self._unclaimed = None
+        # Writers blocked on this subscriber can proceed
+        self._space.set()
+
     def __repr__(self) -> str:
-        return f"Wire(closed={self._closed}, qsize={self._queue.qsize()})"
+        buffered = max((len(sub) for sub in self._subscribers), default=0)
+        return (
+            f"Wire(closed={self._closed}, policy={self._policy.value}, "
+            f"subscribers={len(self._subscribers)}, buffered={buffered})"
+        )
 
 
-__all__ = ["Wire"]
+__all__ = ["Wire", "WirePolicy", "WireStats", "WireSubscription"]
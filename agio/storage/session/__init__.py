@@ -4,13 +4,17 @@ Session storage module.
 Contains SessionStore implementations for Run and Step persistence.
 """
 
-from .base import InMemorySessionStore, SessionStore
+from .base import InMemorySessionStore, SessionStore, SessionStoreListener
+from .context_cache import ContextCacheStats, SessionContextCache
 from .mongo import MongoSessionStore
 from .sqlite import SQLiteSessionStore
 
 __all__ = [
     "SessionStore",
+    "SessionStoreListener",
     "InMemorySessionStore",
     "MongoSessionStore",
     "SQLiteSessionStore",
+    "SessionContextCache",
+    "ContextCacheStats",
 ]
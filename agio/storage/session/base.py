@@ -3,17 +3,63 @@ Repository interface and in-memory implementation.
 """
 
 import asyncio
+import bisect
 from abc import ABC, abstractmethod
+from typing import ClassVar
 
-from agio.domain import Run, Step
+from agio.domain import Run, Step, resolve_llm_context
+from agio.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SessionStoreListener:
+    """
+    Observer of session step changes, for caches built from stored steps.
+
+    Register with SessionStore.add_listener; the methods are no-ops by default.
+    """
+
+    def on_steps_saved(self, store: "SessionStore", steps: list[Step]) -> None:
+        """Steps were saved (appended, or written behind steps already stored)."""
+
+    def on_session_changed(self, store: "SessionStore", session_id: str) -> None:
+        """Steps of a session changed other than by appending (deleted, forked, resumed)."""
 
 
 class SessionStore(ABC):
     """
     Session store interface.
     Responsible for Run and Step persistence and queries.
+
+    Implementations call notify_steps_saved from save_step / save_steps_batch
+    and notify_session_changed from delete_steps.
     """
 
+    # Listeners of all stores (caches key their entries by store themselves)
+    _listeners: ClassVar[list[SessionStoreListener]] = []
+
+    @classmethod
+    def add_listener(cls, listener: SessionStoreListener) -> None:
+        """Subscribe a listener to step changes of every store."""
+        if listener not in SessionStore._listeners:
+            SessionStore._listeners.append(listener)
+
+    @classmethod
+    def remove_listener(cls, listener: SessionStoreListener) -> None:
+        if listener in SessionStore._listeners:
+            SessionStore._listeners.remove(listener)
+
+    def notify_steps_saved(self, steps: list[Step]) -> None:
+        """Tell listeners which steps were just saved."""
+        for listener in list(SessionStore._listeners):
+            listener.on_steps_saved(self, steps)
+
+    def notify_session_changed(self, session_id: str) -> None:
+        """Tell listeners to drop what they cached about a session."""
+        for listener in list(SessionStore._listeners):
+            listener.on_session_changed(self, session_id)
+
     # --- Run Operations ---
 
     @abstractmethod
@@ -121,6 +167,34 @@ class SessionStore(ABC):
         """
         pass
 
+    async def allocate_sequence_block(self, session_id: str, size: int) -> range:
+        """
+        Atomically reserve a contiguous block of sequence numbers.
+
+        The counter is reconciled with the highest persisted sequence first,
+        so a block never overlaps steps written outside the counter.
+
+        Stores that do not override this fall back to a block of one.
+
+        Args:
+            session_id: Session ID
+            size: Requested number of sequences
+
+        Returns:
+            Reserved sequence range
+        """
+        seq = await self.allocate_sequence(session_id)
+        return range(seq, seq + 1)
+
+    # --- Step Lookup ---
+
+    async def get_step_by_id(self, session_id: str, step_id: str) -> Step | None:
+        """Get a Step by id"""
+        steps = await self.get_steps(session_id)
+        for step in steps:
+            if step.id == step_id:
+                return step
+        return None
 
     # --- Tool Result Query (for cross-agent reference) ---
 
@@ -136,6 +210,166 @@ class SessionStore(ABC):
                 return step
         return None
 
+    # --- LLM Context Resolution (for trace UI and replay) ---
+
+    async def resolve_llm_context(self, step: Step) -> Step:
+        """
+        Reconstruct the full LLM request of a delta-encoded assistant Step.
+
+        Assistant Steps only store the messages appended since the previous
+        LLM call of the same run. This walks the snapshot chain of the run and
+        returns a copy of the Step with complete llm_messages and llm_tools.
+
+        Args:
+            step: Assistant Step (as stored)
+
+        Returns:
+            Step with full llm_messages/llm_tools, or the original Step if it is
+            already complete or its snapshot chain cannot be resolved
+        """
+        needs_messages = step.llm_parent_snapshot_id is not None
+        needs_tools = step.llm_tools is None and step.llm_tools_hash is not None
+        if not needs_messages and not needs_tools:
+            return step
+
+        run_steps = await self.get_steps(
+            step.session_id,
+            end_seq=step.sequence,
+            run_id=step.run_id,
+            limit=10000,
+        )
+        snapshots = {s.llm_snapshot_id: s for s in run_steps if s.llm_snapshot_id}
+        messages, tools = resolve_llm_context(step, snapshots)
+
+        if messages is None:
+            logger.warning(
+                "llm_context_unresolved",
+                step_id=step.id,
+                session_id=step.session_id,
+                parent_snapshot_id=step.llm_parent_snapshot_id,
+            )
+            return step
+
+        return step.model_copy(
+            update={
+                "llm_messages": messages,
+                "llm_tools": tools,
+                "llm_parent_snapshot_id": None,
+            }
+        )
+
+
+class _SessionStepIndex:
+    """
+    Sequence-ordered steps of one session with secondary indexes.
+
+    - sequences: sorted sequence numbers (bisect insertion / range lookups)
+    - by_sequence: sequence -> Step
+    - by_id: step id -> sequence
+    - by_run_id / by_runnable_id: key -> sorted sequences
+    - by_tool_call_id: tool_call_id -> sequence
+    """
+
+    def __init__(self) -> None:
+        self.sequences: list[int] = []
+        self.by_sequence: dict[int, Step] = {}
+        self.by_id: dict[str, int] = {}
+        self.by_run_id: dict[str, list[int]] = {}
+        self.by_runnable_id: dict[str, list[int]] = {}
+        self.by_tool_call_id: dict[str, int] = {}
+
+    def upsert(self, step: Step) -> None:
+        """Insert a step, replacing any step with the same id or sequence."""
+        old_seq = self.by_id.get(step.id)
+        if old_seq is not None and old_seq != step.sequence:
+            self._remove(old_seq)
+
+        if step.sequence in self.by_sequence:
+            self._unlink(self.by_sequence[step.sequence])
+        else:
+            # Appends (the common case) do not shift the list
+            if self.sequences and step.sequence < self.sequences[-1]:
+                bisect.insort(self.sequences, step.sequence)
+            else:
+                self.sequences.append(step.sequence)
+
+        self.by_sequence[step.sequence] = step
+        self.by_id[step.id] = step.sequence
+        if step.run_id is not None:
+            bisect.insort(self.by_run_id.setdefault(step.run_id, []), step.sequence)
+        if step.runnable_id is not None:
+            bisect.insort(
+                self.by_runnable_id.setdefault(step.runnable_id, []), step.sequence
+            )
+        if step.tool_call_id is not None:
+            self.by_tool_call_id[step.tool_call_id] = step.sequence
+
+    def truncate(self, start_seq: int) -> int:
+        """Remove all steps with sequence >= start_seq and return the count."""
+        pos = bisect.bisect_left(self.sequences, start_seq)
+        removed = self.sequences[pos:]
+        for seq in removed:
+            self._unlink(self.by_sequence.pop(seq))
+        del self.sequences[pos:]
+        return len(removed)
+
+    def query(
+        self,
+        start_seq: int | None,
+        end_seq: int | None,
+        run_id: str | None,
+        runnable_id: str | None,
+        limit: int,
+    ) -> list[Step]:
+        """Range query by sequence, using the most selective index."""
+        candidates = self.sequences
+        if run_id is not None:
+            candidates = self.by_run_id.get(run_id, [])
+        if runnable_id is not None:
+            by_runnable = self.by_runnable_id.get(runnable_id, [])
+            if len(by_runnable) < len(candidates):
+                candidates = by_runnable
+
+        lo = 0 if start_seq is None else bisect.bisect_left(candidates, start_seq)
+        hi = len(candidates) if end_seq is None else bisect.bisect_right(candidates, end_seq)
+
+        result: list[Step] = []
+        for pos in range(lo, hi):
+            if len(result) >= limit:
+                break
+            step = self.by_sequence[candidates[pos]]
+            if run_id is not None and step.run_id != run_id:
+                continue
+            if runnable_id is not None and step.runnable_id != runnable_id:
+                continue
+            result.append(step)
+        return result
+
+    def _remove(self, seq: int) -> None:
+        self._unlink(self.by_sequence.pop(seq))
+        del self.sequences[bisect.bisect_left(self.sequences, seq)]
+
+    def _unlink(self, step: Step) -> None:
+        """Drop a step from the secondary indexes."""
+        if self.by_id.get(step.id) == step.sequence:
+            del self.by_id[step.id]
+        for key, index in (
+            (step.run_id, self.by_run_id),
+            (step.runnable_id, self.by_runnable_id),
+        ):
+            sequences = index.get(key) if key is not None else None
+            if sequences:
+                pos = bisect.bisect_left(sequences, step.sequence)
+                if pos < len(sequences) and sequences[pos] == step.sequence:
+                    del sequences[pos]
+                if not sequences:
+                    del index[key]
+        if (
+            step.tool_call_id is not None
+            and self.by_tool_call_id.get(step.tool_call_id) == step.sequence
+        ):
+            del self.by_tool_call_id[step.tool_call_id]
+
 
 class InMemorySessionStore(SessionStore):
     """
@@ -144,7 +378,7 @@ class InMemorySessionStore(SessionStore):
 
     def __init__(self) -> None:
         self.runs: dict[str, Run] = {}
-        self.steps: dict[str, list[Step]] = {}  # session_id -> list[Step]
+        self._steps: dict[str, _SessionStepIndex] = {}  # session_id -> indexed steps
         self._sequence_counters: dict[str, int] = {}  # session_id -> counter
         self._sequence_locks: dict[str, asyncio.Lock] = {}  # session_id -> lock
 
@@ -186,36 +420,11 @@ class InMemorySessionStore(SessionStore):
         Handles idempotency: if a step with same (session_id, sequence) exists,
         updates it instead of creating a duplicate.
         """
-        if step.session_id not in self.steps:
-            self.steps[step.session_id] = []
-
-        # First, try to find by step.id
-        existing_idx = None
-        for i, s in enumerate(self.steps[step.session_id]):
-            if s.id == step.id:
-                existing_idx = i
-                break
-
-        if existing_idx is not None:
-            # Update existing step by id
-            self.steps[step.session_id][existing_idx] = step
-        else:
-            # Check if step with same (session_id, sequence) exists
-            seq_existing_idx = None
-            for i, s in enumerate(self.steps[step.session_id]):
-                if s.session_id == step.session_id and s.sequence == step.sequence:
-                    seq_existing_idx = i
-                    break
-
-            if seq_existing_idx is not None:
-                # Update existing step by (session_id, sequence)
-                self.steps[step.session_id][seq_existing_idx] = step
-            else:
-                # Insert new step
-                self.steps[step.session_id].append(step)
-
-            # Keep steps sorted by sequence
-            self.steps[step.session_id].sort(key=lambda s: s.sequence)
+        index = self._steps.get(step.session_id)
+        if index is None:
+            index = self._steps[step.session_id] = _SessionStepIndex()
+        index.upsert(step)
+        self.notify_steps_saved([step])
 
     async def save_steps_batch(self, steps: list[Step]) -> None:
         for step in steps:
@@ -230,41 +439,51 @@ class InMemorySessionStore(SessionStore):
         runnable_id: str | None = None,
         limit: int = 1000,
     ) -> list[Step]:
-        steps = self.steps.get(session_id, [])
-
-        if start_seq is not None:
-            steps = [s for s in steps if s.sequence >= start_seq]
-        if end_seq is not None:
-            steps = [s for s in steps if s.sequence <= end_seq]
-        if run_id is not None:
-            steps = [s for s in steps if s.run_id == run_id]
-        if runnable_id is not None:
-            steps = [s for s in steps if s.runnable_id == runnable_id]
-
-        return steps[:limit]
+        index = self._steps.get(session_id)
+        if index is None:
+            return []
+        return index.query(start_seq, end_seq, run_id, runnable_id, limit)
 
     async def get_last_step(self, session_id: str) -> Step | None:
-        steps = self.steps.get(session_id, [])
-        return steps[-1] if steps else None
+        index = self._steps.get(session_id)
+        if index is None or not index.sequences:
+            return None
+        return index.by_sequence[index.sequences[-1]]
 
     async def delete_steps(self, session_id: str, start_seq: int) -> int:
-        if session_id not in self.steps:
+        self.notify_session_changed(session_id)
+        index = self._steps.get(session_id)
+        if index is None:
             return 0
-
-        original_count = len(self.steps[session_id])
-        self.steps[session_id] = [
-            s for s in self.steps[session_id] if s.sequence < start_seq
-        ]
-        return original_count - len(self.steps[session_id])
+        return index.truncate(start_seq)
 
     async def get_step_count(self, session_id: str) -> int:
-        return len(self.steps.get(session_id, []))
+        index = self._steps.get(session_id)
+        return len(index.sequences) if index else 0
 
     async def get_max_sequence(self, session_id: str) -> int:
-        steps = self.steps.get(session_id, [])
-        if not steps:
+        index = self._steps.get(session_id)
+        if index is None or not index.sequences:
             return 0
-        return max(s.sequence for s in steps)
+        return index.sequences[-1]
+
+    async def get_step_by_id(self, session_id: str, step_id: str) -> Step | None:
+        index = self._steps.get(session_id)
+        if index is None:
+            return None
+        seq = index.by_id.get(step_id)
+        return index.by_sequence[seq] if seq is not None else None
+
+    async def get_step_by_tool_call_id(
+        self,
+        session_id: str,
+        tool_call_id: str,
+    ) -> Step | None:
+        index = self._steps.get(session_id)
+        if index is None:
+            return None
+        seq = index.by_tool_call_id.get(tool_call_id)
+        return index.by_sequence[seq] if seq is not None else None
 
     async def allocate_sequence(self, session_id: str) -> int:
         """Atomically allocate next sequence number."""
@@ -282,5 +501,18 @@ class InMemorySessionStore(SessionStore):
             self._sequence_counters[session_id] += 1
             return self._sequence_counters[session_id]
 
+    async def allocate_sequence_block(self, session_id: str, size: int) -> range:
+        """Atomically reserve a contiguous block of sequence numbers."""
+        if session_id not in self._sequence_locks:
+            self._sequence_locks[session_id] = asyncio.Lock()
+
+        async with self._sequence_locks[session_id]:
+            high_water = max(
+                self._sequence_counters.get(session_id, 0),
+                await self.get_max_sequence(session_id),
+            )
+            self._sequence_counters[session_id] = high_water + size
+            return range(high_water + 1, high_water + size + 1)
+
 
 __all__ = ["SessionStore", "InMemorySessionStore"]
@@ -0,0 +1,235 @@
+"""
+Session context cache - converted LLM messages kept between runs.
+
+Each entry holds the OpenAI-format messages of one (session_id, runnable_id)
+plus the highest step sequence they include (the watermark). Refreshing an
+entry only fetches and converts steps with sequence > watermark, so a turn of
+a long session no longer re-reads and re-validates every step.
+
+Steps are not always saved in sequence order (tool steps finish out of order,
+the step repository batches writes). A save at or below an entry's watermark
+drops that entry, so the next refresh rebuilds it instead of missing the step;
+so do deleting steps, forking and resuming. Both arrive through the
+SessionStore listener hook. Changes made by other processes are not detected.
+"""
+
+import json
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from agio.domain import Step, StepAdapter
+from agio.storage.session.base import SessionStore, SessionStoreListener
+from agio.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Steps fetched per store query while catching up
+FETCH_PAGE_SIZE = 1000
+
+
+def _message_size(message: dict[str, Any]) -> int:
+    """Approximate memory footprint of a message in bytes."""
+    size = 0
+    for value in message.values():
+        if isinstance(value, str):
+            size += len(value)
+        elif value is not None:
+            size += len(json.dumps(value, ensure_ascii=False, default=str))
+    return size
+
+
+@dataclass
+class _CachedContext:
+    """Converted messages of a session up to a sequence watermark."""
+
+    messages: list[dict[str, Any]] = field(default_factory=list)
+    watermark: int = 0
+    size: int = 0
+
+
+@dataclass
+class ContextCacheStats:
+    """Session context cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class SessionContextCache:
+    """
+    LRU cache of converted session messages, bounded by a byte budget.
+
+    One instance is shared by all users of a store (see for_store).
+    """
+
+    _shared: "weakref.WeakKeyDictionary[SessionStore, SessionContextCache]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self, session_store: SessionStore, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Args:
+            session_store: Store the steps are read from
+            max_bytes: Budget for cached messages across all sessions
+        """
+        self.session_store = session_store
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str | None], _CachedContext] = OrderedDict()
+        self._bytes = 0
+        self._stats = ContextCacheStats()
+
+    @classmethod
+    def for_store(cls, session_store: SessionStore) -> "SessionContextCache":
+        """Get the process-wide cache of a store."""
+        cache = cls._shared.get(session_store)
+        if cache is None:
+            from agio.config import settings
+
+            cache = cls(session_store, max_bytes=settings.session_context_cache_max_bytes)
+            cls._shared[session_store] = cache
+        return cache
+
+    @classmethod
+    def invalidate_store(cls, session_store: SessionStore, session_id: str) -> None:
+        """Invalidate a session in the cache of a store, if the store has one."""
+        cache = cls._shared.get(session_store)
+        if cache is not None:
+            cache.invalidate(session_id)
+
+    async def get_messages(
+        self, session_id: str, runnable_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Get the messages of a session, fetching only steps newer than the watermark.
+
+        Args:
+            session_id: Session ID
+            runnable_id: Only include steps of this runnable (None = all)
+
+        Returns:
+            Messages in OpenAI format (a new list; the dicts are shared, do not modify)
+        """
+        key = (session_id, runnable_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            entry = _CachedContext()
+        else:
+            self._stats.hits += 1
+            self._bytes -= entry.size
+            self._entries.move_to_end(key)
+
+        while True:
+            steps = await self.session_store.get_steps(
+                session_id=session_id,
+                start_seq=entry.watermark + 1,
+                runnable_id=runnable_id,
+                limit=FETCH_PAGE_SIZE,
+            )
+            for step in steps:
+                message = StepAdapter.to_llm_message(step)
+                entry.messages.append(message)
+                entry.size += _message_size(message)
+            if steps:
+                entry.watermark = steps[-1].sequence
+            if len(steps) < FETCH_PAGE_SIZE:
+                break
+
+        self._entries[key] = entry
+        self._bytes += entry.size
+        self._evict_to_budget(keep=key)
+        return list(entry.messages)
+
+    def invalidate(self, session_id: str) -> int:
+        """
+        Drop all entries of a session.
+
+        Returns:
+            Number of entries removed
+        """
+        keys = [key for key in self._entries if key[0] == session_id]
+        for key in keys:
+            self._bytes -= self._entries.pop(key).size
+        if keys:
+            self._stats.invalidations += len(keys)
+            logger.debug("session_context_invalidated", session_id=session_id, entries=len(keys))
+        return len(keys)
+
+    def steps_saved(self, steps: list[Step]) -> int:
+        """
+        Drop entries that a saved step lands behind (sequence <= watermark).
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for step in steps:
+            for key in ((step.session_id, None), (step.session_id, step.runnable_id)):
+                entry = self._entries.get(key)
+                if entry is not None and step.sequence <= entry.watermark:
+                    self._bytes -= self._entries.pop(key).size
+                    removed += 1
+        if removed:
+            self._stats.invalidations += removed
+            logger.debug(
+                "session_context_invalidated",
+                session_id=steps[0].session_id,
+                entries=removed,
+                reason="out_of_order_save",
+            )
+        return removed
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> ContextCacheStats:
+        """Get a snapshot of cache counters."""
+        return ContextCacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            invalidations=self._stats.invalidations,
+            entries=len(self._entries),
+            bytes=self._bytes,
+        )
+
+    def _evict_to_budget(self, keep: tuple[str, str | None]) -> None:
+        while self._bytes > self._max_bytes and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            if key == keep:
+                break
+            self._bytes -= self._entries.pop(key).size
+            self._stats.evictions += 1
+        entry = self._entries.get(keep)
+        if entry is not None and entry.size > self._max_bytes:
+            # Larger than the whole budget: serve it, but do not keep it
+            self._bytes -= self._entries.pop(keep).size
+            self._stats.evictions += 1
+
+
+
+class _ContextCacheListener(SessionStoreListener):
+    """Keeps the shared cache of each store in line with its step changes."""
+
+    def on_steps_saved(self, store: SessionStore, steps: list[Step]) -> None:
+        cache = SessionContextCache._shared.get(store)
+        if cache is not None:
+            cache.steps_saved(steps)
+
+    def on_session_changed(self, store: SessionStore, session_id: str) -> None:
+        SessionContextCache.invalidate_store(store, session_id)
+
+
+SessionStore.add_listener(_ContextCacheListener())
+
+
+__all__ = ["ContextCacheStats", "SessionContextCache"]
@@ -201,6 +201,7 @@ class MongoSessionStore(SessionStore):
             await self.steps_collection.update_one(
                 {"id": step.id}, {"$set": step_data}, upsert=True
             )
+            self.notify_steps_saved([step])
         except Exception as e:
             logger.error(
                 "save_step_failed",
@@ -232,6 +233,7 @@ class MongoSessionStore(SessionStore):
 
             if operations:
                 await self.steps_collection.bulk_write(operations)
+                self.notify_steps_saved(steps)
         except Exception as e:
             logger.error("save_steps_batch_failed", error=str(e), count=len(steps))
             raise
@@ -293,6 +295,7 @@ class MongoSessionStore(SessionStore):
 
     async def delete_steps(self, session_id: str, start_seq: int) -> int:
         """Delete steps from a sequence number onwards."""
+        self.notify_session_changed(session_id)
         await self._ensure_connection()
 
         try:
@@ -396,6 +399,57 @@ class MongoSessionStore(SessionStore):
             )
             raise
 
+    async def allocate_sequence_block(self, session_id: str, size: int) -> range:
+        """
+        Atomically reserve a contiguous block of sequence numbers.
+
+        The counter is first raised to the highest persisted sequence ($max),
+        then incremented by size; both updates are atomic on their own.
+
+        Args:
+            session_id: Session ID
+            size: Number of sequences to reserve
+
+        Returns:
+            Reserved sequence range
+        """
+        await self._ensure_connection()
+
+        try:
+            max_seq = await self.get_max_sequence(session_id)
+            await self.counters_collection.update_one(
+                {"session_id": session_id},
+                {"$max": {"sequence": max_seq}},
+                upsert=True,
+            )
+            result = await self.counters_collection.find_one_and_update(
+                {"session_id": session_id},
+                {"$inc": {"sequence": size}},
+                return_document=True,
+            )
+            end = result["sequence"]
+            return range(end - size + 1, end + 1)
+        except Exception as e:
+            logger.error(
+                "allocate_sequence_block_failed", error=str(e), session_id=session_id
+            )
+            raise
+
+    async def get_step_by_id(self, session_id: str, step_id: str) -> Step | None:
+        """Get a Step by id."""
+        await self._ensure_connection()
+
+        try:
+            doc = await self.steps_collection.find_one(
+                {"session_id": session_id, "id": step_id}
+            )
+            if doc:
+                return Step.model_validate(doc)
+            return None
+        except Exception as e:
+            logger.error("get_step_by_id_failed", error=str(e), step_id=step_id)
+            raise
+
     async def get_step_by_tool_call_id(
         self,
         session_id: str,
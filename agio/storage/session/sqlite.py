@@ -23,8 +23,66 @@ class SQLiteSessionStore(SessionStore):
     - counters: Stores sequence counters for atomic allocation
     """
 
-    def __init__(self, db_path: str = "agio.db") -> None:
+    # Step columns added after the initial schema (migrated on connect)
+    _ADDED_STEP_COLUMNS = (
+        "content_for_user",
+        "llm_snapshot_id",
+        "llm_parent_snapshot_id",
+        "llm_tools_hash",
+    )
+
+    # Fixed column list for the prepared step upsert statement
+    _STEP_COLUMNS = (
+        "id",
+        "session_id",
+        "run_id",
+        "sequence",
+        "runnable_id",
+        "runnable_type",
+        "role",
+        "content",
+        "content_for_user",
+        "reasoning_content",
+        "tool_calls",
+        "tool_call_id",
+        "name",
+        "metrics",
+        "created_at",
+        "parent_run_id",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "depth",
+        "llm_messages",
+        "llm_tools",
+        "llm_request_params",
+        "llm_snapshot_id",
+        "llm_parent_snapshot_id",
+        "llm_tools_hash",
+    )
+    _STEP_JSON_COLUMNS = frozenset(
+        {"tool_calls", "metrics", "llm_messages", "llm_tools", "llm_request_params"}
+    )
+    _UPSERT_STEP_SQL = (
+        f"INSERT OR REPLACE INTO steps ({', '.join(_STEP_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in _STEP_COLUMNS)})"
+    )
+
+    def __init__(
+        self,
+        db_path: str = "agio.db",
+        journal_mode: str | None = "WAL",
+        synchronous: str | None = "NORMAL",
+    ) -> None:
+        """
+        Args:
+            db_path: SQLite database file path
+            journal_mode: PRAGMA journal_mode applied on connect (None keeps the default)
+            synchronous: PRAGMA synchronous applied on connect (None keeps the default)
+        """
         self.db_path = db_path
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
         self._connection: aiosqlite.Connection | None = None
         self._initialized = False
 
@@ -36,10 +94,16 @@ class SQLiteSessionStore(SessionStore):
         self._connection = await aiosqlite.connect(self.db_path)
         self._connection.row_factory = aiosqlite.Row
 
+        await self._apply_pragmas()
         await self._create_tables()
         self._initialized = True
 
-        logger.info("sqlite_connected", db_path=self.db_path)
+        logger.info(
+            "sqlite_connected",
+            db_path=self.db_path,
+            journal_mode=self.journal_mode,
+            synchronous=self.synchronous,
+        )
 
     async def disconnect(self) -> None:
         """Close database connection."""
@@ -48,6 +112,13 @@ class SQLiteSessionStore(SessionStore):
             self._connection = None
             self._initialized = False
 
+    async def _apply_pragmas(self) -> None:
+        """Apply connection-level PRAGMAs (journal mode, sync level)."""
+        if self.journal_mode:
+            await self._connection.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        if self.synchronous:
+            await self._connection.execute(f"PRAGMA synchronous={self.synchronous}")
+
     async def _create_tables(self) -> None:
         """Create database tables and indexes."""
         if not self._connection:
@@ -86,6 +157,7 @@ class SQLiteSessionStore(SessionStore):
                 runnable_type TEXT,
                 role TEXT NOT NULL,
                 content TEXT,
+                content_for_user TEXT,
                 reasoning_content TEXT,
                 tool_calls TEXT,
                 tool_call_id TEXT,
@@ -100,10 +172,14 @@ class SQLiteSessionStore(SessionStore):
                 llm_messages TEXT,
                 llm_tools TEXT,
                 llm_request_params TEXT,
+                llm_snapshot_id TEXT,
+                llm_parent_snapshot_id TEXT,
+                llm_tools_hash TEXT,
                 UNIQUE(session_id, sequence)
             )
         """
         )
+        await self._migrate_step_columns()
 
         # Create counters table for atomic sequence allocation
         await self._connection.execute(
@@ -147,6 +223,17 @@ class SQLiteSessionStore(SessionStore):
 
         await self._connection.commit()
 
+    async def _migrate_step_columns(self) -> None:
+        """Add columns introduced after the steps table was first created."""
+        async with self._connection.execute("PRAGMA table_info(steps)") as cursor:
+            existing = {row[1] async for row in cursor}
+
+        for column in self._ADDED_STEP_COLUMNS:
+            if column not in existing:
+                await self._connection.execute(
+                    f"ALTER TABLE steps ADD COLUMN {column} TEXT"
+                )
+
     async def _ensure_connection(self) -> None:
         """Ensure database connection is established."""
         if not self._initialized:
@@ -180,6 +267,16 @@ class SQLiteSessionStore(SessionStore):
 
         return data
 
+    def _step_row(self, step: Step) -> tuple:
+        """Serialize a Step into a row tuple ordered by _STEP_COLUMNS."""
+        data = step.model_dump(mode="json")
+        return tuple(
+            json.dumps(data[column])
+            if column in self._STEP_JSON_COLUMNS and data[column] is not None
+            else data[column]
+            for column in self._STEP_COLUMNS
+        )
+
     def _deserialize_run(self, row: aiosqlite.Row) -> Run:
         """Deserialize database row to Run model."""
         data = dict(row)
@@ -313,22 +410,11 @@ class SQLiteSessionStore(SessionStore):
         await self._ensure_connection()
 
         try:
-            data = self._serialize_model(step)
-
-            # Build INSERT OR REPLACE query
-            columns = ", ".join(data.keys())
-            placeholders = ", ".join(["?" for _ in data])
-            values = list(data.values())
-
-            query = f"""
-                INSERT OR REPLACE INTO steps ({columns})
-                VALUES ({placeholders})
-            """
-
             if self._connection is None:
                 raise RuntimeError("Database connection not established")
-            await self._connection.execute(query, values)
+            await self._connection.execute(self._UPSERT_STEP_SQL, self._step_row(step))
             await self._connection.commit()
+            self.notify_steps_saved([step])
         except Exception as e:
             logger.error(
                 "save_step_failed",
@@ -340,15 +426,28 @@ class SQLiteSessionStore(SessionStore):
             raise
 
     async def save_steps_batch(self, steps: list[Step]) -> None:
-        """Batch save steps."""
+        """
+        Batch save steps.
+
+        All rows are written with a single prepared statement (executemany)
+        inside one transaction, so either the whole batch is stored or none of it.
+        """
         if not steps:
             return
 
         await self._ensure_connection()
 
         try:
-            for step in steps:
-                await self.save_step(step)
+            if self._connection is None:
+                raise RuntimeError("Database connection not established")
+            rows = [self._step_row(step) for step in steps]
+            try:
+                await self._connection.executemany(self._UPSERT_STEP_SQL, rows)
+                await self._connection.commit()
+            except Exception:
+                await self._connection.rollback()
+                raise
+            self.notify_steps_saved(steps)
         except Exception as e:
             logger.error("save_steps_batch_failed", error=str(e), count=len(steps))
             raise
@@ -417,6 +516,7 @@ class SQLiteSessionStore(SessionStore):
 
     async def delete_steps(self, session_id: str, start_seq: int) -> int:
         """Delete steps from a sequence number onwards."""
+        self.notify_session_changed(session_id)
         await self._ensure_connection()
 
         try:
@@ -522,6 +622,69 @@ class SQLiteSessionStore(SessionStore):
             )
             raise
 
+    async def allocate_sequence_block(self, session_id: str, size: int) -> range:
+        """
+        Atomically reserve a contiguous block of sequence numbers.
+
+        The counter is reconciled with MAX(sequence) of persisted steps inside
+        the same write transaction, so leases never collide with existing steps.
+
+        Args:
+            session_id: Session ID
+            size: Number of sequences to reserve
+
+        Returns:
+            Reserved sequence range
+        """
+        await self._ensure_connection()
+
+        try:
+            if self._connection is None:
+                raise RuntimeError("Database connection not established")
+            await self._connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                async with self._connection.execute(
+                    "SELECT sequence FROM counters WHERE session_id = ?", (session_id,)
+                ) as cursor:
+                    row = await cursor.fetchone()
+                counter = row[0] if row else 0
+                high_water = max(counter, await self.get_max_sequence(session_id))
+
+                await self._connection.execute(
+                    "INSERT OR REPLACE INTO counters (session_id, sequence) VALUES (?, ?)",
+                    (session_id, high_water + size),
+                )
+                await self._connection.commit()
+                return range(high_water + 1, high_water + size + 1)
+            except Exception:
+                await self._connection.rollback()
+                raise
+        except Exception as e:
+            logger.error(
+                "allocate_sequence_block_failed", error=str(e), session_id=session_id
+            )
+            raise
+
+    async def get_step_by_id(self, session_id: str, step_id: str) -> Step | None:
+        """Get a Step by id."""
+        await self._ensure_connection()
+
+        try:
+            if self._connection is None:
+                raise RuntimeError("Database connection not established")
+            async with self._connection.execute(
+                "SELECT * FROM steps WHERE session_id = ? AND id = ?",
+                (session_id, step_id),
+            ) as cursor:
+                row = await cursor.fetchone()
+                if row:
+                    return self._deserialize_step(row)
+                return None
+        except Exception as e:
+            logger.error("get_step_by_id_failed", error=str(e), step_id=step_id)
+            raise
+
     async def get_step_by_tool_call_id(
         self,
         session_id: str,
@@ -9,7 +9,14 @@ This module contains:
 """
 
 from .base import BaseTool, RiskLevel, ToolCategory, ToolDefinition
-from .cache import ToolResultCache, get_tool_cache
+from .cache import (
+    CacheStats,
+    InMemoryToolResultCache,
+    TieredToolResultCache,
+    ToolResultCache,
+    ToolResultCacheBackend,
+    get_tool_cache,
+)
 from .registry import (
     ToolRegistry,
     create_tool,
@@ -31,6 +38,10 @@ __all__ = [
     "create_tool",
     "list_tools",
     # Cache
+    "CacheStats",
+    "InMemoryToolResultCache",
+    "TieredToolResultCache",
     "ToolResultCache",
+    "ToolResultCacheBackend",
     "get_tool_cache",
 ]
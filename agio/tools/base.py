@@ -44,6 +44,7 @@ class ToolDefinition(BaseModel):
     is_concurrency_safe: bool = True
     timeout_seconds: int = 30
     cacheable: bool = False  # Whether tool results can be cached within a session
+    cache_ttl_seconds: int | None = None  # Cache TTL override (None = cache default)
 
 
 class BaseTool(ABC):
@@ -52,6 +53,12 @@ class BaseTool(ABC):
     # Override to enable caching for expensive operations
     # Cached results are reused within the same session for identical arguments
     cacheable: bool = False
+    # Override the cache TTL for this tool (None = cache default)
+    cache_ttl_seconds: int | None = None
+
+    # Tools that run nested agents do not take a process-wide concurrency slot,
+    # otherwise parents waiting on their children could exhaust the slots
+    runs_nested_tools: bool = False
 
     def __init__(self) -> None:
         self.name = self.get_name()
@@ -92,6 +99,22 @@ class BaseTool(ABC):
             ToolResult: Tool execution result
         """
 
+    def get_resource_key(self, parameters: dict[str, Any]) -> str | None:
+        """
+        Return the resource a call operates on, for scheduling.
+
+        Calls of tools that are not concurrency-safe are serialized against
+        other calls on an overlapping resource. The default uses the
+        `file_path` or `path` argument; None means the resource is unknown
+        (an unsafe call is then run exclusively).
+        """
+        path = parameters.get("file_path") or parameters.get("path")
+        if isinstance(path, str) and path:
+            from agio.tools.scheduler import normalize_resource
+
+            return normalize_resource(path)
+        return None
+
     def get_definition(self) -> ToolDefinition:
         """Construct a `ToolDefinition` for LLM-facing registration."""
         return ToolDefinition(
@@ -103,6 +126,7 @@ class BaseTool(ABC):
             is_concurrency_safe=self.is_concurrency_safe(),
             timeout_seconds=getattr(self, "timeout_seconds", 30),
             cacheable=self.cacheable,
+            cache_ttl_seconds=self.cache_ttl_seconds,
         )
 
     def to_openai_schema(self) -> dict:
@@ -3,54 +3,213 @@ Tool Result Cache - Cache expensive tool results within a session.
 
 Caching is controlled by tool's `cacheable` attribute.
 ToolExecutor checks this attribute before using cache.
+
+Backends implement the ToolResultCacheBackend protocol:
+- InMemoryToolResultCache: per-process LRU partitioned by session, bounded by
+  a global byte budget
+- SQLiteToolResultCache: compressed entries in a SQLite file that several
+  worker processes can share (see sqlite_cache.py)
+- TieredToolResultCache: in-memory L1 in front of a shared L2
+
+Entries expire after a TTL (per-tool override via `cache_ttl_seconds`) and are
+dropped on read and by a periodic sweeper task.
 """
 
+import asyncio
+import contextlib
 import hashlib
+import json
 import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Protocol, runtime_checkable
 
 from agio.domain import ToolResult
 from agio.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
 
 @dataclass
 class CacheEntry:
     """A cached tool result."""
 
     result: ToolResult
+    size: int
+    expires_at: float
     created_at: float = field(default_factory=time.time)
 
 
-class ToolResultCache:
+@dataclass
+class CacheStats:
+    """Tool cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+    sessions: int = 0
+
+
+def make_cache_key(tool_name: str, args: dict[str, Any]) -> str:
+    """Create a cache key from tool and arguments (within a session)."""
+    # Filter out internal args (starting with _) and the per-call id
+    clean_args = {
+        k: v
+        for k, v in sorted(args.items())
+        if not k.startswith("_") and k != "tool_call_id"
+    }
+    args_str = json.dumps(clean_args, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(f"{tool_name}:{args_str}".encode()).hexdigest()
+
+
+def estimate_result_size(result: ToolResult) -> int:
+    """Approximate the memory footprint of a ToolResult in bytes."""
+    size = len(result.content.encode("utf-8"))
+    if result.content_for_user:
+        size += len(result.content_for_user.encode("utf-8"))
+    if result.output is not None:
+        if isinstance(result.output, (str, bytes)):
+            size += len(result.output)
+        else:
+            size += len(json.dumps(result.output, ensure_ascii=False, default=str))
+    return size
+
+
+@runtime_checkable
+class ToolResultCacheBackend(Protocol):
     """
-    In-memory cache for tool results.
+    Tool result cache backend.
 
     Cache is scoped to a session. Whether to use cache is determined
     by tool's `cacheable` attribute, checked by ToolExecutor.
     """
 
-    def __init__(self, ttl_seconds: int = 3600) -> None:
+    async def get_entry(
+        self, session_id: str, tool_name: str, args: dict[str, Any]
+    ) -> CacheEntry | None:
+        """Get the cached entry if it exists and is not expired."""
+        ...
+
+    async def get(
+        self, session_id: str, tool_name: str, args: dict[str, Any]
+    ) -> ToolResult | None:
+        """Get the cached result if it exists and is not expired."""
+        ...
+
+    async def set(
+        self,
+        session_id: str,
+        tool_name: str,
+        args: dict[str, Any],
+        result: ToolResult,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Cache a successful tool result."""
+        ...
+
+    async def clear_session(self, session_id: str) -> int:
+        """Clear all entries of a session and return how many were removed."""
+        ...
+
+    async def clear_all(self) -> None:
+        """Clear the entire cache."""
+        ...
+
+    async def sweep_expired(self) -> int:
+        """Drop expired entries and return how many were removed."""
+        ...
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of cache counters."""
+        ...
+
+    def start_sweeper(self) -> None:
+        """Start the periodic TTL sweeper on the running event loop."""
+        ...
+
+    async def stop_sweeper(self) -> None:
+        """Stop the periodic TTL sweeper."""
+        ...
+
+
+class _SweepingCache(ABC):
+    """Periodic TTL sweeper shared by cache backends."""
+
+    _sweep_interval: float = 60.0
+    _sweeper: asyncio.Task | None = None
+
+    @abstractmethod
+    async def sweep_expired(self) -> int:
+        """Drop expired entries and return how many were removed."""
+
+    def start_sweeper(self) -> None:
+        """Start the periodic TTL sweeper on the running event loop."""
+        if self._sweeper is not None and not self._sweeper.done():
+            return
+        self._sweeper = asyncio.create_task(self._sweep_loop())
+
+    async def stop_sweeper(self) -> None:
+        """Stop the periodic TTL sweeper."""
+        if self._sweeper is None:
+            return
+        self._sweeper.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._sweeper
+        self._sweeper = None
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._sweep_interval)
+            try:
+                removed = await self.sweep_expired()
+            except Exception as e:
+                logger.warning("tool_cache_sweep_failed", error=str(e))
+                continue
+            if removed:
+                logger.debug("tool_cache_swept", cache=type(self).__name__, removed=removed)
+
+
+class InMemoryToolResultCache(_SweepingCache):
+    """
+    Bounded in-memory LRU cache for tool results.
+
+    Entries are partitioned by session; least recently used entries are
+    evicted once the global byte budget is exceeded.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 3600,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        sweep_interval: float = 60.0,
+    ) -> None:
         """
         Initialize cache.
 
         Args:
-            ttl_seconds: Time-to-live for cache entries (default: 1 hour)
+            ttl_seconds: Default time-to-live for cache entries (default: 1 hour)
+            max_bytes: Global byte budget across all sessions
+            sweep_interval: Seconds between background TTL sweeps
         """
-        self._cache: dict[str, CacheEntry] = {}
         self._ttl = ttl_seconds
-
-    def _make_key(self, session_id: str, tool_name: str, args: dict[str, Any]) -> str:
-        """Create a cache key from session, tool, and arguments."""
-        # Filter out internal args (starting with _)
-        clean_args = {k: v for k, v in sorted(args.items()) if not k.startswith("_")}
-        args_str = str(clean_args)
-        key_str = f"{session_id}:{tool_name}:{args_str}"
-        return hashlib.sha256(key_str.encode()).hexdigest()[:16]
-
-    def get(
+        self._max_bytes = max_bytes
+        self._sweep_interval = sweep_interval
+
+        # Global LRU order over (session_id, key); oldest first
+        self._entries: OrderedDict[tuple[str, str], CacheEntry] = OrderedDict()
+        # session_id -> keys, for per-session clearing
+        self._sessions: dict[str, set[str]] = {}
+        self._bytes = 0
+        self._stats = CacheStats()
+        self._sweeper: asyncio.Task | None = None
+
+    async def get(
         self,
         session_id: str,
         tool_name: str,
@@ -67,30 +226,45 @@ class ToolResultCache:
         Returns:
             Cached ToolResult or None
         """
-        key = self._make_key(session_id, tool_name, args)
-        entry = self._cache.get(key)
+        entry = await self.get_entry(session_id, tool_name, args)
+        return entry.result if entry else None
+
+    async def get_entry(
+        self,
+        session_id: str,
+        tool_name: str,
+        args: dict[str, Any],
+    ) -> CacheEntry | None:
+        """Get the cached entry if it exists and is not expired."""
+        entry_key = (session_id, make_cache_key(tool_name, args))
+        entry = self._entries.get(entry_key)
 
         if entry is None:
+            self._stats.misses += 1
             return None
 
-        # Check TTL
-        if time.time() - entry.created_at > self._ttl:
-            del self._cache[key]
+        if time.time() >= entry.expires_at:
+            self._remove(entry_key)
+            self._stats.expirations += 1
+            self._stats.misses += 1
             return None
 
+        self._entries.move_to_end(entry_key)
+        self._stats.hits += 1
         logger.debug(
             "tool_cache_hit",
             tool_name=tool_name,
             session_id=session_id,
         )
-        return entry.result
+        return entry
 
-    def set(
+    async def set(
         self,
         session_id: str,
         tool_name: str,
         args: dict[str, Any],
         result: ToolResult,
+        ttl_seconds: float | None = None,
     ) -> None:
         """
         Cache a tool result.
@@ -100,20 +274,37 @@ class ToolResultCache:
             tool_name: Tool name
             args: Tool arguments
             result: Tool execution result
+            ttl_seconds: Per-tool TTL override (defaults to the cache TTL)
         """
         if not result.is_success:
             return
 
-        key = self._make_key(session_id, tool_name, args)
-        self._cache[key] = CacheEntry(result=result)
+        size = estimate_result_size(result)
+        if size > self._max_bytes:
+            logger.debug("tool_cache_skip_oversized", tool_name=tool_name, size=size)
+            return
+
+        key = make_cache_key(tool_name, args)
+        entry_key = (session_id, key)
+        if entry_key in self._entries:
+            self._remove(entry_key)
+
+        ttl = self._ttl if ttl_seconds is None else ttl_seconds
+        self._entries[entry_key] = CacheEntry(
+            result=result, size=size, expires_at=time.time() + ttl
+        )
+        self._sessions.setdefault(session_id, set()).add(key)
+        self._bytes += size
+        self._evict_to_budget()
 
         logger.debug(
             "tool_cache_set",
             tool_name=tool_name,
             session_id=session_id,
+            size=size,
         )
 
-    def clear_session(self, session_id: str) -> int:
+    async def clear_session(self, session_id: str) -> int:
         """
         Clear all cache entries for a session.
 
@@ -123,31 +314,206 @@ class ToolResultCache:
         Returns:
             Number of entries cleared
         """
-        # This is O(n) but cache size should be small
-        keys_to_delete = [
-            k
-            for k in self._cache
-            if k.startswith(session_id[:16])  # Rough prefix match
-        ]
-        for k in keys_to_delete:
-            del self._cache[k]
-        return len(keys_to_delete)
-
-    def clear_all(self) -> None:
+        keys = self._sessions.pop(session_id, set())
+        for key in keys:
+            entry = self._entries.pop((session_id, key), None)
+            if entry is not None:
+                self._bytes -= entry.size
+        return len(keys)
+
+    async def clear_all(self) -> None:
         """Clear entire cache."""
-        self._cache.clear()
+        self._entries.clear()
+        self._sessions.clear()
+        self._bytes = 0
+
+    async def sweep_expired(self) -> int:
+        """
+        Drop all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        expired = [k for k, entry in self._entries.items() if now >= entry.expires_at]
+        for entry_key in expired:
+            self._remove(entry_key)
+        self._stats.expirations += len(expired)
+        return len(expired)
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of cache counters."""
+        return CacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            expirations=self._stats.expirations,
+            entries=len(self._entries),
+            bytes=self._bytes,
+            sessions=len(self._sessions),
+        )
+
+    def _evict_to_budget(self) -> None:
+        while self._bytes > self._max_bytes and self._entries:
+            entry_key = next(iter(self._entries))
+            self._remove(entry_key)
+            self._stats.evictions += 1
 
+    def _remove(self, entry_key: tuple[str, str]) -> None:
+        entry = self._entries.pop(entry_key)
+        self._bytes -= entry.size
+        session_id, key = entry_key
+        keys = self._sessions.get(session_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._sessions[session_id]
 
-# Global cache instance (can be replaced with Redis etc. later)
-_global_cache: ToolResultCache | None = None
 
+class TieredToolResultCache(_SweepingCache):
+    """
+    In-memory L1 in front of a shared L2 backend.
+
+    Reads hit the L1 first and populate it from the L2 (keeping the L2 expiry);
+    writes go to both. L2 failures are logged and treated as misses, so a
+    broken shared cache never fails a tool call.
+    """
 
-def get_tool_cache() -> ToolResultCache:
+    def __init__(
+        self,
+        l1: InMemoryToolResultCache,
+        l2: ToolResultCacheBackend,
+        sweep_interval: float = 60.0,
+    ) -> None:
+        """
+        Args:
+            l1: Per-process in-memory cache
+            l2: Shared backend (e.g. SQLiteToolResultCache)
+            sweep_interval: Seconds between background TTL sweeps
+        """
+        self.l1 = l1
+        self.l2 = l2
+        self._sweep_interval = sweep_interval
+        self._sweeper: asyncio.Task | None = None
+
+    async def get(
+        self, session_id: str, tool_name: str, args: dict[str, Any]
+    ) -> ToolResult | None:
+        """Get the cached result from L1, falling back to L2."""
+        entry = await self.get_entry(session_id, tool_name, args)
+        return entry.result if entry else None
+
+    async def get_entry(
+        self, session_id: str, tool_name: str, args: dict[str, Any]
+    ) -> CacheEntry | None:
+        """Get the cached entry from L1, falling back to L2."""
+        entry = await self.l1.get_entry(session_id, tool_name, args)
+        if entry is not None:
+            return entry
+
+        try:
+            entry = await self.l2.get_entry(session_id, tool_name, args)
+        except Exception as e:
+            logger.warning("tool_cache_l2_get_failed", tool_name=tool_name, error=str(e))
+            return None
+
+        if entry is not None:
+            await self.l1.set(
+                session_id,
+                tool_name,
+                args,
+                entry.result,
+                ttl_seconds=entry.expires_at - time.time(),
+            )
+        return entry
+
+    async def set(
+        self,
+        session_id: str,
+        tool_name: str,
+        args: dict[str, Any],
+        result: ToolResult,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Cache a tool result in both tiers."""
+        await self.l1.set(session_id, tool_name, args, result, ttl_seconds=ttl_seconds)
+        try:
+            await self.l2.set(session_id, tool_name, args, result, ttl_seconds=ttl_seconds)
+        except Exception as e:
+            logger.warning("tool_cache_l2_set_failed", tool_name=tool_name, error=str(e))
+
+    async def clear_session(self, session_id: str) -> int:
+        """Clear a session in both tiers."""
+        cleared = await self.l1.clear_session(session_id)
+        return max(cleared, await self.l2.clear_session(session_id))
+
+    async def clear_all(self) -> None:
+        """Clear both tiers."""
+        await self.l1.clear_all()
+        await self.l2.clear_all()
+
+    async def sweep_expired(self) -> int:
+        """Drop expired entries from both tiers."""
+        return await self.l1.sweep_expired() + await self.l2.sweep_expired()
+
+    def stats(self) -> CacheStats:
+        """Combined counters; sizes are those of the shared tier."""
+        l1 = self.l1.stats()
+        l2 = self.l2.stats()
+        return CacheStats(
+            hits=l1.hits + l2.hits,
+            misses=l2.misses,
+            evictions=l1.evictions + l2.evictions,
+            expirations=l1.expirations + l2.expirations,
+            entries=l2.entries,
+            bytes=l2.bytes,
+            sessions=l2.sessions,
+        )
+
+
+# Original name of the in-memory cache
+ToolResultCache = InMemoryToolResultCache
+
+
+# Global cache instance (selected by AGIO_TOOL_CACHE_BACKEND)
+_global_cache: ToolResultCacheBackend | None = None
+
+
+def get_tool_cache() -> ToolResultCacheBackend:
     """Get the global tool cache instance."""
     global _global_cache
     if _global_cache is None:
-        _global_cache = ToolResultCache()
+        from agio.config import settings
+
+        l1 = InMemoryToolResultCache(
+            ttl_seconds=settings.tool_cache_ttl_seconds,
+            max_bytes=settings.tool_cache_max_bytes,
+            sweep_interval=settings.tool_cache_sweep_interval,
+        )
+        if settings.tool_cache_backend == "sqlite":
+            from agio.tools.sqlite_cache import SQLiteToolResultCache
+
+            _global_cache = TieredToolResultCache(
+                l1,
+                SQLiteToolResultCache(
+                    db_path=settings.tool_cache_path,
+                    ttl_seconds=settings.tool_cache_ttl_seconds,
+                    max_bytes=settings.tool_cache_disk_max_bytes,
+                ),
+                sweep_interval=settings.tool_cache_sweep_interval,
+            )
+        else:
+            _global_cache = l1
     return _global_cache
 
 
-__all__ = ["ToolResultCache", "get_tool_cache"]
+__all__ = [
+    "CacheEntry",
+    "CacheStats",
+    "InMemoryToolResultCache",
+    "TieredToolResultCache",
+    "ToolResultCache",
+    "ToolResultCacheBackend",
+    "get_tool_cache",
+    "make_cache_key",
+]
@@ -6,6 +6,8 @@ import asyncio
 import contextlib
 import json
 import time
+import weakref
+from collections.abc import AsyncIterator
 from dataclasses import replace
 from typing import Any
 
@@ -14,7 +16,13 @@ from agio.runtime.control import AbortSignal
 from agio.runtime.permission.manager import PermissionManager
 from agio.runtime.protocol import ExecutionContext
 from agio.tools import BaseTool
-from agio.tools.cache import ToolResultCache, get_tool_cache
+from agio.tools.cache import ToolResultCacheBackend, get_tool_cache
+from agio.tools.scheduler import (
+    ScheduledCall,
+    get_global_tool_semaphore,
+    parse_tool_arguments,
+    plan_tool_calls,
+)
 from agio.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -26,7 +34,7 @@ class ToolExecutor:
     def __init__(
         self,
         tools: list["BaseTool"],
-        cache: "ToolResultCache | None" = None,
+        cache: "ToolResultCacheBackend | None" = None,
         permission_manager: "PermissionManager | None" = None,
         default_timeout: float | None = None,
     ) -> None:
@@ -43,6 +51,10 @@ class ToolExecutor:
         self._cache = cache or get_tool_cache()
         self._permission_manager = permission_manager
         self._default_timeout = default_timeout
+        # run_id -> semaphore; entries disappear once no batch of the run holds them
+        self._run_semaphores: weakref.WeakValueDictionary[str, asyncio.Semaphore] = (
+            weakref.WeakValueDictionary()
+        )
 
     async def execute(
         self,
@@ -150,7 +162,7 @@ class ToolExecutor:
         # Check cache for cacheable tools
         session_id = context.session_id
         if session_id and tool.cacheable:
-            cached = self._cache.get(session_id, fn_name, args)
+            cached = await self._cache.get(session_id, fn_name, args)
             if cached is not None:
                 # Update tool_call_id to match current call
                 return ToolResult(
@@ -191,7 +203,13 @@ class ToolExecutor:
 
             # Cache successful results for cacheable tools
             if session_id and tool.cacheable and result.is_success:
-                self._cache.set(session_id, fn_name, args, result)
+                await self._cache.set(
+                    session_id,
+                    fn_name,
+                    args,
+                    result,
+                    ttl_seconds=getattr(tool, "cache_ttl_seconds", None),
+                )
 
             return result
         except asyncio.CancelledError:
@@ -222,23 +240,80 @@ class ToolExecutor:
         tool_calls: list[dict[str, Any]],
         context: "ExecutionContext",
         abort_signal: "AbortSignal | None" = None,
+        parallel: bool = True,
+        max_concurrency: int | None = None,
     ) -> list[ToolResult]:
         """
-        Execute multiple tool calls in parallel.
+        Execute multiple tool calls, in parallel where it is safe.
+
+        Concurrency-safe tools run in parallel; unsafe tools are serialized
+        against earlier calls on the same resource (see agio.tools.scheduler).
+        Concurrency is capped per run (max_concurrency) and process-wide.
 
         Args:
             tool_calls: List of tool calls
             context: Execution context
             abort_signal: Abort signal
+            parallel: If False, execute the calls one after another
+            max_concurrency: Maximum concurrently executing calls of this run
 
         Returns:
-            list[ToolResult]: List of tool execution results
+            list[ToolResult]: Results in the original tool_call order
+        """
+        results: list[ToolResult | None] = [None] * len(tool_calls)
+        async for index, result in self.execute_stream(
+            tool_calls,
+            context,
+            abort_signal=abort_signal,
+            parallel=parallel,
+            max_concurrency=max_concurrency,
+        ):
+            results[index] = result
+        return results
+
+    async def execute_stream(
+        self,
+        tool_calls: list[dict[str, Any]],
+        context: "ExecutionContext",
+        abort_signal: "AbortSignal | None" = None,
+        parallel: bool = True,
+        max_concurrency: int | None = None,
+        prestarted: dict[str, "asyncio.Task[ToolResult]"] | None = None,
+    ) -> AsyncIterator[tuple[int, ToolResult]]:
+        """
+        Execute multiple tool calls and yield each result as soon as it completes.
+
+        Scheduling is the same as execute_batch. Closing the iterator early
+        cancels the calls that are still running.
+
+        Args:
+            tool_calls: List of tool calls
+            context: Execution context
+            abort_signal: Abort signal
+            parallel: If False, execute the calls one after another
+            max_concurrency: Maximum concurrently executing calls of this run
+            prestarted: tool_call_id -> task already started with start_speculative;
+                its result is used instead of executing the call again
+
+        Yields:
+            (index into tool_calls, ToolResult) in completion order
         """
+        plan = plan_tool_calls(tool_calls, self.tools_map, parallel=parallel)
+        done_events = [asyncio.Event() for _ in plan]
+        run_semaphore = self._get_run_semaphore(context.run_id, max_concurrency)
+        global_semaphore = get_global_tool_semaphore()
 
-        async def _run_single(tc: dict[str, Any]) -> ToolResult:
+        async def _run_single(call: ScheduledCall) -> ToolResult:
+            tc = call.tool_call
             try:
-                return await self.execute(
-                    tc, context=context, abort_signal=abort_signal
+                for dep in call.depends_on:
+                    await done_events[dep].wait()
+
+                started = prestarted.get(tc.get("id")) if prestarted else None
+                if started is not None:
+                    return await started
+                return await self._execute_with_limits(
+                    tc, context, abort_signal, run_semaphore, global_semaphore
                 )
             except Exception as e:  # Defensive: should not propagate
                 fn = tc.get("function", {}) if isinstance(tc, dict) else {}
@@ -257,34 +332,121 @@ class ToolExecutor:
                     error=f"Tool execution failed: {e}",
                     start_time=time.time(),
                 )
+            finally:
+                done_events[call.index].set()
 
-        tasks = [asyncio.create_task(_run_single(tc)) for tc in tool_calls]
-        done, _ = await asyncio.wait(tasks, return_when=asyncio.ALL_COMPLETED)
-
-        results: list[ToolResult] = []
-        for task in tasks:
-            try:
-                results.append(task.result())
-            except asyncio.CancelledError:
-                results.append(
-                    self._create_error_result(
-                        call_id="",
-                        tool_name="unknown",
-                        error="Tool execution was cancelled",
-                        start_time=time.time(),
-                    )
-                )
-            except Exception as e:
-                results.append(
-                    self._create_error_result(
-                        call_id="",
-                        tool_name="unknown",
-                        error=f"Tool execution failed: {e}",
-                        start_time=time.time(),
-                    )
+        tasks = {asyncio.create_task(_run_single(call)): call for call in plan}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
+                for task in sorted(done, key=lambda t: tasks[t].index):
+                    yield tasks[task].index, self._task_result(task, tasks[task])
+        finally:
+            for task in pending:
+                task.cancel()
 
-        return results
+    def can_speculate(
+        self,
+        tool_call: dict[str, Any],
+        context: "ExecutionContext",
+        earlier: list[dict[str, Any]] | None = None,
+    ) -> bool:
+        """
+        Whether a tool call may start before the assistant response has finished.
+
+        Only complete calls of concurrency-safe tools that cannot block on user
+        consent qualify. Tools running nested agents are excluded so their steps
+        are never published ahead of the assistant step that requested them.
+        A call that the scheduler would order after one of the earlier calls of
+        the same response (e.g. a read after a write of the same file) waits
+        for the normal dependency-ordered execution.
+        """
+        tool = self.tools_map.get(tool_call.get("function", {}).get("name", ""))
+        if tool is None or not tool_call.get("id"):
+            return False
+        if not tool.is_concurrency_safe() or tool.runs_nested_tools:
+            return False
+        if parse_tool_arguments(tool_call) is None:
+            return False
+        if earlier and plan_tool_calls([*earlier, tool_call], self.tools_map)[-1].depends_on:
+            return False
+        if self._permission_manager is not None:
+            return not self._permission_manager.requires_consent(tool.name, context)
+        return True
+
+    def start_speculative(
+        self,
+        tool_call: dict[str, Any],
+        context: "ExecutionContext",
+        abort_signal: "AbortSignal | None" = None,
+        max_concurrency: int | None = None,
+    ) -> "asyncio.Task[ToolResult]":
+        """
+        Start a single tool call in the background (see can_speculate).
+
+        The task honors the same per-run and process-wide limits as execute_stream;
+        pass it to execute_stream via `prestarted` to collect its result.
+        """
+        return asyncio.create_task(
+            self._execute_with_limits(
+                tool_call,
+                context,
+                abort_signal,
+                self._get_run_semaphore(context.run_id, max_concurrency),
+                get_global_tool_semaphore(),
+            )
+        )
+
+    async def _execute_with_limits(
+        self,
+        tool_call: dict[str, Any],
+        context: "ExecutionContext",
+        abort_signal: "AbortSignal | None",
+        run_semaphore: asyncio.Semaphore | None,
+        global_semaphore: asyncio.Semaphore,
+    ) -> ToolResult:
+        tool = self.tools_map.get(tool_call.get("function", {}).get("name", ""))
+        async with contextlib.AsyncExitStack() as slots:
+            if run_semaphore is not None:
+                await slots.enter_async_context(run_semaphore)
+            if tool is None or not tool.runs_nested_tools:
+                await slots.enter_async_context(global_semaphore)
+            return await self.execute(tool_call, context=context, abort_signal=abort_signal)
+
+    def _task_result(self, task: asyncio.Task, call: ScheduledCall) -> ToolResult:
+        """Get the result of a finished tool task, mapping failures to error results."""
+        fn = call.tool_call.get("function", {})
+        try:
+            return task.result()
+        except asyncio.CancelledError:
+            return self._create_error_result(
+                call_id=call.tool_call.get("id", ""),
+                tool_name=fn.get("name", "unknown"),
+                error="Tool execution was cancelled",
+                start_time=time.time(),
+            )
+        except Exception as e:
+            return self._create_error_result(
+                call_id=call.tool_call.get("id", ""),
+                tool_name=fn.get("name", "unknown"),
+                error=f"Tool execution failed: {e}",
+                start_time=time.time(),
+            )
+
+    def _get_run_semaphore(
+        self, run_id: str, max_concurrency: int | None
+    ) -> asyncio.Semaphore | None:
+        """Get the semaphore shared by all batches of a run (None = unlimited)."""
+        if not max_concurrency:
+            return None
+        semaphore = self._run_semaphores.get(run_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max_concurrency)
+            self._run_semaphores[run_id] = semaphore
+        return semaphore
 
     def _create_error_result(
         self,
@@ -0,0 +1,137 @@
+"""
+Tool call scheduling - Dependency-aware ordering of a tool call batch.
+
+Concurrency-safe tools run in parallel. Calls of tools that are not
+concurrency-safe (file_write, file_edit, bash, ...) are ordered after every
+earlier call of the batch that touches the same resource:
+
+- A tool's resource is derived from its arguments (see BaseTool.get_resource_key),
+  e.g. the file or directory path. Paths overlap when one contains the other.
+- An unsafe call without a resource key (e.g. bash) is exclusive: it is ordered
+  against every other unsafe call and every call with a resource.
+- Two concurrency-safe calls never depend on each other.
+
+Dependencies only point backwards, so the original tool_call order decides
+who goes first and the graph is always acyclic.
+"""
+
+import asyncio
+import json
+import os
+import weakref
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agio.tools.base import BaseTool
+
+# event loop -> process-wide tool semaphore
+_global_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+@dataclass
+class ScheduledCall:
+    """A tool call with its scheduling constraints."""
+
+    index: int
+    tool_call: dict[str, Any]
+    concurrency_safe: bool
+    resource: str | None
+    depends_on: list[int] = field(default_factory=list)
+
+
+def parse_tool_arguments(tool_call: dict[str, Any]) -> dict[str, Any] | None:
+    """Parse the arguments of an OpenAI-format tool call (None if invalid)."""
+    raw = tool_call.get("function", {}).get("arguments", "{}")
+    if isinstance(raw, dict):
+        return raw
+    try:
+        args = json.loads(raw or "{}")
+    except (TypeError, json.JSONDecodeError):
+        return None
+    return args if isinstance(args, dict) else None
+
+
+def normalize_resource(path: str) -> str:
+    """Normalize a filesystem path into a resource key."""
+    return os.path.normpath(os.path.abspath(os.path.expanduser(path)))
+
+
+def resources_overlap(a: str, b: str) -> bool:
+    """Whether two path resources overlap (equal, or one contains the other)."""
+    if a == b:
+        return True
+    return a.startswith(b.rstrip(os.sep) + os.sep) or b.startswith(a.rstrip(os.sep) + os.sep)
+
+
+def _conflicts(a: ScheduledCall, b: ScheduledCall) -> bool:
+    if a.concurrency_safe and b.concurrency_safe:
+        return False
+    for unsafe, other in ((a, b), (b, a)):
+        if not unsafe.concurrency_safe and unsafe.resource is None:
+            # Exclusive call
+            return not other.concurrency_safe or other.resource is not None
+    if a.resource is None or b.resource is None:
+        return False
+    return resources_overlap(a.resource, b.resource)
+
+
+def plan_tool_calls(
+    tool_calls: list[dict[str, Any]],
+    tools_map: dict[str, "BaseTool"],
+    parallel: bool = True,
+) -> list[ScheduledCall]:
+    """
+    Build the dependency graph of a tool call batch.
+
+    Args:
+        tool_calls: Tool calls in the order the LLM produced them
+        tools_map: Tool name -> tool
+        parallel: If False, every call depends on the previous one
+
+    Returns:
+        ScheduledCall per tool call, in the original order
+    """
+    planned: list[ScheduledCall] = []
+    for index, tool_call in enumerate(tool_calls):
+        tool = tools_map.get(tool_call.get("function", {}).get("name", ""))
+        args = parse_tool_arguments(tool_call)
+        if tool is None or args is None:
+            # Fails fast in ToolExecutor.execute; nothing to protect
+            call = ScheduledCall(index, tool_call, concurrency_safe=True, resource=None)
+        else:
+            call = ScheduledCall(
+                index,
+                tool_call,
+                concurrency_safe=tool.is_concurrency_safe(),
+                resource=tool.get_resource_key(args),
+            )
+
+        if not parallel:
+            call.depends_on = [index - 1] if index else []
+        else:
+            call.depends_on = [prev.index for prev in planned if _conflicts(call, prev)]
+        planned.append(call)
+    return planned
+
+
+def get_global_tool_semaphore() -> asyncio.Semaphore:
+    """Process-wide cap on concurrently executing tools (per event loop)."""
+    loop = asyncio.get_running_loop()
+    semaphore = _global_semaphores.get(loop)
+    if semaphore is None:
+        from agio.config import settings
+
+        semaphore = asyncio.Semaphore(settings.tool_max_concurrency)
+        _global_semaphores[loop] = semaphore
+    return semaphore
+
+
+__all__ = [
+    "ScheduledCall",
+    "get_global_tool_semaphore",
+    "normalize_resource",
+    "parse_tool_arguments",
+    "plan_tool_calls",
+    "resources_overlap",
+]
@@ -0,0 +1,268 @@
+"""
+SQLite-backed tool result cache shared by multiple worker processes.
+
+Values are zlib-compressed ToolResult JSON. The database runs in WAL mode so
+concurrent readers in other processes are not blocked by writers; all blocking
+sqlite3 calls run in a worker thread.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any
+
+from agio.domain import ToolResult
+from agio.tools.cache import CacheEntry, CacheStats, _SweepingCache, make_cache_key
+from agio.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_DISK_MAX_BYTES = 1024 * 1024 * 1024
+
+
+class SQLiteToolResultCache(_SweepingCache):
+    """
+    Tool result cache stored in a SQLite file.
+
+    Entries are keyed by (session_id, key) and evicted least-recently-used
+    first once the compressed size exceeds max_bytes.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "~/.agio/tool_cache.db",
+        ttl_seconds: int = 3600,
+        max_bytes: int = DEFAULT_DISK_MAX_BYTES,
+        compression_level: int = 6,
+        sweep_interval: float = 60.0,
+    ) -> None:
+        """
+        Args:
+            db_path: SQLite file shared by all workers
+            ttl_seconds: Default time-to-live for cache entries
+            max_bytes: Budget for compressed values on disk
+            compression_level: zlib compression level (1-9)
+            sweep_interval: Seconds between background TTL sweeps
+        """
+        self.db_path = os.path.expanduser(db_path)
+        self._ttl = ttl_seconds
+        self._max_bytes = max_bytes
+        self._compression_level = compression_level
+        self._sweep_interval = sweep_interval
+        self._sweeper: asyncio.Task | None = None
+
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._stats = CacheStats()
+
+    # --- Connection (worker thread) ---
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(
+                self.db_path, timeout=30.0, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tool_cache (
+                    session_id TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    tool_name TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (session_id, key)
+                )
+            """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tool_cache_expires ON tool_cache(expires_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tool_cache_accessed ON tool_cache(accessed_at)"
+            )
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, fn, *args):
+        def call():
+            with self._lock:
+                return fn(self._connection(), *args)
+
+        return await asyncio.to_thread(call)
+
+    # --- ToolResultCacheBackend ---
+
+    async def get(
+        self, session_id: str, tool_name: str, args: dict[str, Any]
+    ) -> ToolResult | None:
+        """Get cached result if exists and not expired."""
+        entry = await self.get_entry(session_id, tool_name, args)
+        return entry.result if entry else None
+
+    async def get_entry(
+        self, session_id: str, tool_name: str, args: dict[str, Any]
+    ) -> CacheEntry | None:
+        """Get the cached entry if it exists and is not expired."""
+        key = make_cache_key(tool_name, args)
+        row = await self._run(self._get_row, session_id, key)
+
+        if row is None:
+            self._stats.misses += 1
+            return None
+
+        value, size, created_at, expires_at = row
+        if time.time() >= expires_at:
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+
+        self._stats.hits += 1
+        return CacheEntry(
+            result=ToolResult.model_validate_json(zlib.decompress(value)),
+            size=size,
+            expires_at=expires_at,
+            created_at=created_at,
+        )
+
+    async def set(
+        self,
+        session_id: str,
+        tool_name: str,
+        args: dict[str, Any],
+        result: ToolResult,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Cache a tool result."""
+        if not result.is_success:
+            return
+
+        try:
+            payload = result.model_dump_json().encode("utf-8")
+        except Exception as e:
+            logger.debug("tool_cache_unserializable", tool_name=tool_name, error=str(e))
+            return
+
+        value = zlib.compress(payload, self._compression_level)
+        if len(value) > self._max_bytes:
+            return
+
+        now = time.time()
+        ttl = self._ttl if ttl_seconds is None else ttl_seconds
+        row = (
+            session_id,
+            make_cache_key(tool_name, args),
+            tool_name,
+            value,
+            len(value),
+            now,
+            now + ttl,
+            now,
+        )
+        evicted = await self._run(self._put_row, row)
+        self._stats.evictions += evicted
+
+    async def clear_session(self, session_id: str) -> int:
+        """Clear all cache entries for a session."""
+        return await self._run(
+            lambda conn: conn.execute(
+                "DELETE FROM tool_cache WHERE session_id = ?", (session_id,)
+            ).rowcount
+        )
+
+    async def clear_all(self) -> None:
+        """Clear entire cache."""
+        await self._run(lambda conn: conn.execute("DELETE FROM tool_cache"))
+        self._stats.entries = 0
+        self._stats.bytes = 0
+        self._stats.sessions = 0
+
+    async def sweep_expired(self) -> int:
+        """Drop all expired entries and refresh size counters."""
+        removed = await self._run(self._sweep)
+        self._stats.expirations += removed
+        return removed
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of cache counters (entry counts as of the last sweep)."""
+        return CacheStats(**vars(self._stats))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # --- SQL (run in worker thread under self._lock) ---
+
+    def _get_row(self, conn: sqlite3.Connection, session_id: str, key: str):
+        row = conn.execute(
+            "SELECT value, size, created_at, expires_at FROM tool_cache "
+            "WHERE session_id = ? AND key = ?",
+            (session_id, key),
+        ).fetchone()
+        if row is not None and row[3] > time.time():
+            conn.execute(
+                "UPDATE tool_cache SET accessed_at = ? WHERE session_id = ? AND key = ?",
+                (time.time(), session_id, key),
+            )
+        return row
+
+    def _put_row(self, conn: sqlite3.Connection, row: tuple) -> int:
+        """Upsert a row and evict LRU rows over budget; returns the eviction count."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO tool_cache "
+                "(session_id, key, tool_name, value, size, created_at, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM tool_cache").fetchone()[0]
+            evicted = 0
+            if total > self._max_bytes:
+                victims = []
+                for rowid, size in conn.execute(
+                    "SELECT rowid, size FROM tool_cache ORDER BY accessed_at ASC"
+                ):
+                    if total <= self._max_bytes:
+                        break
+                    victims.append((rowid,))
+                    total -= size
+                conn.executemany("DELETE FROM tool_cache WHERE rowid = ?", victims)
+                evicted = len(victims)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self._stats.bytes = total
+        return evicted
+
+    def _sweep(self, conn: sqlite3.Connection) -> int:
+        removed = conn.execute(
+            "DELETE FROM tool_cache WHERE expires_at <= ?", (time.time(),)
+        ).rowcount
+        self._refresh_sizes(conn)
+        return removed
+
+    def _refresh_sizes(self, conn: sqlite3.Connection) -> None:
+        entries, size, sessions = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COUNT(DISTINCT session_id) FROM tool_cache"
+        ).fetchone()
+        self._stats.entries = entries
+        self._stats.bytes = size
+        self._stats.sessions = sessions
+
+
+__all__ = ["SQLiteToolResultCache"]
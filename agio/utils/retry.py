@@ -2,10 +2,17 @@
 Retry utilities - Async retry decorator with exponential backoff.
 
 Provides retry logic for async functions, commonly used for LLM API calls.
+retry_stream() covers async generators (LLM streams): a decorator cannot
+retry those, since failures surface while iterating, after the call returned.
 """
 
+import asyncio
 import logging
-from typing import Callable, TypeVar
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Callable, TypeVar
 
 from tenacity import (
     before_sleep_log,
@@ -52,3 +59,135 @@ def retry_async(
         retry=retry_if_exception_type(exceptions),
         before_sleep=before_sleep_log(logger, logging.WARNING),
     )
+
+
+@dataclass
+class StreamAttempts:
+    """What retry_stream() needed to get a stream going."""
+
+    model: str  # Model that served the stream (the fallback after failover)
+    retries: int = 0  # Failed attempts before the stream started
+    failed_over: bool = False
+
+
+def backoff_delay(retry: int, min_wait: float = 1.0, max_wait: float = 10.0) -> float:
+    """Exponential backoff with jitter: a random delay in the upper half of the step."""
+    ceiling = min(max_wait, min_wait * 2 ** (retry - 1))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """Delay requested by a Retry-After(-Ms) header on the error's HTTP response."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+async def retry_stream(
+    open_stream: Callable[[str], AsyncIterator[T]],
+    *,
+    model: str,
+    fallback_model: str | None = None,
+    max_attempts: int = 3,
+    min_wait: float = 1.0,
+    max_wait: float = 10.0,
+    max_retry_after: float = 60.0,
+    exceptions: tuple[type[Exception], ...] = RETRYABLE_EXCEPTIONS,
+    attempts: StreamAttempts | None = None,
+) -> AsyncIterator[T]:
+    """
+    Iterate a stream, retrying failures that happen before its first item.
+
+    Once an item has been yielded the stream is committed: later errors
+    propagate, since the consumer has already seen partial output. After
+    max_attempts failures on model, the stream is retried on fallback_model
+    (with max_attempts of its own).
+
+    Args:
+        open_stream: Starts a stream for the given model name
+        model: Model name to try first
+        fallback_model: Model name to fail over to (optional)
+        max_attempts: Attempts per model
+        min_wait: Backoff of the first retry (seconds)
+        max_wait: Backoff cap (seconds)
+        max_retry_after: Cap on a server-requested Retry-After delay (seconds)
+        exceptions: Exception types to retry on
+        attempts: Filled in with the retry count and serving model (optional)
+
+    Yields:
+        Items of the first stream that produced one
+    """
+    attempts = attempts or StreamAttempts(model=model)
+    attempts.model = model
+    attempt = 0
+    while True:
+        attempt += 1
+        stream = open_stream(attempts.model)
+        try:
+            try:
+                first = await anext(stream)
+            except StopAsyncIteration:
+                return
+            except exceptions as e:
+                if attempt >= max_attempts:
+                    if not fallback_model or attempts.failed_over:
+                        raise
+                    attempts.failed_over = True
+                    attempts.model = fallback_model
+                    attempt = 0
+                    delay = 0.0
+                else:
+                    retry_after = retry_after_seconds(e)
+                    delay = (
+                        min(retry_after, max_retry_after)
+                        if retry_after is not None
+                        else backoff_delay(attempt, min_wait, max_wait)
+                    )
+                attempts.retries += 1
+                logger.warning(
+                    "stream_retry",
+                    model=attempts.model,
+                    retries=attempts.retries,
+                    failed_over=attempts.failed_over,
+                    delay=round(delay, 3),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+            else:
+                yield first
+                async for item in stream:
+                    yield item
+                return
+        finally:
+            # Also when the consumer stops early: release the connection now,
+            # not whenever the abandoned stream is garbage collected
+            await _aclose(stream)
+
+        if delay:
+            await asyncio.sleep(delay)
+
+
+async def _aclose(stream: AsyncIterator[T]) -> None:
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
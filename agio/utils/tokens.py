@@ -0,0 +1,26 @@
+"""
+Token estimates - rough token counts without a tokenizer.
+
+Shared by context compaction (agio.agent.compact) and provider rate limiting
+(agio.llm.rate_limit), so both budget messages the same way.
+"""
+
+import json
+from typing import Any
+
+
+def estimate_tokens(message: dict[str, Any]) -> int:
+    """Rough token count of a message (~4 characters per token plus framing)."""
+    chars = 0
+    for key in ("content", "reasoning_content", "tool_calls"):
+        value = message.get(key)
+        if value is None:
+            continue
+        if isinstance(value, str):
+            chars += len(value)
+        else:
+            chars += len(json.dumps(value, ensure_ascii=False, default=str))
+    return chars // 4 + 4
+
+
+__all__ = ["estimate_tokens"]
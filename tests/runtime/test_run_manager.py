@@ -0,0 +1,175 @@
+"""
+Tests for background runs: attaching by run_id, admission control and abort.
+"""
+
+import asyncio
+
+import pytest
+
+from agio.domain import RunStatus, StepDelta, create_step_delta_event
+from agio.runtime import (
+    ActiveRun,
+    RunAdmissionError,
+    RunManager,
+    RunnableExecutor,
+    RunOutput,
+    Wire,
+)
+
+
+class StreamingRunnable:
+    """Writes a few deltas, waiting on a gate before the last one."""
+
+    id = "streamer"
+    runnable_type = "agent"
+
+    def __init__(self) -> None:
+        self.gate = asyncio.Event()
+
+    async def run(self, input, *, context, abort_signal=None) -> RunOutput:
+        for text in ("a", "b"):
+            await context.wire.write(
+                create_step_delta_event(
+                    step_id="s1", run_id=context.run_id, delta=StepDelta(content=text)
+                )
+            )
+        await self.gate.wait()
+        await context.wire.write(
+            create_step_delta_event(
+                step_id="s1", run_id=context.run_id, delta=StepDelta(content="c")
+            )
+        )
+        return RunOutput(response="abc", run_id=context.run_id)
+
+
+def _texts(events) -> list[str]:
+    return [e.delta.content for e in events if e.delta]
+
+
+@pytest.mark.asyncio
+async def test_resume_replays_events_after_last_event_id():
+    runnable = StreamingRunnable()
+    manager = RunManager()
+    active = manager.start(RunnableExecutor(), runnable, "hi")
+
+    first = active.wire.subscribe()
+    seen = []
+    async for event in first:
+        seen.append(event)
+        if event.delta and event.delta.content == "a":
+            break
+    first.close()  # client disconnects; the run continues
+
+    runnable.gate.set()
+    await active.task
+    assert active.done
+
+    resumed = manager.get(active.run_id).wire.subscribe(after_event_id=seen[-1].event_id)
+    replayed = [event async for event in resumed]
+
+    assert _texts(replayed) == ["b", "c"]
+    assert replayed[-1].type.value == "run_completed"
+    assert resumed.missed == 0
+
+
+@pytest.mark.asyncio
+async def test_replay_gap_is_reported():
+    wire = Wire(replay_size=2)
+    for text in ("a", "b", "c"):
+        await wire.write(
+            create_step_delta_event(step_id="s1", run_id="r1", delta=StepDelta(content=text))
+        )
+    await wire.close()
+
+    resumed = wire.subscribe(after_event_id=0)
+    assert _texts([e async for e in resumed]) == ["b", "c"]
+    assert resumed.missed == 1
+
+
+def test_finished_runs_expire_after_linger():
+    manager = RunManager(linger_seconds=0)
+    manager._runs["r1"] = ActiveRun(
+        run_id="r1",
+        runnable_id="streamer",
+        session_id="s1",
+        user_id=None,
+        wire=Wire(),
+        finished_at=0.0,
+    )
+    assert manager.get("r1") is None
+
+
+class GatedRunnable:
+    """Runs until its gate opens, honouring the abort signal."""
+
+    runnable_type = "agent"
+
+    def __init__(self, runnable_id: str = "gated") -> None:
+        self.id = runnable_id
+        self.gate = asyncio.Event()
+        self.started = 0
+
+    async def run(self, input, *, context, abort_signal=None) -> RunOutput:
+        self.started += 1
+        while not self.gate.is_set():
+            if abort_signal and abort_signal.is_aborted():
+                raise asyncio.CancelledError(abort_signal.reason)
+            await asyncio.sleep(0.005)
+        return RunOutput(response=input, run_id=context.run_id)
+
+
+@pytest.mark.asyncio
+async def test_admission_queues_runs_over_the_cap():
+    runnable = GatedRunnable()
+    manager = RunManager(max_concurrent=1, max_queued=1)
+    first = manager.start(RunnableExecutor(), runnable, "one")
+    second = manager.start(RunnableExecutor(), runnable, "two")
+    with pytest.raises(RunAdmissionError):
+        manager.start(RunnableExecutor(), runnable, "three")
+
+    await asyncio.sleep(0.02)
+    stats = manager.stats()
+    assert (stats.active, stats.queued, stats.rejected) == (1, 1, 1)
+    assert stats.active_by_runnable == {"gated": 1}
+    assert second.status == RunStatus.STARTING
+
+    runnable.gate.set()
+    await asyncio.gather(first.task, second.task)
+    assert second.output.response == "two"
+    assert manager.stats().active == 0
+
+
+@pytest.mark.asyncio
+async def test_per_user_cap_does_not_block_other_users():
+    runnable = GatedRunnable()
+    manager = RunManager(max_per_user=1)
+    manager.start(RunnableExecutor(), runnable, "a1", user_id="alice")
+    held = manager.start(RunnableExecutor(), runnable, "a2", user_id="alice")
+    other = manager.start(RunnableExecutor(), runnable, "b1", user_id="bob")
+
+    await asyncio.sleep(0.02)
+    assert held.status == RunStatus.STARTING
+    assert other.status == RunStatus.RUNNING
+
+    runnable.gate.set()
+    await held.task
+
+
+@pytest.mark.asyncio
+async def test_abort_stops_running_and_queued_runs():
+    runnable = GatedRunnable()
+    manager = RunManager(max_concurrent=1)
+    running = manager.start(RunnableExecutor(), runnable, "one")
+    queued = manager.start(RunnableExecutor(), runnable, "two")
+    await asyncio.sleep(0.02)
+
+    assert manager.abort(queued.run_id, "not needed")
+    assert manager.abort(running.run_id, "stop")
+    await asyncio.gather(running.task, queued.task)
+
+    assert running.status == queued.status == RunStatus.CANCELLED
+    assert running.error == "stop"
+    assert runnable.started == 1
+    events = [e async for e in running.wire.subscribe(after_event_id=0)]
+    assert events[-1].type.value == "run_failed"
+    assert not manager.abort(running.run_id)
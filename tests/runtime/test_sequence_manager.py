@@ -0,0 +1,114 @@
+"""
+Tests for SequenceManager block leasing.
+"""
+
+import asyncio
+
+import pytest
+
+from agio.agent import Agent
+from agio.domain import MessageRole, Step
+from agio.llm.mock import SyntheticModel
+from agio.runtime import Wire
+from agio.runtime.protocol import ExecutionContext
+from agio.runtime.sequence_manager import SequenceManager
+from agio.storage.session import InMemorySessionStore, SQLiteSessionStore
+
+
+class CountingStore(InMemorySessionStore):
+    """InMemorySessionStore that counts block leases."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.block_calls = 0
+
+    async def allocate_sequence_block(self, session_id: str, size: int) -> range:
+        self.block_calls += 1
+        await asyncio.sleep(0)
+        return await super().allocate_sequence_block(session_id, size)
+
+
+@pytest.mark.asyncio
+async def test_allocations_are_served_from_leased_blocks():
+    store = CountingStore()
+    manager = SequenceManager(store, block_size=8)
+
+    seqs = [await manager.allocate("s1") for _ in range(20)]
+
+    assert seqs == list(range(1, 21))
+    assert store.block_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_allocations_share_one_refill():
+    store = CountingStore()
+    manager = SequenceManager(store, block_size=64)
+
+    seqs = await asyncio.gather(*(manager.allocate("s1") for _ in range(50)))
+
+    assert sorted(seqs) == list(range(1, 51))
+    assert store.block_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_lease_reconciles_with_persisted_high_water_mark():
+    store = InMemorySessionStore()
+    manager = SequenceManager(store, block_size=4)
+    assert await manager.allocate("s1") == 1
+
+    # Steps written outside the counter (e.g. by another writer) raise the mark
+    await store.save_step(
+        Step(session_id="s1", run_id="r1", sequence=10, role=MessageRole.USER, content="x")
+    )
+    manager.release("s1")
+
+    assert await manager.allocate("s1") == 11
+
+
+@pytest.mark.asyncio
+async def test_restart_skips_unused_leased_numbers(tmp_path):
+    db_path = str(tmp_path / "agio.db")
+    store = SQLiteSessionStore(db_path=db_path)
+    await store.connect()
+    assert await SequenceManager(store).allocate("s1") == 1
+    await store.disconnect()
+
+    # A new process leases after the previous block even though 2..64 were unused
+    store = SQLiteSessionStore(db_path=db_path)
+    await store.connect()
+    assert await SequenceManager(store).allocate("s1") == 65
+    await store.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_leases_are_bounded_least_recently_used_first():
+    manager = SequenceManager(InMemorySessionStore(), block_size=4, max_leases=2)
+    await manager.allocate("s1")
+    await manager.allocate("s2")
+    await manager.allocate("s1")
+    await manager.allocate("s3")
+
+    assert list(manager._leases) == ["s1", "s3"]
+
+
+@pytest.mark.asyncio
+async def test_top_level_run_releases_its_lease():
+    store = InMemorySessionStore()
+    agent = Agent(
+        model=SyntheticModel(id="synthetic/mock", name="mock", ttft_ms=0, inter_token_ms=0),
+        session_store=store,
+    )
+    context = ExecutionContext(run_id="r1", session_id="s1", wire=Wire())
+
+    await agent.run("hi", context=context)
+
+    assert "s1" not in SequenceManager.for_store(store)._leases
+
+
+def test_for_store_shares_manager_per_store():
+    store = InMemorySessionStore()
+
+    assert SequenceManager.for_store(store) is SequenceManager.for_store(store)
+    assert SequenceManager.for_store(store) is not SequenceManager.for_store(
+        InMemorySessionStore()
+    )
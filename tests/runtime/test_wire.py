@@ -0,0 +1,103 @@
+"""
+Tests for Wire buffering, overflow policies and fan-out.
+"""
+
+import asyncio
+
+import pytest
+
+from agio.domain import (
+    StepDelta,
+    create_run_completed_event,
+    create_step_delta_event,
+)
+from agio.runtime import Wire, WirePolicy
+
+
+def _delta(text: str, step_id: str = "s1"):
+    return create_step_delta_event(step_id=step_id, run_id="r1", delta=StepDelta(content=text))
+
+
+def _completed():
+    return create_run_completed_event(run_id="r1", response="done", metrics={})
+
+
+async def _drain(wire: Wire) -> list:
+    return [event async for event in wire.read()]
+
+
+@pytest.mark.asyncio
+async def test_events_before_read_reach_first_reader():
+    wire = Wire()
+    await wire.write(_delta("a"))
+    await wire.close()
+
+    events = await _drain(wire)
+    assert [e.delta.content for e in events] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_delivers_every_event_to_each_subscriber():
+    wire = Wire()
+    first, second = wire.subscribe(), wire.subscribe()
+    for text in ("a", "b"):
+        await wire.write(_delta(text))
+    await wire.close()
+
+    for sub in (first, second):
+        assert [e.delta.content async for e in sub] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_block_policy_waits_for_consumer():
+    wire = Wire(maxsize=1, policy=WirePolicy.BLOCK)
+    sub = wire.subscribe()
+    await wire.write(_delta("a"))
+
+    blocked = asyncio.create_task(wire.write(_delta("b")))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    assert (await sub.__anext__()).delta.content == "a"
+    await asyncio.wait_for(blocked, 1)
+    assert wire.stats.blocked_writes == 1
+    assert wire.stats.high_water_mark == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesce_policy_merges_deltas_and_keeps_completions():
+    wire = Wire(maxsize=1, policy=WirePolicy.COALESCE)
+    for text in ("a", "b", "c"):
+        await wire.write(_delta(text))
+    await wire.write(_completed())
+    await wire.close()
+
+    events = await _drain(wire)
+    assert events[0].delta.content == "abc"
+    assert events[1].data["response"] == "done"
+    assert wire.stats.coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_drop_deltas_policy_never_drops_completions():
+    wire = Wire(maxsize=1, policy=WirePolicy.DROP_DELTAS)
+    for text in ("a", "b"):
+        await wire.write(_delta(text))
+    await wire.write(_completed())
+    await wire.close()
+
+    events = await _drain(wire)
+    assert [e.type.value for e in events] == ["step_delta", "run_completed"]
+    assert wire.stats.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_closed_subscriber_does_not_block_producer():
+    wire = Wire(maxsize=1, policy=WirePolicy.BLOCK)
+    sub = wire.subscribe()
+    await wire.write(_delta("a"))
+
+    blocked = asyncio.create_task(wire.write(_delta("b")))
+    await asyncio.sleep(0.01)
+    sub.close()
+    await asyncio.wait_for(blocked, 1)
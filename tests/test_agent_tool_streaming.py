@@ -0,0 +1,257 @@
+"""
+Tests for streaming tool results through the agent loop.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from agio.agent.executor import AgentExecutor, ToolCallAccumulator
+from agio.config import ExecutionConfig
+from agio.domain import ToolResult
+from agio.llm import Model, StreamChunk
+from agio.runtime import Wire
+from agio.runtime.protocol import ExecutionContext
+from agio.runtime.sequence_manager import SequenceManager
+from agio.storage.session import InMemorySessionStore
+from agio.tools import BaseTool
+
+
+class SleepTool(BaseTool):
+    """Sleeps for a fixed delay."""
+
+    def __init__(self, name: str, delay: float, safe: bool = True) -> None:
+        self._name = name
+        self._delay = delay
+        self._safe = safe
+        self.started_at: float | None = None
+        super().__init__()
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_description(self) -> str:
+        return self._name
+
+    def get_parameters(self) -> dict:
+        return {"type": "object", "properties": {}}
+
+    def is_concurrency_safe(self) -> bool:
+        return self._safe
+
+    async def execute(self, parameters: dict, context, abort_signal=None) -> ToolResult:
+        start = self.started_at = time.time()
+        await asyncio.sleep(self._delay)
+        return ToolResult(
+            tool_name=self.name,
+            tool_call_id=parameters["tool_call_id"],
+            input_args=parameters,
+            content=self.name,
+            output=None,
+            start_time=start,
+            end_time=time.time(),
+            duration=time.time() - start,
+        )
+
+
+class TwoToolsModel(Model):
+    """Calls slow and fast in one step, then answers."""
+
+    id: str = "test/two-tools"
+    name: str = "two-tools"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._calls = 0
+        self._seen_messages: list[list[dict]] = []
+
+    async def arun_stream(self, messages, tools=None):
+        self._seen_messages.append(list(messages))
+        self._calls += 1
+        if self._calls == 1:
+            yield StreamChunk(
+                tool_calls=[
+                    {
+                        "index": i,
+                        "id": f"call_{name}",
+                        "type": "function",
+                        "function": {"name": name, "arguments": "{}"},
+                    }
+                    for i, name in enumerate(["slow", "fast"])
+                ]
+            )
+        else:
+            yield StreamChunk(content="done")
+
+
+@pytest.mark.asyncio
+async def test_tool_steps_and_messages_are_in_call_order():
+    store = InMemorySessionStore()
+    model = TwoToolsModel()
+    executor = AgentExecutor(
+        model=model,
+        tools=[SleepTool("slow", 0.1), SleepTool("fast", 0.0)],
+        session_store=store,
+        sequence_manager=SequenceManager(store),
+    )
+    context = ExecutionContext(run_id="r1", session_id="s1", wire=Wire())
+
+    await executor.execute([{"role": "user", "content": "go"}], context)
+
+    tool_steps = [s for s in await store.get_steps("s1") if s.is_tool_step()]
+    # Sequenced in call order although the fast tool finished (and was stored) first
+    assert [s.name for s in tool_steps] == ["slow", "fast"]
+
+    second_call = model._seen_messages[1]
+    assert [m["tool_call_id"] for m in second_call if m["role"] == "tool"] == [
+        "call_slow",
+        "call_fast",
+    ]
+
+
+class StoreProbeTool(SleepTool):
+    """Records which steps are in the store when it finishes."""
+
+    def __init__(self, name: str, delay: float, store: InMemorySessionStore) -> None:
+        super().__init__(name, delay)
+        self._store = store
+        self.persisted: list[str] = []
+
+    async def execute(self, parameters: dict, context, abort_signal=None) -> ToolResult:
+        result = await super().execute(parameters, context, abort_signal)
+        self.persisted = [
+            step.name or step.role.value for step in await self._store.get_steps("s1")
+        ]
+        return result
+
+
+@pytest.mark.asyncio
+async def test_tool_steps_are_persisted_before_the_turn_ends():
+    store = InMemorySessionStore()
+    slow = StoreProbeTool("slow", 0.1, store)
+    executor = AgentExecutor(
+        model=TwoToolsModel(),
+        tools=[slow, SleepTool("fast", 0.0)],
+        session_store=store,
+        sequence_manager=SequenceManager(store),
+    )
+    context = ExecutionContext(run_id="r1", session_id="s1", wire=Wire())
+
+    await executor.execute([{"role": "user", "content": "go"}], context)
+
+    # The assistant step and the finished fast tool are stored while slow runs
+    assert slow.persisted == ["assistant", "fast"]
+
+
+class SlowTailModel(Model):
+    """Emits one complete tool call per name, then keeps streaming text."""
+
+    id: str = "test/slow-tail"
+    name: str = "slow-tail"
+
+    def __init__(self, tool_names: list[str]) -> None:
+        super().__init__()
+        self._tool_names = tool_names
+        self._calls = 0
+        self.stream_ended_at: float | None = None
+
+    async def arun_stream(self, messages, tools=None):
+        self._calls += 1
+        if self._calls > 1:
+            yield StreamChunk(content="done")
+            return
+        for i, name in enumerate(self._tool_names):
+            yield StreamChunk(
+                tool_calls=[
+                    {
+                        "index": i,
+                        "id": f"call_{name}",
+                        "type": "function",
+                        "function": {"name": name, "arguments": "{}"},
+                    }
+                ]
+            )
+        await asyncio.sleep(0.05)
+        yield StreamChunk(content="still talking")
+        self.stream_ended_at = time.time()
+
+
+def test_accumulator_completed_waits_for_full_arguments():
+    acc = ToolCallAccumulator()
+    acc.accumulate(
+        [{"index": 0, "id": "a", "function": {"name": "read", "arguments": '{"path": '}}]
+    )
+    assert acc.completed() == []
+
+    acc.accumulate([{"index": 0, "function": {"arguments": '"x"}'}}])
+    assert [c["id"] for c in acc.completed()] == ["a"]
+
+    # A later call closes the earlier one even if its arguments were empty
+    acc = ToolCallAccumulator()
+    acc.accumulate([{"index": 0, "id": "a", "function": {"name": "ls", "arguments": ""}}])
+    assert acc.completed() == []
+    acc.accumulate([{"index": 1, "id": "b", "function": {"name": "ls", "arguments": ""}}])
+    assert [c["id"] for c in acc.completed()] == ["a"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("speculative", [False, True])
+async def test_speculative_execution_starts_safe_tools_during_stream(speculative):
+    store = InMemorySessionStore()
+    safe = SleepTool("safe", 0.0)
+    unsafe = SleepTool("unsafe", 0.0, safe=False)
+    model = SlowTailModel(["safe", "unsafe"])
+    executor = AgentExecutor(
+        model=model,
+        tools=[safe, unsafe],
+        session_store=store,
+        sequence_manager=SequenceManager(store),
+        config=ExecutionConfig(speculative_tool_execution=speculative),
+    )
+    context = ExecutionContext(run_id="r1", session_id="s1", wire=Wire())
+
+    await executor.execute([{"role": "user", "content": "go"}], context)
+
+    assert (safe.started_at < model.stream_ended_at) is speculative
+    # Tools that are not concurrency-safe always wait for the full response
+    assert unsafe.started_at >= model.stream_ended_at
+
+    tool_steps = [s for s in await store.get_steps("s1") if s.is_tool_step()]
+    assert sorted(s.name for s in tool_steps) == ["safe", "unsafe"]
+    assistant = [s for s in await store.get_steps("s1") if s.is_assistant_step()][0]
+    assert all(s.sequence > assistant.sequence for s in tool_steps)
+
+
+class SameFileTool(SleepTool):
+    """SleepTool whose calls all touch the same file."""
+
+    finished_at: float | None = None
+
+    def get_resource_key(self, parameters: dict) -> str | None:
+        return "/tmp/agio-same-file"
+
+    async def execute(self, parameters: dict, context, abort_signal=None) -> ToolResult:
+        result = await super().execute(parameters, context, abort_signal)
+        self.finished_at = time.time()
+        return result
+
+
+@pytest.mark.asyncio
+async def test_speculation_does_not_start_a_read_ahead_of_an_earlier_write():
+    store = InMemorySessionStore()
+    write = SameFileTool("write", 0.05, safe=False)
+    read = SameFileTool("read", 0.0)
+    model = SlowTailModel(["write", "read"])
+    executor = AgentExecutor(
+        model=model,
+        tools=[write, read],
+        session_store=store,
+        sequence_manager=SequenceManager(store),
+        config=ExecutionConfig(speculative_tool_execution=True),
+    )
+    context = ExecutionContext(run_id="r1", session_id="s1", wire=Wire())
+
+    await executor.execute([{"role": "user", "content": "go"}], context)
+
+    assert read.started_at >= write.finished_at
@@ -22,7 +22,9 @@ async def test_anthropic_init(mock_anthropic):
         id="anthropic/claude-3-opus", name="claude-3-opus", api_key="sk-test"
     )
     assert model.name == "claude-3-opus"
-    mock_anthropic.assert_called_once_with(api_key="sk-test")
+    mock_anthropic.assert_called_once()
+    assert mock_anthropic.call_args.kwargs["api_key"] == "sk-test"
+    assert model.client is mock_anthropic.return_value
 
 
 @pytest.mark.asyncio
@@ -294,3 +296,162 @@ async def test_arun_stream(mock_anthropic):
     assert len(chunks) == 2
     assert chunks[0].content == "Hello"
     assert chunks[1].finish_reason == "end_turn"
+
+
+@pytest.mark.asyncio
+async def test_arun_stream_places_cache_breakpoints(mock_anthropic):
+    """System prompt, last tool and the last two messages are cache breakpoints."""
+    mock_client = mock_anthropic.return_value
+    mock_stream = AsyncMock()
+    mock_stream.__aiter__.side_effect = lambda: iter_events()
+    mock_client.messages.create = AsyncMock(return_value=mock_stream)
+
+    async def iter_events():
+        event = MagicMock()
+        event.type = "message_stop"
+        yield event
+
+    model = AnthropicModel(
+        id="anthropic/claude-3-opus",
+        name="claude-3-opus",
+        api_key="sk-test",
+        prompt_caching=True,
+    )
+    messages = [
+        {"role": "system", "content": "System prompt"},
+        {"role": "user", "content": "First"},
+        {"role": "assistant", "content": "Answer", "reasoning_content": "Thought"},
+        {"role": "user", "content": "Second"},
+    ]
+    tools = [
+        {"type": "function", "function": {"name": "a", "parameters": {}}},
+        {"type": "function", "function": {"name": "b", "parameters": {}}},
+    ]
+
+    async for _ in model.arun_stream(messages, tools=tools):
+        pass
+
+    params = mock_client.messages.create.call_args.kwargs
+    cache_control = {"type": "ephemeral"}
+    assert params["system"] == [
+        {"type": "text", "text": "System prompt", "cache_control": cache_control}
+    ]
+    assert "cache_control" not in params["tools"][0]
+    assert params["tools"][1]["cache_control"] == cache_control
+
+    sent = params["messages"]
+    assert sent[0]["content"] == "First"
+    # Breakpoint on the text block, not on the thinking block
+    assert "cache_control" not in sent[1]["content"][0]
+    assert sent[1]["content"][1]["cache_control"] == cache_control
+    assert sent[2]["content"] == [
+        {"type": "text", "text": "Second", "cache_control": cache_control}
+    ]
+
+
+def test_cache_breakpoints_do_not_modify_converted_messages(mock_anthropic):
+    model = AnthropicModel(
+        id="anthropic/claude-3-opus", name="claude-3-opus", api_key="sk-test"
+    )
+    system, converted = model._convert_messages(
+        [{"role": "system", "content": "S"}, {"role": "tool", "tool_call_id": "c", "content": "r"}]
+    )
+    tools = model._convert_tools(
+        [{"type": "function", "function": {"name": "a", "parameters": {}}}]
+    )
+
+    _, marked, marked_tools = model._apply_cache_breakpoints(system, converted, tools)
+
+    assert marked[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in converted[0]["content"][0]
+    assert "cache_control" not in tools[0]
+    assert marked_tools[0]["cache_control"] == {"type": "ephemeral"}
+
+
+@pytest.mark.asyncio
+async def test_prompt_caching_is_off_by_default(mock_anthropic):
+    mock_client = mock_anthropic.return_value
+    mock_stream = AsyncMock()
+    mock_stream.__aiter__.side_effect = lambda: iter_events()
+    mock_client.messages.create = AsyncMock(return_value=mock_stream)
+
+    async def iter_events():
+        event = MagicMock()
+        event.type = "message_stop"
+        yield event
+
+    model = AnthropicModel(
+        id="anthropic/claude-3-opus", name="claude-3-opus", api_key="sk-test"
+    )
+    async for _ in model.arun_stream(
+        [{"role": "system", "content": "S"}, {"role": "user", "content": "Hi"}]
+    ):
+        pass
+
+    params = mock_client.messages.create.call_args.kwargs
+    assert params["system"] == "S"
+    assert params["messages"] == [{"role": "user", "content": "Hi"}]
+
+
+def test_normalized_usage_is_not_double_counted():
+    from agio.domain.models import normalize_usage_metrics
+
+    usage = normalize_usage_metrics(
+        {
+            "input_tokens": 10,
+            "output_tokens": 5,
+            "cache_read_tokens": 90,
+            "cache_creation_tokens": 0,
+        }
+    )
+
+    assert usage["input_tokens"] == 100
+    assert normalize_usage_metrics(usage) == usage
+
+
+def test_only_appended_messages_are_converted(mock_anthropic):
+    model = AnthropicModel(
+        id="anthropic/claude-3-opus", name="claude-3-opus", api_key="sk-test"
+    )
+    messages = [
+        {"role": "system", "content": "S"},
+        {"role": "user", "content": "Hi"},
+        {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {"id": "c1", "function": {"name": "ls", "arguments": '{"path": "."}'}}
+            ],
+        },
+    ]
+    _, first = model._convert_messages(messages)
+
+    messages.append({"role": "tool", "tool_call_id": "c1", "content": "a.txt"})
+    with patch("agio.llm.anthropic.json.loads") as loads:
+        _, second = model._convert_messages(messages)
+
+    loads.assert_not_called()
+    assert second[:2] == first
+    assert all(a is b for a, b in zip(first, second))
+    assert second[2]["content"][0]["tool_use_id"] == "c1"
+
+    # An edited copy of a message is converted again
+    messages[1] = {"role": "user", "content": "Hello"}
+    _, third = model._convert_messages(messages)
+    assert third[0] == {"role": "user", "content": "Hello"}
+
+
+def test_converted_tools_are_reused_for_equal_tool_sets(mock_anthropic):
+    model = AnthropicModel(
+        id="anthropic/claude-3-opus", name="claude-3-opus", api_key="sk-test"
+    )
+
+    def tool_set():
+        return [{"type": "function", "function": {"name": "a", "parameters": {}}}]
+
+    tools = tool_set()
+    assert model._convert_tools(tools) is model._convert_tools(tools)
+    assert model._convert_tools(tool_set()) is model._convert_tools(tools)
+    assert model._convert_tools(tools) is not model._convert_tools(
+        [{"type": "function", "function": {"name": "b", "parameters": {}}}]
+    )
@@ -0,0 +1,158 @@
+"""
+Tests for ContextWindowManager.
+"""
+
+import pytest
+
+from agio.agent.compact import ContextWindowManager, estimate_tokens
+from agio.agent.context import validate_context
+from agio.config.schema import AgentConfig, ExecutionConfig
+from agio.storage.session import InMemorySessionStore
+
+SYSTEM = {"role": "system", "content": "sys"}
+
+
+def _turn(i: int, output_chars: int = 10) -> list[dict]:
+    call_id = f"call_{i}"
+    return [
+        {"role": "user", "content": f"question {i}"},
+        {
+            "role": "assistant",
+            "tool_calls": [
+                {"id": call_id, "type": "function", "function": {"name": "read", "arguments": "{}"}}
+            ],
+        },
+        {"role": "tool", "tool_call_id": call_id, "name": "read", "content": "x" * output_chars},
+        {"role": "assistant", "content": f"answer {i}"},
+    ]
+
+
+def _conversation(turns: int, output_chars: int = 10) -> list[dict]:
+    messages = [SYSTEM]
+    for i in range(turns):
+        messages.extend(_turn(i, output_chars))
+    return messages
+
+
+def _assert_pairs_consistent(messages: list[dict]) -> None:
+    validate_context(messages)
+    call_ids = {tc["id"] for m in messages for tc in m.get("tool_calls") or []}
+    result_ids = {m["tool_call_id"] for m in messages if m["role"] == "tool"}
+    assert call_ids == result_ids
+
+
+def test_disabled_manager_returns_everything():
+    messages = _conversation(5)
+    assert ContextWindowManager().compact("s1", messages) == messages
+
+
+def test_history_limit_drops_whole_turns_and_pins_current_turn():
+    manager = ContextWindowManager(max_history_messages=5)
+    messages = _conversation(4)
+    messages.append({"role": "user", "content": "current"})
+
+    compacted = manager.compact("s1", messages)
+
+    assert compacted[0] == SYSTEM
+    assert compacted[-1] == {"role": "user", "content": "current"}
+    # Only the last earlier turn (4 messages) fits into 5 history messages
+    assert compacted[1] == {"role": "user", "content": "question 3"}
+    assert len(compacted) == 1 + 4 + 1
+    _assert_pairs_consistent(compacted)
+
+
+def test_current_turn_is_never_dropped():
+    manager = ContextWindowManager(max_history_messages=0)
+    messages = [SYSTEM] + _turn(0) + _turn(1)[1:]
+
+    compacted = manager.compact("s1", messages)
+
+    assert compacted == messages
+
+
+def test_token_budget_elides_old_tool_outputs_before_dropping_turns():
+    manager = ContextWindowManager(
+        max_tokens=1000, keep_recent_tool_outputs=1, elide_min_chars=100, preview_chars=20
+    )
+    messages = _conversation(3, output_chars=2000)
+
+    compacted = manager.compact("s1", messages)
+
+    assert len(compacted) == len(messages)
+    tool_outputs = [m["content"] for m in compacted if m["role"] == "tool"]
+    assert 'get_tool_result(tool_call_id="call_0")' in tool_outputs[0]
+    assert 'get_tool_result(tool_call_id="call_1")' in tool_outputs[1]
+    assert tool_outputs[2] == "x" * 2000  # newest output kept
+    assert sum(estimate_tokens(m) for m in compacted) <= 1000
+    # Caller's messages are untouched
+    assert messages[3]["content"] == "x" * 2000
+
+
+def test_token_budget_drops_oldest_turns_when_elision_is_not_enough():
+    manager = ContextWindowManager(max_tokens=60, reference_tool=None)
+    messages = _conversation(5)
+
+    compacted = manager.compact("s1", messages)
+
+    assert compacted[0] == SYSTEM
+    assert compacted[1]["role"] == "user"
+    assert compacted[-4:] == messages[-4:]
+    assert sum(estimate_tokens(m) for m in compacted) <= 60
+    _assert_pairs_consistent(compacted)
+
+
+def test_compacted_prefix_is_stable_and_incremental():
+    estimated: list[dict] = []
+
+    def counting_estimator(message: dict) -> int:
+        estimated.append(message)
+        return estimate_tokens(message)
+
+    manager = ContextWindowManager(max_history_messages=4, token_estimator=counting_estimator)
+    messages = _conversation(3)
+    first = manager.compact("s1", messages)
+
+    estimated.clear()
+    messages.extend(_turn(3))
+    second = manager.compact("s1", messages)
+
+    # Only the appended turn was processed
+    assert estimated == _turn(3)
+    assert second[0] == SYSTEM
+    assert second[1:5] == first[-4:]
+
+    # A rewritten history is rebuilt from scratch
+    rewritten = [SYSTEM] + _turn(9)
+    assert manager.compact("s1", rewritten) == rewritten
+
+
+def test_changed_message_inside_the_cached_prefix_is_detected():
+    manager = ContextWindowManager(max_history_messages=100)
+    messages = _conversation(3)
+    manager.compact("s1", messages)
+
+    # Same first and last message, different middle
+    edited = list(messages)
+    edited[5] = {**edited[5], "content": "edited"}
+
+    assert manager.compact("s1", edited) == edited
+
+
+@pytest.mark.asyncio
+async def test_deleting_steps_invalidates_every_manager():
+    first = ContextWindowManager(max_history_messages=4)
+    second = ContextWindowManager(max_tokens=1000)
+    for manager in (first, second):
+        manager.compact("s1", _conversation(2))
+        manager.compact("s2", _conversation(2))
+
+    await InMemorySessionStore().delete_steps("s1", start_seq=0)
+
+    for manager in (first, second):
+        assert "s1" not in manager._states
+        assert "s2" in manager._states
+
+
+def test_history_is_unlimited_by_default():
+    assert AgentConfig(name="a", model="m").max_history_messages is None
+    assert ExecutionConfig().max_history_messages is None
@@ -0,0 +1,167 @@
+"""
+Tests for request hedging of streams slow to produce their first chunk.
+"""
+
+import asyncio
+
+import pytest
+
+from agio.llm.base import Model, StreamChunk
+from agio.llm.hedging import HedgeStats, LatencyTracker, hedged_stream
+from agio.llm.rate_limit import ProviderRateLimiter
+
+
+class Flaky(Exception):
+    pass
+
+
+def make_opener(plan):
+    """plan: per-call (first chunk delay, items); an exception item is raised."""
+    calls, closed = [], []
+
+    def open_stream(model):
+        delay, items = plan[len(calls)]
+        calls.append(model)
+        name = f"{model}#{len(calls)}"
+
+        async def gen():
+            try:
+                await asyncio.sleep(delay)
+                for item in items:
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+            finally:
+                closed.append(name)
+
+        return gen()
+
+    return open_stream, calls, closed
+
+
+async def collect(stream):
+    return [item async for item in stream]
+
+
+@pytest.mark.asyncio
+async def test_fast_stream_is_not_hedged():
+    open_stream, calls, _ = make_opener([(0, ["a", "b"])])
+    stats = HedgeStats()
+
+    items = await collect(
+        hedged_stream(open_stream, model="m", delay=0.5, open_hedge=open_stream, stats=stats)
+    )
+
+    assert items == ["a", "b"]
+    assert calls == ["m"]
+    assert stats.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_faster_hedge_wins_and_primary_is_cancelled():
+    open_stream, calls, closed = make_opener([(5, ["slow"]), (0, ["fast", "rest"])])
+    stats = HedgeStats()
+
+    items = await asyncio.wait_for(
+        collect(
+            hedged_stream(
+                open_stream,
+                model="m",
+                delay=0.05,
+                open_hedge=open_stream,
+                hedge_model="backup",
+                stats=stats,
+            )
+        ),
+        timeout=1,
+    )
+
+    assert items == ["fast", "rest"]
+    assert calls == ["m", "backup"]
+    assert stats.hedges == 1 and stats.hedge_won
+    assert "m#1" in closed
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_budget_waits_for_primary():
+    open_stream, calls, _ = make_opener([(0.1, ["a"])])
+    stats = HedgeStats()
+
+    items = await collect(
+        hedged_stream(open_stream, model="m", delay=0.01, open_hedge=lambda m: None, stats=stats)
+    )
+
+    assert items == ["a"]
+    assert stats.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_serves_when_primary_fails():
+    open_stream, _, _ = make_opener([(0.1, [Flaky()]), (0.2, ["b"])])
+    stats = HedgeStats()
+
+    items = await collect(
+        hedged_stream(open_stream, model="m", delay=0.01, open_hedge=open_stream, stats=stats)
+    )
+
+    assert items == ["b"]
+    assert stats.hedge_won
+
+
+@pytest.mark.asyncio
+async def test_primary_error_before_delay_is_raised_for_retry():
+    open_stream, calls, _ = make_opener([(0, [Flaky()])])
+
+    with pytest.raises(Flaky):
+        await collect(hedged_stream(open_stream, model="m", delay=1, open_hedge=open_stream))
+    assert calls == ["m"]
+
+
+def test_latency_percentile_needs_min_samples():
+    tracker = LatencyTracker(window=100, min_samples=10)
+    for i in range(9):
+        tracker.record(i / 10)
+    assert tracker.percentile(95) is None
+
+    tracker.record(5.0)
+    assert tracker.percentile(50) == 0.4
+    assert tracker.percentile(95) == 5.0
+
+
+class HedgedModel(Model):
+    plan: list = []
+
+    async def arun_stream(self, messages, tools=None):
+        open_stream, self._calls, _ = make_opener(self.plan)
+
+        def open_chunks(model):
+            async def gen():
+                async for text in open_stream(model):
+                    yield StreamChunk(content=text)
+
+            return gen()
+
+        async for chunk in self._stream_with_retry(open_chunks, "m", (Flaky,), 10):
+            yield chunk
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rpm, hedged", [(600, True), (1, False)])
+async def test_hedges_only_with_rate_limit_budget(rpm, hedged):
+    model = HedgedModel(
+        id="test/m",
+        name="m",
+        hedging=True,
+        hedge_delay=0.05,
+        plan=[(0.5, ["slow"]), (0, ["fast"])],
+    )
+    model._rate_limiter = ProviderRateLimiter(requests_per_minute=rpm)
+
+    chunks = await collect(model.arun_stream([]))
+
+    if hedged:
+        assert [c.content for c in chunks] == ["fast"]
+        assert chunks[0].hedge_count == 1 and chunks[0].hedge_won
+    else:
+        assert [c.content for c in chunks] == ["slow"]
+        assert chunks[0].hedge_count is None
@@ -0,0 +1,108 @@
+"""
+Tests for the indexed InMemorySessionStore.
+"""
+
+import random
+
+import pytest
+
+from agio.domain import MessageRole, Step
+from agio.storage.session import InMemorySessionStore
+
+
+def _step(seq: int, run_id: str = "r1", runnable_id: str = "a1", **kwargs) -> Step:
+    return Step(
+        session_id="s1",
+        run_id=run_id,
+        runnable_id=runnable_id,
+        sequence=seq,
+        role=kwargs.pop("role", MessageRole.USER),
+        content=kwargs.pop("content", f"step {seq}"),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_out_of_order_inserts_are_sequence_ordered():
+    store = InMemorySessionStore()
+    for seq in [5, 1, 3, 2, 4]:
+        await store.save_step(_step(seq))
+
+    steps = await store.get_steps("s1")
+
+    assert [s.sequence for s in steps] == [1, 2, 3, 4, 5]
+    assert (await store.get_last_step("s1")).sequence == 5
+    assert await store.get_max_sequence("s1") == 5
+
+
+@pytest.mark.asyncio
+async def test_upsert_by_id_and_by_sequence():
+    store = InMemorySessionStore()
+    first = _step(1)
+    await store.save_step(first)
+    await store.save_step(_step(2))
+
+    # Same id -> replaced
+    await store.save_step(first.model_copy(update={"content": "edited"}))
+    # Same sequence, new id -> replaced
+    await store.save_step(_step(2, content="replaced"))
+
+    steps = await store.get_steps("s1")
+    assert [s.content for s in steps] == ["edited", "replaced"]
+    assert await store.get_step_count("s1") == 2
+
+
+@pytest.mark.asyncio
+async def test_secondary_indexes_and_range_queries():
+    store = InMemorySessionStore()
+    for seq in range(1, 21):
+        await store.save_step(
+            _step(
+                seq,
+                run_id="r1" if seq <= 10 else "r2",
+                runnable_id="a1" if seq % 2 else "a2",
+                role=MessageRole.TOOL,
+                tool_call_id=f"call_{seq}",
+            )
+        )
+
+    steps = await store.get_steps("s1", start_seq=5, end_seq=15, run_id="r2", runnable_id="a1")
+    assert [s.sequence for s in steps] == [11, 13, 15]
+    assert len(await store.get_steps("s1", run_id="r1", limit=3)) == 3
+    assert (await store.get_step_by_tool_call_id("s1", "call_7")).sequence == 7
+
+    assert await store.delete_steps("s1", 8) == 13
+    assert await store.get_step_by_tool_call_id("s1", "call_9") is None
+    assert await store.get_steps("s1", run_id="r2") == []
+    assert [s.sequence for s in await store.get_steps("s1", runnable_id="a2")] == [2, 4, 6]
+
+
+@pytest.mark.asyncio
+async def test_matches_linear_scan_reference():
+    rng = random.Random(7)
+    store = InMemorySessionStore()
+    reference: dict[int, Step] = {}
+
+    for _ in range(300):
+        seq = rng.randint(1, 60)
+        if rng.random() < 0.1:
+            await store.delete_steps("s1", seq)
+            reference = {k: v for k, v in reference.items() if k < seq}
+            continue
+        step = _step(seq, run_id=rng.choice(["r1", "r2"]), runnable_id=rng.choice(["a", "b"]))
+        await store.save_step(step)
+        reference[seq] = step
+
+    for run_id in (None, "r1", "r2"):
+        for runnable_id in (None, "a", "b"):
+            expected = [
+                reference[k]
+                for k in sorted(reference)
+                if 10 <= k <= 40
+                and (run_id is None or reference[k].run_id == run_id)
+                and (runnable_id is None or reference[k].runnable_id == runnable_id)
+            ]
+            actual = await store.get_steps(
+                "s1", start_seq=10, end_seq=40, run_id=run_id, runnable_id=runnable_id
+            )
+            assert [s.id for s in actual] == [s.id for s in expected]
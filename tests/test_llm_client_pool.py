@@ -0,0 +1,100 @@
+"""
+Tests for the process-wide LLM client pool.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from agio.config import settings
+from agio.llm import client_pool
+from agio.llm.client_pool import close_llm_clients, create_http_client, get_llm_client
+
+
+@pytest.fixture(autouse=True)
+def empty_pool(monkeypatch):
+    monkeypatch.setattr(client_pool, "_clients", {})
+
+
+def make_client_cls() -> MagicMock:
+    client_cls = MagicMock()
+    client_cls.side_effect = lambda **kwargs: MagicMock(close=AsyncMock(), kwargs=kwargs)
+    return client_cls
+
+
+def test_clients_are_shared_per_endpoint_and_key():
+    client_cls = make_client_cls()
+
+    first = get_llm_client(client_cls, base_url="https://a.example.com", api_key="k1")
+    again = get_llm_client(client_cls, base_url="https://a.example.com", api_key="k1")
+    other_key = get_llm_client(client_cls, base_url="https://a.example.com", api_key="k2")
+    other_url = get_llm_client(client_cls, base_url="https://b.example.com", api_key="k1")
+
+    assert first is again
+    assert len({id(first), id(other_key), id(other_url)}) == 3
+    assert client_cls.call_count == 3
+    assert first.kwargs["base_url"] == "https://a.example.com"
+    assert isinstance(first.kwargs["http_client"], httpx.AsyncClient)
+
+
+def test_sdk_default_base_url_is_not_passed():
+    client = get_llm_client(make_client_cls(), api_key="k1")
+    assert "base_url" not in client.kwargs
+
+
+def test_http_client_uses_settings(monkeypatch):
+    monkeypatch.setattr(settings, "llm_http_connect_timeout", 3.0)
+    monkeypatch.setattr(settings, "llm_http_read_timeout", 30.0)
+
+    http_client = create_http_client()
+
+    assert http_client.timeout.connect == 3.0
+    assert http_client.timeout.read == 30.0
+
+
+@pytest.mark.asyncio
+async def test_close_closes_every_client_once():
+    client_cls = make_client_cls()
+    first = get_llm_client(client_cls, api_key="k1")
+    second = get_llm_client(client_cls, api_key="k2")
+    second.close.side_effect = RuntimeError("boom")
+
+    await close_llm_clients()
+    await close_llm_clients()
+
+    first.close.assert_awaited_once()
+    second.close.assert_awaited_once()
+    assert get_llm_client(client_cls, api_key="k1") is not first
+
+
+@pytest.mark.parametrize("sdk", ["openai", "anthropic"])
+def test_sdk_clients_are_built_with_the_sdks_http_client(sdk):
+    module = pytest.importorskip(sdk)
+    client_cls = module.AsyncOpenAI if sdk == "openai" else module.AsyncAnthropic
+
+    client = get_llm_client(client_cls, base_url="https://llm.example.com", api_key="k1")
+
+    assert client is get_llm_client(client_cls, base_url="https://llm.example.com", api_key="k1")
+    assert str(client.base_url).startswith("https://llm.example.com")
+
+
+def test_clients_with_different_kwargs_are_not_shared():
+    client_cls = make_client_cls()
+
+    plain = get_llm_client(client_cls, api_key="k1")
+    headers = get_llm_client(client_cls, api_key="k1", default_headers={"X-Team": "a"})
+
+    assert plain is not headers
+    assert headers is get_llm_client(client_cls, api_key="k1", default_headers={"X-Team": "a"})
+    assert headers.kwargs["default_headers"] == {"X-Team": "a"}
+
+
+@pytest.mark.parametrize("sdk", ["openai", "anthropic"])
+def test_sdk_clients_leave_retries_to_the_model(sdk):
+    module = pytest.importorskip(sdk)
+    client_cls = module.AsyncOpenAI if sdk == "openai" else module.AsyncAnthropic
+
+    client = get_llm_client(client_cls, api_key="k1")
+
+    assert client.max_retries == 0
@@ -0,0 +1,97 @@
+"""
+Tests for LLM request logging: hash-only INFO lines, sampling, payload sink.
+"""
+
+import gzip
+import json
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from agio.config import settings
+from agio.llm import request_log
+from agio.llm.request_log import PayloadSink, log_llm_request, truncate_payload
+
+
+def make_logger(level: int) -> MagicMock:
+    log = MagicMock()
+    log.isEnabledFor.side_effect = lambda lvl: lvl >= level
+    return log
+
+
+class Unserializable:
+    def __str__(self):
+        raise AssertionError("payload was serialized")
+
+
+@pytest.fixture
+def no_sink(monkeypatch):
+    monkeypatch.setattr(request_log, "get_payload_sink", lambda: None)
+
+
+def test_info_line_carries_hash_and_size_only(no_sink):
+    log = make_logger(logging.INFO)
+    params = {"model": "m", "messages": [{"role": "user", "content": "x" * 10_000}]}
+
+    log_llm_request(log, params, model="m", messages_count=1)
+
+    event, = log.info.call_args.args
+    kwargs = log.info.call_args.kwargs
+    assert event == "llm_request"
+    assert kwargs["model"] == "m"
+    assert kwargs["payload_bytes"] == len(json.dumps(params).encode())
+    assert len(kwargs["payload_hash"]) == 16
+    assert "detail" not in kwargs
+    log.debug.assert_not_called()
+
+
+def test_identical_payloads_share_a_hash(no_sink):
+    log = make_logger(logging.INFO)
+    log_llm_request(log, {"a": 1})
+    log_llm_request(log, {"a": 1})
+    log_llm_request(log, {"a": 2})
+
+    hashes = [call.kwargs["payload_hash"] for call in log.info.call_args_list]
+    assert hashes[0] == hashes[1] != hashes[2]
+
+
+def test_nothing_is_serialized_when_disabled(no_sink):
+    log = make_logger(logging.ERROR)
+
+    log_llm_request(log, {"messages": [Unserializable()]}, model="m")
+
+    log.info.assert_not_called()
+    log.debug.assert_not_called()
+
+
+def test_debug_payload_is_truncated_and_sampled(no_sink, monkeypatch):
+    log = make_logger(logging.DEBUG)
+    monkeypatch.setattr(settings, "llm_log_max_field_chars", 5)
+
+    log_llm_request(log, {"messages": [{"content": "abcdefghij"}]})
+    detail = log.debug.call_args.kwargs["detail"]
+    assert detail == {"messages": [{"content": "abcde... [10 chars]"}]}
+
+    log.debug.reset_mock()
+    monkeypatch.setattr(settings, "llm_log_sample_rate", 0.0)
+    log_llm_request(log, {"messages": []})
+    log.debug.assert_not_called()
+
+
+def test_truncate_payload_keeps_structure():
+    assert truncate_payload({"a": ["xyz", 1, None]}, 2) == {"a": ["xy... [3 chars]", 1, None]}
+
+
+def test_payload_sink_rotates_into_gzip(tmp_path):
+    path = tmp_path / "payloads" / "llm.jsonl"
+    sink = PayloadSink(str(path), max_bytes=200, backup_count=2)
+    for i in range(3):
+        sink.write(f"hash{i}", {"model": "m"}, json.dumps({"messages": ["x" * 150]}))
+    sink.close()
+
+    with gzip.open(f"{path}.1.gz", "rt") as f:
+        record = json.loads(f.read())
+    assert record["model"] == "m"
+    assert record["payload"] == {"messages": ["x" * 150]}
+    assert json.loads(path.read_text())["payload_hash"] == "hash2"
@@ -0,0 +1,181 @@
+"""
+Tests for delta-encoded LLM context snapshots.
+"""
+
+import time
+
+import pytest
+
+from agio.agent.executor import AgentExecutor
+from agio.domain import (
+    LLMContextEncoder,
+    MessageRole,
+    Step,
+    ToolResult,
+    compute_tools_hash,
+    resolve_llm_context,
+)
+from agio.llm import Model, StreamChunk
+from agio.runtime import Wire
+from agio.runtime.protocol import ExecutionContext
+from agio.runtime.sequence_manager import SequenceManager
+from agio.storage.session import InMemorySessionStore, SQLiteSessionStore
+from agio.tools import BaseTool
+
+TOOLS = [{"type": "function", "function": {"name": "echo", "parameters": {}}}]
+
+
+class EchoTool(BaseTool):
+    """A tool that echoes its call id"""
+
+    def get_name(self) -> str:
+        return "echo"
+
+    def get_description(self) -> str:
+        return "Echo"
+
+    def get_parameters(self) -> dict:
+        return {"type": "object", "properties": {}}
+
+    def is_concurrency_safe(self) -> bool:
+        return True
+
+    async def execute(self, parameters: dict, context, abort_signal=None) -> ToolResult:
+        now = time.time()
+        return ToolResult(
+            tool_name=self.name,
+            tool_call_id=parameters.get("tool_call_id", ""),
+            input_args=parameters,
+            content="echoed",
+            output=None,
+            start_time=now,
+            end_time=now,
+            duration=0.0,
+        )
+
+
+class ToolLoopModel(Model):
+    """Calls the echo tool a fixed number of times, then answers."""
+
+    id: str = "test/loop"
+    name: str = "loop"
+
+    def __init__(self, tool_rounds: int):
+        super().__init__()
+        self._remaining = tool_rounds
+
+    async def arun_stream(self, messages, tools=None):
+        if self._remaining > 0:
+            self._remaining -= 1
+            yield StreamChunk(
+                tool_calls=[
+                    {
+                        "index": 0,
+                        "id": f"call_{self._remaining}",
+                        "type": "function",
+                        "function": {"name": "echo", "arguments": "{}"},
+                    }
+                ]
+            )
+        else:
+            yield StreamChunk(content="done")
+
+
+def _assistant_step(seq: int, delta) -> Step:
+    return Step(
+        session_id="s1",
+        run_id="r1",
+        sequence=seq,
+        role=MessageRole.ASSISTANT,
+        llm_messages=delta.messages,
+        llm_tools=delta.tools,
+        llm_snapshot_id=delta.snapshot_id,
+        llm_parent_snapshot_id=delta.parent_snapshot_id,
+        llm_tools_hash=delta.tools_hash,
+    )
+
+
+def test_encoder_stores_only_appended_messages():
+    encoder = LLMContextEncoder()
+    messages = [{"role": "system", "content": "sys"}, {"role": "user", "content": "hi"}]
+
+    first = encoder.encode(messages, TOOLS)
+    assert first.parent_snapshot_id is None
+    assert first.messages == messages
+    assert first.tools == TOOLS
+
+    messages.append({"role": "assistant", "content": "a"})
+    messages.append({"role": "tool", "tool_call_id": "c", "content": "r"})
+    second = encoder.encode(messages, TOOLS)
+
+    assert second.parent_snapshot_id == first.snapshot_id
+    assert second.messages == messages[2:]
+    assert second.tools is None
+    assert second.tools_hash == compute_tools_hash(TOOLS)
+
+
+def test_encoder_falls_back_to_full_snapshot_when_prefix_differs():
+    encoder = LLMContextEncoder()
+    encoder.encode([{"role": "user", "content": "a"}], None)
+
+    delta = encoder.encode([{"role": "user", "content": "b"}], None)
+
+    assert delta.parent_snapshot_id is None
+    assert delta.messages == [{"role": "user", "content": "b"}]
+
+
+def test_resolve_llm_context_rebuilds_chain():
+    encoder = LLMContextEncoder()
+    messages = [{"role": "user", "content": "hi"}]
+    steps = [_assistant_step(1, encoder.encode(messages, TOOLS))]
+    for i in range(3):
+        messages.append({"role": "tool", "tool_call_id": str(i), "content": str(i)})
+        steps.append(_assistant_step(i + 2, encoder.encode(messages, TOOLS)))
+
+    snapshots = {s.llm_snapshot_id: s for s in steps}
+    resolved_messages, resolved_tools = resolve_llm_context(steps[-1], snapshots)
+
+    assert resolved_messages == messages
+    assert resolved_tools == TOOLS
+
+    # Broken chain cannot be resolved
+    del snapshots[steps[0].llm_snapshot_id]
+    assert resolve_llm_context(steps[-1], snapshots)[0] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+async def test_agent_loop_persists_deltas_and_store_resolves(backend, tmp_path):
+    if backend == "sqlite":
+        store = SQLiteSessionStore(db_path=str(tmp_path / "agio.db"))
+        await store.connect()
+    else:
+        store = InMemorySessionStore()
+
+    executor = AgentExecutor(
+        model=ToolLoopModel(tool_rounds=3),
+        tools=[EchoTool()],
+        session_store=store,
+        sequence_manager=SequenceManager(store),
+    )
+    context = ExecutionContext(run_id="r1", session_id="s1", wire=Wire())
+    messages = [{"role": "system", "content": "sys"}, {"role": "user", "content": "go"}]
+
+    await executor.execute(messages, context)
+
+    steps = await store.get_steps("s1")
+    assistant_steps = [s for s in steps if s.is_assistant_step()]
+    assert len(assistant_steps) == 4
+    assert assistant_steps[0].llm_parent_snapshot_id is None
+    for step in assistant_steps[1:]:
+        # Each step stores only the previous assistant message + tool result
+        assert step.llm_parent_snapshot_id is not None
+        assert len(step.llm_messages) == 2
+        assert step.llm_tools is None
+
+    resolved = await store.resolve_llm_context(assistant_steps[-1])
+    assert resolved.llm_messages == messages[:-1]
+    assert resolved.llm_tools == executor._tool_schemas
+
+    if backend == "sqlite":
+        await store.disconnect()
@@ -0,0 +1,58 @@
+"""
+Tests for the per-model message conversion cache.
+"""
+
+from unittest.mock import MagicMock
+
+from agio.llm.deepseek import DeepseekModel
+from agio.llm.message_cache import ConversionCache
+
+
+def test_conversions_are_memoized_by_identity_and_variant():
+    cache = ConversionCache()
+    convert = MagicMock(side_effect=lambda m: {**m, "converted": True})
+    message = {"role": "user", "content": "x"}
+
+    first = cache.message(message, convert)
+    assert cache.message(message, convert) is first
+    assert cache.message(dict(message), convert) is not first
+    assert cache.message(message, convert, variant="other") is not first
+
+    assert convert.call_count == 3
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_least_recently_used_messages_are_evicted():
+    cache = ConversionCache(max_messages=2)
+    convert = MagicMock(side_effect=lambda m: m["content"])
+    a, b, c = ({"content": name} for name in "abc")
+
+    cache.message(a, convert)
+    cache.message(b, convert)
+    cache.message(a, convert)
+    cache.message(c, convert)  # Evicts b
+    cache.message(a, convert)
+    cache.message(b, convert)
+
+    assert [call.args[0]["content"] for call in convert.call_args_list] == ["a", "b", "c", "b"]
+
+
+def test_deepseek_preprocessing_rewrites_assistant_messages_once():
+    model = DeepseekModel(name="deepseek-reasoner", api_key="sk-test")
+    user = {"role": "user", "content": "Hi"}
+    assistant = {"role": "assistant", "content": "Hello", "reasoning_content": "think"}
+    messages = [user, assistant, {"role": "user", "content": "Again"}]
+
+    processed = model._preprocess_messages_for_thinking_mode(messages)
+    again = model._preprocess_messages_for_thinking_mode(messages)
+
+    # New turn: reasoning dropped from history, originals untouched
+    assert processed[1] == {"role": "assistant", "content": "Hello"}
+    assert assistant["reasoning_content"] == "think"
+    assert processed[0] is user
+    assert again[1] is processed[1]
+
+    # Same turn (last message is not a user message): reasoning kept
+    tool_turn = [user, {"role": "assistant", "content": "x"}, {"role": "tool", "content": "r"}]
+    processed = model._preprocess_messages_for_thinking_mode(tool_turn)
+    assert processed[1] == {"role": "assistant", "content": "x", "reasoning_content": None}
@@ -0,0 +1,144 @@
+"""
+Tests for the mock LLM providers and the OpenAI-compatible stub.
+"""
+
+import json
+
+import httpx
+import pytest
+
+from agio.config.model_provider_registry import ModelProviderRegistry
+from agio.config.schema import ModelConfig
+from agio.llm.mock import ReplayModel, SyntheticModel
+from agio.llm.mock_server import create_mock_app
+
+TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "read_file",
+            "parameters": {
+                "type": "object",
+                "properties": {"path": {"type": "string"}, "limit": {"type": "integer"}},
+                "required": ["path"],
+            },
+        },
+    }
+]
+
+
+def fast(**kwargs):
+    return SyntheticModel(id="synthetic/s", name="s", ttft_ms=0, inter_token_ms=0, **kwargs)
+
+
+async def collect(model, messages, tools=None):
+    return [chunk async for chunk in model.arun_stream(messages, tools=tools)]
+
+
+@pytest.mark.asyncio
+async def test_synthetic_stream_is_deterministic_and_chunked():
+    model = fast(output_tokens=10, chunk_tokens=3)
+    messages = [{"role": "user", "content": "hi"}]
+
+    first = await collect(model, messages)
+    second = await collect(model, messages)
+
+    assert [c.model_dump() for c in first] == [c.model_dump() for c in second]
+    text = [c.content for c in first if c.content]
+    assert len(text) == 4
+    assert len("".join(text).split()) == 10
+    assert first[-1].finish_reason == "stop"
+    assert first[-1].usage["output_tokens"] == 10
+
+
+@pytest.mark.asyncio
+async def test_synthetic_tool_calls_follow_the_schema_and_stop_after_max_rounds():
+    model = fast(tool_call_rate=1.0, max_tool_rounds=1, chunk_tokens=2)
+    messages = [{"role": "user", "content": "read it"}]
+
+    chunks = await collect(model, messages, TOOLS)
+
+    deltas = [tc for c in chunks for tc in c.tool_calls or []]
+    assert deltas[0]["function"]["name"] == "read_file"
+    arguments = json.loads("".join(d["function"]["arguments"] for d in deltas))
+    assert list(arguments) == ["path"]
+    assert chunks[-1].finish_reason == "tool_calls"
+
+    messages.append({"role": "assistant", "tool_calls": [{"id": deltas[0]["id"]}]})
+    messages.append({"role": "tool", "tool_call_id": deltas[0]["id"], "content": "x"})
+    chunks = await collect(model, messages, TOOLS)
+    assert chunks[-1].finish_reason == "stop"
+
+
+@pytest.mark.asyncio
+async def test_replay_serves_recorded_steps_in_conversation_order(tmp_path):
+    steps = [
+        {"sequence": 1, "role": "user", "content": "q"},
+        {
+            "sequence": 2,
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {"id": "c1", "type": "function", "function": {"name": "ls", "arguments": "{}"}}
+            ],
+            "metrics": {"first_token_latency_ms": 0, "input_tokens": 50, "output_tokens": 5},
+        },
+        {"sequence": 3, "role": "tool", "tool_call_id": "c1", "content": "a"},
+        {"sequence": 4, "role": "assistant", "content": "done here"},
+    ]
+    path = tmp_path / "steps.json"
+    path.write_text(json.dumps({"items": steps}))
+    model = ReplayModel(id="replay/r", name="r", replay_path=str(path), ttft_ms=0, inter_token_ms=0)
+
+    first = await collect(model, [{"role": "user", "content": "q"}])
+    assert first[0].tool_calls[0]["id"] == "c1"
+    assert first[-1].usage["input_tokens"] == 50
+
+    second = await collect(
+        model,
+        [{"role": "user", "content": "q"}, {"role": "assistant"}, {"role": "tool"}],
+    )
+    assert "".join(c.content or "" for c in second) == "done here"
+
+
+def test_registry_passes_provider_options():
+    config = ModelConfig(
+        name="load",
+        provider="synthetic",
+        model_name="synthetic",
+        options={"ttft_ms": 5, "tool_call_rate": 0.5},
+    )
+
+    model = ModelProviderRegistry().create_model(config)
+
+    assert isinstance(model, SyntheticModel)
+    assert model.ttft_ms == 5
+    assert model.tool_call_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_stub_streams_openai_chunks():
+    app = create_mock_app(fast(output_tokens=4, chunk_tokens=2))
+    request = {
+        "model": "mock",
+        "messages": [{"role": "user", "content": "hi"}],
+        "stream": True,
+        "stream_options": {"include_usage": True},
+    }
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://stub"
+    ) as client:
+        response = await client.post("/v1/chat/completions", json=request)
+        completion = await client.post(
+            "/v1/chat/completions", json={**request, "stream": False}
+        )
+
+    lines = [line[6:] for line in response.text.splitlines() if line.startswith("data: ")]
+    assert lines[-1] == "[DONE]"
+    events = [json.loads(line) for line in lines[:-1]]
+    text = "".join(e["choices"][0]["delta"].get("content", "") for e in events if e["choices"])
+    assert events[-1]["usage"]["completion_tokens"] == 4
+
+    message = completion.json()["choices"][0]["message"]
+    assert message["content"] == text
@@ -0,0 +1,143 @@
+"""
+Tests for the client-side LLM rate limiter.
+"""
+
+import asyncio
+
+import pytest
+
+from agio.llm.rate_limit import (
+    ProviderRateLimiter,
+    estimate_request_tokens,
+    get_rate_limiter,
+)
+from agio.utils.tokens import estimate_tokens
+
+
+@pytest.mark.asyncio
+async def test_unlimited_limiter_does_not_wait():
+    limiter = ProviderRateLimiter()
+    lease = await limiter.acquire(10_000)
+    lease.settle(9_000)
+    assert not limiter.enabled
+    assert limiter.stats().throttled == 0
+
+
+@pytest.mark.asyncio
+async def test_waits_for_token_budget_to_refill():
+    # 12000 TPM refills 200 tokens per second
+    limiter = ProviderRateLimiter(tokens_per_minute=12_000)
+    await limiter.acquire(12_000)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await limiter.acquire(20)
+
+    assert loop.time() - started >= 0.08
+    assert limiter.stats().throttled == 1
+
+
+@pytest.mark.asyncio
+async def test_settle_returns_overestimated_tokens():
+    limiter = ProviderRateLimiter(tokens_per_minute=1_000)
+    lease = await limiter.acquire(1_000)
+    assert limiter.stats().available_tokens < 10
+
+    lease.settle(100)
+    lease.settle(100)  # Idempotent
+
+    assert limiter.stats().available_tokens >= 900
+    assert limiter.stats().actual_tokens == 100
+
+
+@pytest.mark.asyncio
+async def test_interactive_first_then_round_robin_across_sessions():
+    # 60000 TPM refills 100 tokens per 0.1 s
+    limiter = ProviderRateLimiter(tokens_per_minute=60_000)
+    await limiter.acquire(60_000)
+
+    order = []
+
+    async def request(name, session_id, interactive=True):
+        await limiter.acquire(100, session_id=session_id, interactive=interactive)
+        order.append(name)
+
+    tasks = [
+        asyncio.create_task(request("nested", "a", interactive=False)),
+        asyncio.create_task(request("a1", "a")),
+        asyncio.create_task(request("a2", "a")),
+        asyncio.create_task(request("b1", "b")),
+    ]
+    await asyncio.gather(*tasks)
+
+    assert order == ["a1", "b1", "a2", "nested"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue():
+    limiter = ProviderRateLimiter(requests_per_minute=600)
+    for _ in range(600):
+        await limiter.acquire(0)
+
+    blocked = asyncio.create_task(limiter.acquire(0, session_id="a"))
+    await asyncio.sleep(0.01)
+    assert limiter.stats().waiting == 1
+
+    blocked.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await blocked
+
+    assert limiter.stats().waiting == 0
+    await asyncio.wait_for(limiter.acquire(0, session_id="b"), timeout=1)
+
+
+def test_limiter_is_shared_per_account():
+    first = get_rate_limiter("https://api.example.com/v1", "key-1", requests_per_minute=10)
+    again = get_rate_limiter("https://api.example.com/v1", "key-1")
+    other = get_rate_limiter("https://api.example.com/v1", "key-2", requests_per_minute=10)
+
+    assert first is again
+    assert first is not other
+
+
+def test_later_lookup_updates_the_limits():
+    first = get_rate_limiter("https://limits.example.com/v1", "key-1", requests_per_minute=10)
+    first._take(0)
+    again = get_rate_limiter(
+        "https://limits.example.com/v1", "key-1", requests_per_minute=600, tokens_per_minute=1000
+    )
+    unchanged = get_rate_limiter("https://limits.example.com/v1", "key-1")
+
+    assert first is again is unchanged
+    assert (first.requests_per_minute, first.tokens_per_minute) == (600, 1000)
+    # The used request stays used under the new capacity
+    assert first.stats().available_requests < 10
+    assert first.stats().available_tokens == pytest.approx(1000)
+
+
+@pytest.mark.asyncio
+async def test_raised_limit_wakes_waiters():
+    limiter = ProviderRateLimiter(requests_per_minute=1)
+    await limiter.acquire(0)
+    waiter = asyncio.ensure_future(limiter.acquire(0))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    limiter.set_limits(requests_per_minute=6000)
+
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+def test_estimate_request_tokens_includes_max_tokens():
+    messages = [{"role": "user", "content": "x" * 400}]
+    assert estimate_request_tokens(messages) == 104
+    assert estimate_request_tokens(messages, max_tokens=1000) == 1104
+
+
+def test_estimate_request_tokens_matches_the_compaction_estimate():
+    messages = [
+        {"role": "user", "content": "x" * 401},
+        {"role": "assistant", "content": None, "tool_calls": [{"id": "c1", "arguments": "{}"}]},
+        {"role": "tool", "content": "y" * 77},
+    ]
+    assert estimate_request_tokens(messages) == sum(estimate_tokens(m) for m in messages)
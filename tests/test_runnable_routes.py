@@ -0,0 +1,108 @@
+"""
+Route-level tests for background runs of real agents.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from agio.agent import Agent
+from agio.api.deps import get_session_store, get_trace_store
+from agio.api.routes import runnables
+from agio.config import get_config_system
+from agio.domain import RunStatus, StepEventType
+from agio.llm import SyntheticModel
+from agio.runtime import RunManager
+from agio.storage.session import InMemorySessionStore
+
+
+class FakeConfigSystem:
+    def __init__(self, agent: Agent) -> None:
+        self.agent = agent
+
+    def get_instance(self, name, component_type=None):
+        if name != self.agent.id:
+            raise KeyError(name)
+        return self.agent
+
+
+def _app(agent: Agent, store: InMemorySessionStore) -> FastAPI:
+    app = FastAPI()
+    app.include_router(runnables.router)
+    app.dependency_overrides[get_config_system] = lambda: FakeConfigSystem(agent)
+    app.dependency_overrides[get_session_store] = lambda: store
+    app.dependency_overrides[get_trace_store] = lambda: None
+    return app
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = RunManager()
+    monkeypatch.setattr(runnables, "get_run_manager", lambda: manager)
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_aborting_a_streaming_agent_run_marks_it_cancelled(manager):
+    store = InMemorySessionStore()
+    # About 5 s of streamed text, so the abort lands mid-stream
+    model = SyntheticModel(
+        id="synthetic/slow", name="slow", ttft_ms=0, inter_token_ms=50, output_tokens=100
+    )
+    agent = Agent(model=model, session_store=store, name="slow_agent")
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=_app(agent, store)), base_url="http://test"
+    ) as client:
+        started = await client.post(
+            "/runnables/slow_agent/run", json={"query": "hi", "detach": True}
+        )
+        run_id = started.json()["run_id"]
+
+        subscription = manager.get(run_id).wire.subscribe(after_event_id=0)
+        async for event in subscription:
+            if event.delta and event.delta.content:
+                break
+        subscription.close()
+
+        aborted = await client.post(f"/runnables/runs/{run_id}/abort")
+        assert aborted.status_code == 200
+        await asyncio.wait_for(manager.get(run_id).task, timeout=5)
+
+        status = (await client.get(f"/runnables/runs/{run_id}")).json()
+
+    assert status["status"] == "cancelled"
+    assert status["termination_reason"] == "cancelled"
+    assert status["error"] == "Aborted by user"
+
+    # Stored run and event stream agree with the run manager
+    assert (await store.get_run(run_id)).status == RunStatus.CANCELLED
+    run_events = [
+        event.type
+        async for event in manager.get(run_id).wire.subscribe(after_event_id=0)
+        if event.type in (StepEventType.RUN_COMPLETED, StepEventType.RUN_FAILED)
+    ]
+    assert run_events == [StepEventType.RUN_FAILED]
+
+
+@pytest.mark.asyncio
+async def test_non_streaming_run_returns_its_events(manager):
+    store = InMemorySessionStore()
+    model = SyntheticModel(
+        id="synthetic/fast", name="fast", ttft_ms=0, inter_token_ms=0, output_tokens=5
+    )
+    agent = Agent(model=model, session_store=store, name="fast_agent")
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=_app(agent, store)), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            "/runnables/fast_agent/run", json={"query": "hi", "stream": False}
+        )
+
+    assert response.status_code == 200
+    events = response.json()["events"]
+    assert events[0]["event"] == StepEventType.RUN_STARTED.value
+    assert events[-1]["event"] == StepEventType.RUN_COMPLETED.value
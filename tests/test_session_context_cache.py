@@ -0,0 +1,166 @@
+"""
+Tests for SessionContextCache.
+"""
+
+import pytest
+
+from agio.agent.context import build_context_from_steps
+from agio.domain import MessageRole, Step
+from agio.runtime import fork_session
+from agio.storage.session import (
+    InMemorySessionStore,
+    SessionContextCache,
+    SessionStore,
+    SessionStoreListener,
+    SQLiteSessionStore,
+)
+
+
+class CountingStore(InMemorySessionStore):
+    """Records the start_seq of every get_steps query."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.queries: list[int | None] = []
+
+    async def get_steps(self, session_id, start_seq=None, **kwargs):
+        self.queries.append(start_seq)
+        return await super().get_steps(session_id, start_seq=start_seq, **kwargs)
+
+
+def _step(seq: int, content: str, runnable_id: str = "agent", session_id: str = "s1") -> Step:
+    role = MessageRole.USER if seq % 2 else MessageRole.ASSISTANT
+    return Step(
+        session_id=session_id,
+        run_id="r1",
+        sequence=seq,
+        role=role,
+        content=content,
+        runnable_id=runnable_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_only_new_steps_are_fetched():
+    store = CountingStore()
+    cache = SessionContextCache(store)
+    for seq in range(1, 5):
+        await store.save_step(_step(seq, f"m{seq}"))
+
+    first = await cache.get_messages("s1", runnable_id="agent")
+    await store.save_step(_step(5, "m5"))
+    await store.save_step(_step(6, "other", runnable_id="other"))
+    second = await cache.get_messages("s1", runnable_id="agent")
+
+    assert [m["content"] for m in first] == ["m1", "m2", "m3", "m4"]
+    assert [m["content"] for m in second] == ["m1", "m2", "m3", "m4", "m5"]
+    assert store.queries == [1, 5]
+    assert cache.stats().hits == 1
+
+    # Same result as a full rebuild
+    assert second == await build_context_from_steps("s1", store, runnable_id="agent")
+
+    # Callers may append to the returned list without touching the cache
+    second.append({"role": "user", "content": "scratch"})
+    assert len(await cache.get_messages("s1", runnable_id="agent")) == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+async def test_delete_steps_invalidates(backend, tmp_path):
+    if backend == "sqlite":
+        store = SQLiteSessionStore(db_path=str(tmp_path / "agio.db"))
+        await store.connect()
+    else:
+        store = InMemorySessionStore()
+    cache = SessionContextCache.for_store(store)
+    for seq in range(1, 5):
+        await store.save_step(_step(seq, f"m{seq}"))
+    assert len(await cache.get_messages("s1", runnable_id="agent")) == 4
+
+    await store.delete_steps("s1", start_seq=3)
+    await store.save_step(_step(3, "edited"))
+
+    messages = await cache.get_messages("s1", runnable_id="agent")
+    assert [m["content"] for m in messages] == ["m1", "m2", "edited"]
+    assert cache.stats().invalidations == 1
+
+    if backend == "sqlite":
+        await store.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_fork_reads_the_new_session_from_the_store():
+    store = InMemorySessionStore()
+    cache = SessionContextCache.for_store(store)
+    for seq in range(1, 5):
+        await store.save_step(_step(seq, f"m{seq}"))
+    await cache.get_messages("s1", runnable_id="agent")
+
+    new_session_id, _, _ = await fork_session(
+        "s1", sequence=2, session_store=store, modified_content="forked"
+    )
+
+    messages = await cache.get_messages(new_session_id, runnable_id="agent")
+    assert [m["content"] for m in messages] == ["m1", "forked"]
+
+
+@pytest.mark.asyncio
+async def test_step_saved_behind_the_watermark_is_not_missed():
+    store = CountingStore()
+    cache = SessionContextCache.for_store(store)
+    for seq in (1, 2, 4):
+        await store.save_step(_step(seq, f"m{seq}"))
+    await cache.get_messages("s1", runnable_id="agent")
+
+    await store.save_step(_step(5, "m5"))  # an append keeps the entry
+    # A slower tool step reserved sequence 3 but is saved after 4 and 5
+    await store.save_step(_step(3, "m3"))
+    messages = await cache.get_messages("s1", runnable_id="agent")
+
+    assert [m["content"] for m in messages] == ["m1", "m2", "m3", "m4", "m5"]
+    assert messages == await build_context_from_steps("s1", store, runnable_id="agent")
+    assert cache.stats().invalidations == 1
+
+
+class _Recorder(SessionStoreListener):
+    def __init__(self) -> None:
+        self.changed: list[str] = []
+
+    def on_session_changed(self, store, session_id):
+        self.changed.append(session_id)
+
+
+@pytest.mark.asyncio
+async def test_listeners_hear_about_deleted_and_forked_sessions():
+    store = InMemorySessionStore()
+    for seq in range(1, 5):
+        await store.save_step(_step(seq, f"m{seq}"))
+    recorder = _Recorder()
+    SessionStore.add_listener(recorder)
+    try:
+        await store.delete_steps("s1", start_seq=4)
+        new_session_id, _, _ = await fork_session("s1", 2, store)
+    finally:
+        SessionStore.remove_listener(recorder)
+
+    assert recorder.changed == ["s1", new_session_id]
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_respects_byte_budget():
+    store = InMemorySessionStore()
+    cache = SessionContextCache(store, max_bytes=250)
+    for session_id in ("a", "b", "c"):
+        await store.save_step(_step(1, "x" * 100, session_id=session_id))
+
+    await cache.get_messages("a")
+    await cache.get_messages("b")
+    await cache.get_messages("a")  # a is now most recently used
+    await cache.get_messages("c")
+
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.entries == 2
+    assert stats.bytes <= 250
+    assert {key[0] for key in cache._entries} == {"a", "c"}
@@ -5,11 +5,15 @@ Focuses on StepResponse serialization to ensure tool calls are correctly
 represented with all required fields.
 """
 
+import json
+
 import pytest
+from fastapi import HTTPException
 
-from agio.api.routes.sessions import StepResponse
-from agio.domain import MessageRole
+from agio.api.routes.sessions import StepResponse, get_step_llm_request
+from agio.domain import MessageRole, create_step_completed_event
 from agio.domain.models import Step
+from agio.storage.session import InMemorySessionStore
 
 
 class TestStepResponse:
@@ -233,5 +237,49 @@ class TestStepResponseSerialization:
         assert tc2["function"]["name"] == "format_result"
 
 
+def _assistant_step(**kwargs) -> Step:
+    return Step(
+        id="step-a",
+        session_id="session-1",
+        run_id="run-1",
+        sequence=2,
+        role=MessageRole.ASSISTANT,
+        content="Hi",
+        llm_messages=[{"role": "user", "content": "Hello"}],
+        llm_tools=[{"type": "function", "function": {"name": "read"}}],
+        llm_request_params={"temperature": 0.2},
+        **kwargs,
+    )
+
+
+class TestLeanSnapshots:
+    """STEP_COMPLETED snapshots leave out the LLM request."""
+
+    def test_client_json_drops_llm_request_fields(self):
+        step = _assistant_step()
+        event = create_step_completed_event(step_id=step.id, run_id="run-1", snapshot=step)
+
+        snapshot = json.loads(event.to_client_json())["snapshot"]
+        assert snapshot["content"] == "Hi"
+        assert not any(key.startswith("llm_") for key in snapshot)
+
+        full = json.loads(event.to_client_json(full_snapshot=True))["snapshot"]
+        assert full["llm_messages"] == [{"role": "user", "content": "Hello"}]
+
+    @pytest.mark.asyncio
+    async def test_llm_request_endpoint(self):
+        store = InMemorySessionStore()
+        await store.save_step(_assistant_step())
+
+        response = await get_step_llm_request("session-1", "step-a", session_store=store)
+        assert response.messages == [{"role": "user", "content": "Hello"}]
+        assert response.tools[0]["function"]["name"] == "read"
+        assert response.request_params == {"temperature": 0.2}
+
+        with pytest.raises(HTTPException) as exc:
+            await get_step_llm_request("session-1", "missing", session_store=store)
+        assert exc.value.status_code == 404
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
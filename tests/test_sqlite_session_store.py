@@ -0,0 +1,114 @@
+"""
+Tests for SQLiteSessionStore batched writes and connection pragmas.
+"""
+
+import pytest
+import pytest_asyncio
+
+from agio.domain import MessageRole, Step, StepMetrics
+from agio.runtime.control import fork_session
+from agio.storage.session import SQLiteSessionStore
+
+
+def _make_steps(session_id: str, count: int) -> list[Step]:
+    steps = []
+    for seq in range(1, count + 1):
+        if seq % 2:
+            steps.append(
+                Step(
+                    session_id=session_id,
+                    run_id="r1",
+                    sequence=seq,
+                    role=MessageRole.ASSISTANT,
+                    content=f"answer {seq}",
+                    tool_calls=[{"id": f"call_{seq}", "type": "function"}],
+                    metrics=StepMetrics(input_tokens=seq),
+                )
+            )
+        else:
+            steps.append(
+                Step(
+                    session_id=session_id,
+                    run_id="r1",
+                    sequence=seq,
+                    role=MessageRole.TOOL,
+                    content="result",
+                    content_for_user="shown to user",
+                    tool_call_id=f"call_{seq - 1}",
+                    name="echo",
+                )
+            )
+    return steps
+
+
+@pytest_asyncio.fixture
+async def store(tmp_path):
+    store = SQLiteSessionStore(db_path=str(tmp_path / "agio.db"))
+    await store.connect()
+    yield store
+    await store.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_connect_applies_pragmas(store):
+    async with store._connection.execute("PRAGMA journal_mode") as cursor:
+        assert (await cursor.fetchone())[0].lower() == "wal"
+    async with store._connection.execute("PRAGMA synchronous") as cursor:
+        assert (await cursor.fetchone())[0] == 1  # NORMAL
+
+
+@pytest.mark.asyncio
+async def test_save_steps_batch_round_trip(store):
+    steps = _make_steps("s1", 50)
+
+    await store.save_steps_batch(steps)
+
+    loaded = await store.get_steps("s1")
+    assert [s.id for s in loaded] == [s.id for s in steps]
+    assert loaded[0].tool_calls == steps[0].tool_calls
+    assert loaded[0].metrics.input_tokens == 1
+    assert loaded[1].content_for_user == "shown to user"
+
+    # Upsert: re-saving replaces rows instead of duplicating them
+    steps[0] = steps[0].model_copy(update={"content": "edited"})
+    await store.save_steps_batch(steps[:1])
+    assert (await store.get_step_count("s1")) == 50
+    assert (await store.get_steps("s1", end_seq=1))[0].content == "edited"
+
+
+@pytest.mark.asyncio
+async def test_save_steps_batch_is_atomic(store):
+    steps = _make_steps("s1", 4)
+    # role is NOT NULL: the last row fails and the whole batch is rolled back
+    invalid = steps[0].model_copy(update={"id": "invalid", "sequence": 5, "role": None})
+
+    with pytest.raises(Exception):
+        await store.save_steps_batch(steps + [invalid])
+
+    assert await store.get_step_count("s1") == 0
+
+    await store.save_steps_batch(steps)
+    assert await store.get_step_count("s1") == 4
+
+
+@pytest.mark.asyncio
+async def test_fork_session_copies_steps_in_one_batch(store):
+    await store.save_steps_batch(_make_steps("s1", 20))
+
+    new_session_id, last_sequence, pending = await fork_session("s1", 20, store)
+
+    assert last_sequence == 20
+    assert pending is None
+    forked = await store.get_steps(new_session_id)
+    assert [s.sequence for s in forked] == list(range(1, 21))
+    assert forked[1].content_for_user == "shown to user"
+
+
+@pytest.mark.asyncio
+async def test_get_step_by_id(store):
+    steps = _make_steps("s1", 3)
+    await store.save_steps_batch(steps)
+
+    found = await store.get_step_by_id("s1", steps[1].id)
+    assert found.sequence == 2
+    assert await store.get_step_by_id("other", steps[1].id) is None
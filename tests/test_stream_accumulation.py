@@ -0,0 +1,174 @@
+"""
+Tests and micro-benchmark for streaming accumulation in StepBuilder.
+
+Run directly for a timing table:
+    PYTHONPATH=. python tests/test_stream_accumulation.py
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from agio.agent.executor import DeltaCoalescer, StepBuilder, ToolCallAccumulator
+from agio.domain import MessageRole, Step, StepMetrics
+from agio.llm import StreamChunk
+
+TOKEN = "tok "
+
+
+class _NullState:
+    """Stands in for RunState; drops delta events."""
+
+    async def emit_delta(self, step_id, **delta) -> None:
+        pass
+
+
+def _builder() -> StepBuilder:
+    step = Step(
+        session_id="s1",
+        run_id="r1",
+        sequence=1,
+        role=MessageRole.ASSISTANT,
+        content="",
+        metrics=StepMetrics(),
+    )
+    return StepBuilder(step=step, state=_NullState())
+
+
+def _stream(tokens: int) -> list[StreamChunk]:
+    chunks = [StreamChunk(content=TOKEN) for _ in range(tokens)]
+    chunks.append(
+        StreamChunk(
+            tool_calls=[
+                {"index": 0, "id": "call_1", "function": {"name": "file_write", "arguments": "{"}}
+            ]
+        )
+    )
+    chunks.extend(
+        StreamChunk(tool_calls=[{"index": 0, "function": {"arguments": '"a": 1, '}}])
+        for _ in range(tokens)
+    )
+    chunks.append(StreamChunk(tool_calls=[{"index": 0, "function": {"arguments": '"z": 0}'}}]))
+    return chunks
+
+
+async def _accumulate(chunks: list[StreamChunk]) -> tuple[float, Step]:
+    builder = _builder()
+    start = time.perf_counter()
+    for chunk in chunks:
+        await builder.process_chunk(chunk)
+    step = builder.finalize()
+    return time.perf_counter() - start, step
+
+
+@pytest.mark.asyncio
+async def test_builder_joins_buffered_parts():
+    builder = _builder()
+    for part in ("Hel", "lo"):
+        await builder.process_chunk(StreamChunk(content=part, reasoning_content=part))
+
+    assert builder.snapshot().content == "Hello"
+    await builder.process_chunk(StreamChunk(content="!"))
+    step = builder.finalize()
+
+    assert step.content == "Hello!"
+    assert step.reasoning_content == "Hello"
+    assert step.tool_calls is None
+
+
+def test_tool_call_accumulator_joins_fragments():
+    acc = ToolCallAccumulator()
+    acc.accumulate([{"index": 0, "id": "c1", "function": {"name": "read", "arguments": '{"a"'}}])
+    acc.accumulate([{"index": 0, "function": {"arguments": ": 1}"}}])
+    acc.accumulate([{"index": 1, "function": {"name": "orphan"}}])  # no id, dropped
+
+    assert acc.finalize() == [
+        {"id": "c1", "type": "function", "function": {"name": "read", "arguments": '{"a": 1}'}}
+    ]
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.events = []
+
+    async def __call__(self, step_id, delta) -> None:
+        self.events.append((step_id, delta))
+
+
+@pytest.mark.asyncio
+async def test_coalescer_merges_text_and_flushes_on_tool_call():
+    emitted = _Recorder()
+    deltas = DeltaCoalescer(emitted, window_ms=10_000)
+    for part in ("Hel", "lo"):
+        await deltas.add("s1", content=part)
+    assert emitted.events == []
+
+    call = {"index": 0, "id": "c1", "function": {"name": "read", "arguments": ""}}
+    await deltas.add("s1", tool_calls=[call])
+    await deltas.add("s1", tool_calls=[{"index": 0, "function": {"arguments": "{}"}}])
+    await deltas.add("s1", usage={"total_tokens": 3})
+    await deltas.flush()
+
+    assert [delta.content for _, delta in emitted.events] == ["Hello", None]
+    tool_delta = emitted.events[1][1]
+    assert len(tool_delta.tool_calls) == 2
+    assert tool_delta.usage == {"total_tokens": 3}
+
+
+@pytest.mark.asyncio
+async def test_coalescer_flushes_on_size_and_step_change():
+    emitted = _Recorder()
+    deltas = DeltaCoalescer(emitted, window_ms=10_000, max_bytes=4)
+    await deltas.add("s1", content="ab")
+    await deltas.add("s1", content="cd")  # reaches max_bytes
+    await deltas.add("s1", reasoning_content="x")
+    await deltas.add("s2", content="y")
+    await deltas.flush()
+
+    assert [(step_id, d.content, d.reasoning_content) for step_id, d in emitted.events] == [
+        ("s1", "abcd", None),
+        ("s1", None, "x"),
+        ("s2", "y", None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coalescer_flushes_at_the_deadline_without_another_chunk():
+    emitted = _Recorder()
+    deltas = DeltaCoalescer(emitted, window_ms=20)
+    await deltas.add("s1", content="a")
+    await deltas.add("s1", content="b")
+    assert emitted.events == []
+
+    # The model pauses: nothing else arrives, the window still bounds the delay
+    await asyncio.sleep(0.1)
+    assert [delta.content for _, delta in emitted.events] == ["ab"]
+
+    await deltas.add("s1", content="c")
+    await deltas.aclose()
+    await asyncio.sleep(0.05)
+    assert [delta.content for _, delta in emitted.events] == ["ab", "c"]
+
+
+@pytest.mark.asyncio
+async def test_coalescer_without_window_emits_every_update():
+    emitted = _Recorder()
+    deltas = DeltaCoalescer(emitted)
+    await deltas.add("s1", content="a")
+    await deltas.add("s1", content="b")
+
+    assert [delta.content for _, delta in emitted.events] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_accumulation_scales_linearly():
+    small_chunks, large_chunks = _stream(10_000), _stream(100_000)
+    small, _ = await _accumulate(small_chunks)
+    large, step = await _accumulate(large_chunks)
+
+    assert len(step.content) == 100_000 * len(TOKEN)
+    assert step.tool_calls[0]["function"]["arguments"].endswith('"z": 0}')
+    # 10x the tokens should cost ~10x the time; quadratic joins cost ~100x
+    assert large < small * 30
+
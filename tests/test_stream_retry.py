@@ -0,0 +1,195 @@
+"""
+Tests for stream-level retry: retry before the first chunk, failover, Retry-After.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from openai import APIConnectionError, RateLimitError
+
+from agio.llm.openai import OpenAIModel
+from agio.utils import retry as retry_module
+from agio.utils.retry import StreamAttempts, retry_after_seconds, retry_stream
+
+
+class Flaky(Exception):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(retry_module.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def make_opener(plan):
+    """plan: per-call list of items; an exception instance is raised in place."""
+    calls = []
+
+    def open_stream(model):
+        calls.append(model)
+        items = plan[len(calls) - 1]
+
+        async def gen():
+            for item in items:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+
+        return gen()
+
+    return open_stream, calls
+
+
+async def collect(stream):
+    return [item async for item in stream]
+
+
+@pytest.mark.asyncio
+async def test_retries_failures_before_first_item(no_sleep):
+    open_stream, calls = make_opener([[Flaky()], [Flaky()], ["a", "b"]])
+    attempts = StreamAttempts(model="m")
+
+    items = await collect(
+        retry_stream(open_stream, model="m", exceptions=(Flaky,), attempts=attempts)
+    )
+
+    assert items == ["a", "b"]
+    assert calls == ["m", "m", "m"]
+    assert attempts.retries == 2
+    assert len(no_sleep) == 2
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_after_first_item():
+    open_stream, calls = make_opener([["a", Flaky()], ["never"]])
+
+    received = []
+    with pytest.raises(Flaky):
+        async for item in retry_stream(open_stream, model="m", exceptions=(Flaky,)):
+            received.append(item)
+
+    assert received == ["a"]
+    assert calls == ["m"]
+
+
+@pytest.mark.asyncio
+async def test_consumer_stopping_early_closes_the_stream():
+    closed = []
+
+    def open_stream(model):
+        async def gen():
+            try:
+                for item in ("a", "b", "c"):
+                    yield item
+            finally:
+                closed.append(model)
+
+        return gen()
+
+    stream = retry_stream(open_stream, model="m")
+    assert await anext(stream) == "a"
+    await stream.aclose()
+
+    assert closed == ["m"]
+
+
+@pytest.mark.asyncio
+async def test_fails_over_after_retries_run_out():
+    open_stream, calls = make_opener([[Flaky()], [Flaky()], ["from fallback"]])
+    attempts = StreamAttempts(model="primary")
+
+    items = await collect(
+        retry_stream(
+            open_stream,
+            model="primary",
+            fallback_model="secondary",
+            max_attempts=2,
+            exceptions=(Flaky,),
+            attempts=attempts,
+        )
+    )
+
+    assert items == ["from fallback"]
+    assert calls == ["primary", "primary", "secondary"]
+    assert attempts.failed_over
+    assert attempts.model == "secondary"
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors_propagate():
+    open_stream, calls = make_opener([[ValueError("bad request")]])
+
+    with pytest.raises(ValueError):
+        await collect(retry_stream(open_stream, model="m", exceptions=(Flaky,)))
+    assert calls == ["m"]
+
+
+def test_retry_after_header():
+    def error(headers):
+        return SimpleNamespace(response=SimpleNamespace(headers=headers))
+
+    assert retry_after_seconds(error({"retry-after": "3"})) == 3.0
+    assert retry_after_seconds(error({"retry-after-ms": "250"})) == 0.25
+    assert retry_after_seconds(error({})) is None
+    assert retry_after_seconds(Flaky()) is None
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honored(no_sleep):
+    response = httpx.Response(
+        429,
+        headers={"retry-after": "7"},
+        request=httpx.Request("POST", "https://api.example.com"),
+    )
+    rate_limited = RateLimitError("slow down", response=response, body=None)
+    open_stream, _ = make_opener([[rate_limited], ["ok"]])
+
+    await collect(retry_stream(open_stream, model="m", exceptions=(RateLimitError,)))
+
+    assert no_sleep == [7.0]
+
+
+@pytest.mark.asyncio
+async def test_openai_model_reports_retries_on_first_chunk():
+    model = OpenAIModel(
+        id="openai/gpt-4o",
+        name="gpt-4o",
+        model_name="gpt-4o",
+        api_key="test-key",
+        max_retries=1,
+        fallback_model="gpt-4o-mini",
+    )
+
+    chunk = MagicMock()
+    chunk.usage = None
+    chunk.choices = [MagicMock()]
+    chunk.choices[0].delta.content = "hello"
+    chunk.choices[0].delta.reasoning_content = None
+    chunk.choices[0].delta.tool_calls = None
+    chunk.choices[0].finish_reason = None
+
+    async def stream():
+        yield chunk
+
+    connection_error = APIConnectionError(
+        request=httpx.Request("POST", "https://api.example.com")
+    )
+    model.client.chat.completions.create = AsyncMock(
+        side_effect=[connection_error, stream()]
+    )
+
+    chunks = await collect(model.arun_stream([{"role": "user", "content": "hi"}]))
+
+    assert [c.content for c in chunks] == ["hello"]
+    assert chunks[0].retry_count == 1
+    assert chunks[0].fallback_model == "gpt-4o-mini"
+    models = [call.kwargs["model"] for call in model.client.chat.completions.create.call_args_list]
+    assert models == ["gpt-4o", "gpt-4o-mini"]
@@ -0,0 +1,227 @@
+"""
+Tests for tool result cache backends.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from agio.domain import ToolResult
+from agio.runtime import Wire
+from agio.runtime.protocol import ExecutionContext
+from agio.tools import (
+    BaseTool,
+    InMemoryToolResultCache,
+    TieredToolResultCache,
+    ToolResultCache,
+    ToolResultCacheBackend,
+)
+from agio.tools.executor import ToolExecutor
+from agio.tools.sqlite_cache import SQLiteToolResultCache
+
+
+def _result(content: str = "x") -> ToolResult:
+    now = time.time()
+    return ToolResult(
+        tool_name="fetch",
+        tool_call_id="call_1",
+        input_args={},
+        content=content,
+        output=None,
+        start_time=now,
+        end_time=now,
+        duration=0.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_tool_result_cache_is_the_in_memory_cache():
+    cache = ToolResultCache(ttl_seconds=60)
+    await cache.set("s1", "fetch", {"url": "a"}, _result())
+
+    assert isinstance(cache, InMemoryToolResultCache)
+    assert await cache.get("s1", "fetch", {"url": "a"}) is not None
+
+
+@pytest.mark.asyncio
+async def test_clear_session_only_clears_that_session():
+    cache = InMemoryToolResultCache()
+    await cache.set("s1", "fetch", {"url": "a"}, _result())
+    await cache.set("s1", "fetch", {"url": "b"}, _result())
+    await cache.set("s2", "fetch", {"url": "a"}, _result())
+
+    assert await cache.clear_session("s1") == 2
+
+    assert await cache.get("s1", "fetch", {"url": "a"}) is None
+    assert await cache.get("s2", "fetch", {"url": "a"}) is not None
+    assert cache.stats().entries == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_respects_byte_budget():
+    cache = InMemoryToolResultCache(max_bytes=300)
+    for i in range(3):
+        await cache.set("s1", "fetch", {"url": str(i)}, _result("x" * 100))
+
+    # Touch entry 0 so entry 1 becomes least recently used
+    assert await cache.get("s1", "fetch", {"url": "0"}) is not None
+    await cache.set("s2", "fetch", {"url": "3"}, _result("x" * 100))
+
+    assert await cache.get("s1", "fetch", {"url": "1"}) is None
+    assert await cache.get("s1", "fetch", {"url": "0"}) is not None
+    stats = cache.stats()
+    assert stats.bytes <= 300
+    assert stats.evictions == 1
+
+    # Results larger than the whole budget are never cached
+    await cache.set("s1", "fetch", {"url": "big"}, _result("x" * 1000))
+    assert await cache.get("s1", "fetch", {"url": "big"}) is None
+
+
+@pytest.mark.asyncio
+async def test_ttl_override_and_sweep():
+    cache = InMemoryToolResultCache(ttl_seconds=3600)
+    await cache.set("s1", "fetch", {"url": "a"}, _result(), ttl_seconds=0)
+    await cache.set("s1", "fetch", {"url": "b"}, _result())
+
+    assert await cache.sweep_expired() == 1
+    stats = cache.stats()
+    assert stats.entries == 1
+    assert stats.expirations == 1
+
+
+@pytest.mark.asyncio
+async def test_hit_miss_counters_and_call_id_independent_key():
+    cache = InMemoryToolResultCache()
+    await cache.set("s1", "fetch", {"url": "a", "tool_call_id": "call_1"}, _result())
+
+    assert await cache.get("s1", "fetch", {"url": "a", "tool_call_id": "call_2"}) is not None
+    assert await cache.get("s1", "fetch", {"url": "other"}) is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_background_sweeper_drops_expired_entries():
+    cache = InMemoryToolResultCache(sweep_interval=0.01)
+    await cache.set("s1", "fetch", {"url": "a"}, _result(), ttl_seconds=0)
+
+    cache.start_sweeper()
+    await asyncio.sleep(0.05)
+    await cache.stop_sweeper()
+
+    assert cache.stats().entries == 0
+
+
+class CountingFetchTool(BaseTool):
+    cacheable = True
+    cache_ttl_seconds = 60
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def get_name(self) -> str:
+        return "fetch"
+
+    def get_description(self) -> str:
+        return "Fetch"
+
+    def get_parameters(self) -> dict:
+        return {"type": "object", "properties": {"url": {"type": "string"}}}
+
+    def is_concurrency_safe(self) -> bool:
+        return True
+
+    async def execute(self, parameters: dict, context, abort_signal=None) -> ToolResult:
+        self.calls += 1
+        return _result(f"page {parameters['url']}")
+
+
+@pytest.mark.asyncio
+async def test_executor_reuses_cached_result_across_calls():
+    tool = CountingFetchTool()
+    cache = InMemoryToolResultCache()
+    executor = ToolExecutor([tool], cache=cache)
+    context = ExecutionContext(run_id="r1", session_id="s1", wire=Wire())
+
+    for call_id in ("call_1", "call_2"):
+        result = await executor.execute(
+            {"id": call_id, "function": {"name": "fetch", "arguments": '{"url": "a"}'}},
+            context,
+        )
+        assert result.tool_call_id == call_id
+        assert result.content == "page a"
+
+    assert tool.calls == 1
+    assert tool.get_definition().cache_ttl_seconds == 60
+    entry = next(iter(cache._entries.values()))
+    assert entry.expires_at - entry.created_at == pytest.approx(60, abs=1)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_is_shared_between_instances(tmp_path):
+    db_path = str(tmp_path / "tool_cache.db")
+    worker_a = SQLiteToolResultCache(db_path=db_path)
+    worker_b = SQLiteToolResultCache(db_path=db_path)
+    assert isinstance(worker_a, ToolResultCacheBackend)
+
+    await worker_a.set("s1", "fetch", {"url": "a"}, _result("page " * 1000))
+
+    cached = await worker_b.get("s1", "fetch", {"url": "a"})
+    assert cached.content == "page " * 1000
+    # Values are stored compressed
+    assert worker_a.stats().bytes < len("page " * 1000)
+
+    assert await worker_b.clear_session("s1") == 1
+    assert await worker_a.get("s1", "fetch", {"url": "a"}) is None
+
+    await worker_a.set("s1", "fetch", {"url": "b"}, _result(), ttl_seconds=0)
+    assert await worker_a.get("s1", "fetch", {"url": "b"}) is None
+    assert await worker_a.sweep_expired() == 1
+
+    worker_a.close()
+    worker_b.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_evicts_least_recently_used(tmp_path):
+    cache = SQLiteToolResultCache(db_path=str(tmp_path / "tool_cache.db"), max_bytes=200)
+    for i in range(3):
+        await cache.set("s1", "fetch", {"url": str(i)}, _result(str(i) * 10))
+    await cache.get("s1", "fetch", {"url": "0"})
+    # Each compressed entry is > 100 bytes, so only two entries fit at most
+    await cache.set("s1", "fetch", {"url": "3"}, _result("3" * 10))
+
+    assert await cache.get("s1", "fetch", {"url": "3"}) is not None
+    assert cache.stats().evictions >= 1
+    assert cache.stats().bytes <= 200
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_populates_l1_from_shared_l2(tmp_path):
+    db_path = str(tmp_path / "tool_cache.db")
+    worker_a = TieredToolResultCache(
+        InMemoryToolResultCache(), SQLiteToolResultCache(db_path=db_path)
+    )
+    worker_b = TieredToolResultCache(
+        InMemoryToolResultCache(), SQLiteToolResultCache(db_path=db_path)
+    )
+
+    await worker_a.set("s1", "fetch", {"url": "a"}, _result("page"), ttl_seconds=60)
+
+    # Miss in worker_b's L1, hit in the shared L2, then served from L1
+    assert (await worker_b.get("s1", "fetch", {"url": "a"})).content == "page"
+    entry = await worker_b.l1.get_entry("s1", "fetch", {"url": "a"})
+    assert entry is not None
+    assert entry.expires_at - time.time() <= 60
+
+    stats = worker_b.stats()
+    assert stats.hits == 2
+    assert stats.misses == 0
+
+    worker_a.l2.close()
+    worker_b.l2.close()
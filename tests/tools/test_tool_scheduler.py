@@ -0,0 +1,161 @@
+"""
+Tests for dependency-aware tool scheduling.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from agio.domain import ToolResult
+from agio.runtime import Wire
+from agio.runtime.protocol import ExecutionContext
+from agio.tools import BaseTool
+from agio.tools.executor import ToolExecutor
+from agio.tools.scheduler import plan_tool_calls, resources_overlap
+
+
+class RecordingTool(BaseTool):
+    """Sleeps, then records start/end order; safety is configurable."""
+
+    def __init__(self, name: str, safe: bool, log: list, delay: float = 0.02) -> None:
+        self._name = name
+        self._safe = safe
+        self._log = log
+        self._delay = delay
+        self.active = 0
+        self.max_active = 0
+        super().__init__()
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_description(self) -> str:
+        return self._name
+
+    def get_parameters(self) -> dict:
+        return {"type": "object", "properties": {}}
+
+    def is_concurrency_safe(self) -> bool:
+        return self._safe
+
+    async def execute(self, parameters: dict, context, abort_signal=None) -> ToolResult:
+        call_id = parameters["tool_call_id"]
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self._log.append(("start", call_id))
+        await asyncio.sleep(self._delay)
+        self._log.append(("end", call_id))
+        self.active -= 1
+        now = time.time()
+        return ToolResult(
+            tool_name=self.name,
+            tool_call_id=call_id,
+            input_args=parameters,
+            content=call_id,
+            output=None,
+            start_time=now,
+            end_time=now,
+            duration=0.0,
+        )
+
+
+def _call(call_id: str, name: str, **args) -> dict:
+    return {"id": call_id, "function": {"name": name, "arguments": json.dumps(args)}}
+
+
+@pytest.fixture
+def context():
+    return ExecutionContext(run_id="r1", session_id="s1", wire=Wire())
+
+
+def test_resources_overlap_on_containment():
+    assert resources_overlap("/a/b", "/a/b")
+    assert resources_overlap("/a", "/a/b/c.txt")
+    assert not resources_overlap("/a/b", "/a/bc")
+
+
+def test_plan_serializes_unsafe_calls_per_resource():
+    log: list = []
+    tools = {
+        "read": RecordingTool("read", True, log),
+        "write": RecordingTool("write", False, log),
+        "bash": RecordingTool("bash", False, log),
+        "search": RecordingTool("search", True, log),
+    }
+    calls = [
+        _call("c0", "read", file_path="/w/a.txt"),
+        _call("c1", "write", file_path="/w/a.txt"),
+        _call("c2", "write", file_path="/w/b.txt"),
+        _call("c3", "read", path="/w"),
+        _call("c4", "search", query="x"),
+        _call("c5", "bash", command="ls"),
+    ]
+
+    plan = plan_tool_calls(calls, tools)
+
+    assert [p.depends_on for p in plan] == [[], [0], [], [1, 2], [], [0, 1, 2, 3]]
+    assert [p.depends_on for p in plan_tool_calls(calls, tools, parallel=False)] == [
+        [],
+        [0],
+        [1],
+        [2],
+        [3],
+        [4],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_orders_conflicting_calls_and_preserves_results(context):
+    log: list = []
+    read = RecordingTool("read", True, log, delay=0.05)
+    write = RecordingTool("write", False, log, delay=0.01)
+    executor = ToolExecutor([read, write])
+    calls = [
+        _call("w1", "write", file_path="/w/a.txt"),
+        _call("r1", "read", file_path="/w/a.txt"),
+        _call("r2", "read", file_path="/w/other.txt"),
+        _call("w2", "write", file_path="/w/a.txt"),
+    ]
+
+    results = await executor.execute_batch(calls, context)
+
+    assert [r.tool_call_id for r in results] == ["w1", "r1", "r2", "w2"]
+    order = log
+    assert order.index(("end", "w1")) < order.index(("start", "r1"))
+    assert order.index(("end", "r1")) < order.index(("start", "w2"))
+    # r2 does not conflict with anything and starts right away
+    assert order.index(("start", "r2")) < order.index(("end", "w1"))
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_respects_run_concurrency_limit(context):
+    log: list = []
+    tool = RecordingTool("read", True, log)
+    executor = ToolExecutor([tool])
+    calls = [_call(f"c{i}", "read", file_path=f"/f{i}") for i in range(8)]
+
+    await executor.execute_batch(calls, context, max_concurrency=3)
+    assert tool.max_active == 3
+
+    tool.max_active = 0
+    await executor.execute_batch(calls, context, parallel=False)
+    assert tool.max_active == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_yields_in_completion_order(context):
+    log: list = []
+    slow = RecordingTool("slow", True, log, delay=0.1)
+    fast = RecordingTool("fast", True, log, delay=0.0)
+    executor = ToolExecutor([slow, fast])
+    calls = [_call("s", "slow"), _call("f1", "fast"), _call("f2", "fast")]
+
+    streamed = [
+        (index, result.tool_call_id)
+        async for index, result in executor.execute_stream(calls, context)
+    ]
+
+    assert streamed[-1] == (0, "s")
+    assert sorted(streamed) == [(0, "s"), (1, "f1"), (2, "f2")]